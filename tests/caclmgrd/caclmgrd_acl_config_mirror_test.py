@@ -0,0 +1,143 @@
+import os
+import sys
+
+from swsscommon import swsscommon
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+NUM_BULK_RULES = 5000
+
+
+class CountingConfigDb(MockConfigDb):
+    """
+        Mock Config DB which counts the table reads, each being a Redis round trip
+    """
+    def __init__(self, **kwargs):
+        super(CountingConfigDb, self).__init__(**kwargs)
+        self.table_reads = {}
+
+    def get_table(self, table_name):
+        self.table_reads[table_name] = self.table_reads.get(table_name, 0) + 1
+        return super(CountingConfigDb, self).get_table(table_name)
+
+
+class TestCaclmgrdAclConfigMirror(TestCase):
+    """
+        Test caclmgrd in-memory mirror of the ACL tables
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+        MockConfigDb.set_config_db({
+            "ACL_TABLE": {
+                "SSH_ONLY": {
+                    "stage": "INGRESS",
+                    "type": "CTRLPLANE",
+                    "policy_desc": "SSH_ONLY",
+                    "services": ["SSH"]
+                },
+                "DATA_ACL": {
+                    "stage": "INGRESS",
+                    "type": "L3",
+                    "policy_desc": "DATA_ACL"
+                }
+            },
+            "ACL_RULE": {},
+            "DEVICE_METADATA": {
+                "localhost": {
+                }
+            },
+            "FEATURE": {},
+        })
+
+    def test_raw_to_typed_fvs(self):
+        self.assertEqual(self.caclmgrd.raw_to_typed_fvs([('services@', 'SSH,NTP'), ('type', 'CTRLPLANE')]),
+                         {'services': ['SSH', 'NTP'], 'type': 'CTRLPLANE'})
+        self.assertEqual(self.caclmgrd.raw_to_typed_fvs((('NULL', 'NULL'),)), {})
+
+    @patchfs
+    def test_acl_config_events(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.seed_acl_config_mirror('')
+
+        self.assertTrue(caclmgrd_daemon.handle_acl_config_event(
+            '', 'SSH_ONLY|RULE_1', 'SET', [('PACKET_ACTION', 'ACCEPT'), ('PRIORITY', '10'), ('SRC_IP', '10.0.0.0/8')], '|'))
+        self.assertFalse(caclmgrd_daemon.handle_acl_config_event(
+            '', 'DATA_ACL|RULE_1', 'SET', [('PACKET_ACTION', 'DROP'), ('PRIORITY', '10')], '|'))
+        self.assertTrue(caclmgrd_daemon.handle_acl_config_event(
+            '', 'NTP_ACL', 'SET', [('services@', 'NTP'), ('stage', 'INGRESS'), ('type', 'CTRLPLANE')], '|'))
+
+        tables, rules = caclmgrd_daemon.acl_config_mirror[''].get_tables()
+        self.assertEqual(tables['NTP_ACL'], {'services': ['NTP'], 'stage': 'INGRESS', 'type': 'CTRLPLANE'})
+        self.assertEqual(rules[('SSH_ONLY', 'RULE_1')], {'PACKET_ACTION': 'ACCEPT', 'PRIORITY': '10', 'SRC_IP': '10.0.0.0/8'})
+        self.assertIn(('DATA_ACL', 'RULE_1'), rules)
+
+        self.assertTrue(caclmgrd_daemon.handle_acl_config_event('', 'SSH_ONLY|RULE_1', 'DEL', [], '|'))
+        self.assertTrue(caclmgrd_daemon.handle_acl_config_event('', 'NTP_ACL', 'DEL', [], '|'))
+        tables, rules = caclmgrd_daemon.acl_config_mirror[''].get_tables()
+        self.assertNotIn('NTP_ACL', tables)
+        self.assertNotIn(('SSH_ONLY', 'RULE_1'), rules)
+
+        # Snapshots are not affected by later notifications
+        caclmgrd_daemon.handle_acl_config_event('', 'SSH_ONLY|RULE_2', 'SET', [('PACKET_ACTION', 'DROP'), ('PRIORITY', '5')], '|')
+        self.assertNotIn(('SSH_ONLY', 'RULE_2'), rules)
+
+    @patchfs
+    def test_bulk_load_round_trips(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.update_control_plane_nat_acls = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.get_installed_ruleset_checksum = mock.MagicMock(return_value="checksum")
+        caclmgrd_daemon.get_installed_filter_ruleset = mock.MagicMock(return_value=self.caclmgrd.IptablesRuleset())
+        config_db_connector = CountingConfigDb()
+        caclmgrd_daemon.config_db_map[''] = config_db_connector
+        caclmgrd_daemon.seed_acl_config_mirror('')
+
+        # A 'config load' of N rules delivers N ACL_RULE notifications
+        num_ctrl_plane_events = 0
+        for idx in range(NUM_BULK_RULES):
+            key = 'SSH_ONLY|RULE_{}'.format(idx)
+            fvs = [('PACKET_ACTION', 'ACCEPT'), ('PRIORITY', str(NUM_BULK_RULES + 1 - idx)),
+                   ('SRC_IP', '10.{}.{}.0/24'.format(idx // 256, idx % 256))]
+            MockConfigDb.CONFIG_DB['ACL_RULE'][key] = dict(fvs)
+            if caclmgrd_daemon.handle_acl_config_event('', key, 'SET', fvs, '|'):
+                num_ctrl_plane_events += 1
+        self.assertEqual(num_ctrl_plane_events, NUM_BULK_RULES)
+
+        caclmgrd_daemon.update_control_plane_acls('', config_db_connector)
+
+        # The ACL tables were read once when seeding the mirror, not once per notification or update
+        self.assertEqual(config_db_connector.table_reads.get('ACL_TABLE'), 1)
+        self.assertEqual(config_db_connector.table_reads.get('ACL_RULE'), 1)
+
+        # The rules translated from the mirror are the ones read from Config DB
+        mirror_cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        caclmgrd_daemon.acl_config_mirror.pop('')
+        caclmgrd_daemon.invalidate_applied_ruleset('')
+        caclmgrd_daemon.input_chain.pop('')
+        caclmgrd_daemon.update_control_plane_acls('', config_db_connector)
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_args[0][0], mirror_cmds)
+        self.assertEqual(len([cmd for cmd in mirror_cmds if '22' in cmd and '-s' in cmd]), NUM_BULK_RULES)
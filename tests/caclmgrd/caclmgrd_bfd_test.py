@@ -50,8 +50,8 @@ class TestCaclmgrdBfd(TestCase):
                 mocked_subprocess.Popen.assert_has_calls(test_data["expected_bfd_subprocess_calls"], any_order=True)
                 caclmgrd_daemon.bfdAllowed = True
                 mocked_subprocess.Popen.reset_mock()
-                caclmgrd_daemon.num_changes[''] = 1
-                caclmgrd_daemon.check_and_update_control_plane_acls('', 1)
+                caclmgrd_daemon.schedule_control_plane_acl_update('')
+                caclmgrd_daemon.update_workers[''].apply_pending()
 
                 #Ensure BFD rules are installed before ip2me rules to avoid traffic loss during update of control plane acl rules
                 bfd_ipv4_idx = 0
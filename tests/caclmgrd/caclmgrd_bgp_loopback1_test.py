@@ -46,5 +46,7 @@ class TestCaclmgrdLoopback1Drop(TestCase):
                 mocked_subprocess.call.return_value = call_rc
 
                 caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
-                caclmgrd_daemon.update_control_plane_nat_acls('', {}, MockConfigDb())
-                mocked_subprocess.Popen.assert_has_calls(test_data["expected_subprocess_calls"], any_order=True)
+                iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+                # The DROP rules are inserted last, ahead of all other rules
+                expected_cmds = test_data["expected_iptables_cmds"]
+                self.assertEqual(iptables_cmds[-len(expected_cmds):], expected_cmds)
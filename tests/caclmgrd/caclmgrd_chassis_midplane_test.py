@@ -1,3 +1,4 @@
+import ipaddress
 import os
 import sys
 
@@ -39,7 +40,7 @@ class TestCaclmgrdChassisMidplane(TestCase):
 
         with mock.patch("sonic_py_common.device_info.is_chassis", mock_is_chassis):
             with mock.patch("sonic_py_common.device_info.is_smartswitch", mock_is_smartswitch):
-                with mock.patch("caclmgrd.ControlPlaneAclManager.run_commands_pipe", side_effect=["eth1-midplane", "1.0.0.33", "eth1-midplane", "1.0.0.33"]):
+                with mock.patch("caclmgrd.NetlinkAddressReader.get_addresses", return_value=[("eth1-midplane", ipaddress.ip_interface("1.0.0.33/8"), 0)]):
                         caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
                         config_db_connector = caclmgrd_daemon.config_db_map['']
                         ret = caclmgrd_daemon.generate_allow_internal_chasis_midplane_traffic('', config_db_connector)
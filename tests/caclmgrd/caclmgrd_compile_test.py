@@ -0,0 +1,124 @@
+import filecmp
+import json
+import os
+import re
+import shutil
+import sys
+
+from parameterized import parameterized
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+
+from .test_bfd_vectors import CACLMGRD_BFD_TEST_VECTOR
+from .test_bgp_loopback1_vectors import BGP_LOOPBACK1_TEST_VECTOR
+from .test_dash_ha_vectors import CACLMGRD_DASH_HA_TEST_VECTOR
+from .test_default_rule_vectors import CACLMGRD_DEFAULT_RULE_TEST_VECTOR
+from .test_dhcp_vectors import CACLMGRD_DHCP_TEST_VECTOR
+from .test_external_client_acl_vectors import EXTERNAL_CLIENT_ACL_TEST_VECTOR
+from .test_icmpv6_ct_rule_vectors import CACLMGRD_ICMPV6_CT_RULE_TEST_VECTOR
+from .test_incremental_update_vectors import make_scale_config_db
+from .test_ip2me_vectors import CACLMGRD_IP2ME_TEST_VECTOR
+from .test_scale_vectors import CACLMGRD_SCALE_TEST_VECTOR, CACLMGRD_PORT_RANGE_SCALE_TEST_VECTOR
+from .test_soc_rules_vectors import CACLMGRD_SOC_TEST_VECTOR, CACLMGRD_SOC_TEST_VECTOR_EMPTY
+from .test_vxlan_vectors import CACLMGRD_VXLAN_TEST_VECTOR
+
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+output_path = os.path.join(test_path, "output")
+sample_output_path = os.path.join(test_path, "sample_output")
+
+# The Config DBs of the caclmgrd test vectors, by golden file directory name.
+# The incremental update vectors are left out for the size of their rulesets.
+COMPILE_TEST_VECTOR = []
+for vector_prefix, test_vector in [
+        ("bfd", CACLMGRD_BFD_TEST_VECTOR),
+        ("bgp_loopback1", BGP_LOOPBACK1_TEST_VECTOR),
+        ("dash_ha", CACLMGRD_DASH_HA_TEST_VECTOR),
+        ("default_rule", CACLMGRD_DEFAULT_RULE_TEST_VECTOR),
+        ("dhcp", CACLMGRD_DHCP_TEST_VECTOR),
+        ("external_client", EXTERNAL_CLIENT_ACL_TEST_VECTOR),
+        ("icmpv6_ct_rule", CACLMGRD_ICMPV6_CT_RULE_TEST_VECTOR),
+        ("ip2me", CACLMGRD_IP2ME_TEST_VECTOR),
+        ("scale", CACLMGRD_SCALE_TEST_VECTOR),
+        ("port_range_scale", CACLMGRD_PORT_RANGE_SCALE_TEST_VECTOR),
+        ("soc", CACLMGRD_SOC_TEST_VECTOR),
+        ("soc_empty", CACLMGRD_SOC_TEST_VECTOR_EMPTY),
+        ("vxlan", CACLMGRD_VXLAN_TEST_VECTOR)]:
+    for test_name, test_data in test_vector:
+        if "config_db" in test_data:
+            golden_name = vector_prefix + "_" + re.sub(r"[^A-Za-z0-9]+", "_", test_name).strip("_")
+            COMPILE_TEST_VECTOR.append([golden_name, test_data["config_db"]])
+
+
+class TestCaclmgrdCompile(TestCase):
+    """
+        Test caclmgrd offline compilation of config_db.json files
+    """
+    def setUp(self):
+        modules_path = os.path.dirname(os.path.dirname(test_path))
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+    def compile(self, test_name, config_db, namespace='', docker_mgmt_ip='', docker_mgmt_ipv6='',
+                counters_interval_secs=0):
+        op_path = os.path.join(output_path, test_name)
+        shutil.rmtree(op_path, ignore_errors=True)
+        os.makedirs(op_path)
+        config_db_path = os.path.join(op_path, "config_db.json")
+        with open(config_db_path, "w") as config_db_file:
+            json.dump(config_db, config_db_file)
+
+        rule_counts = self.caclmgrd.compile_config_db(config_db_path, namespace, os.path.join(op_path, "compiled"),
+                                                      docker_mgmt_ip, docker_mgmt_ipv6, counters_interval_secs)
+        return op_path, rule_counts
+
+    def assert_golden(self, test_name, op_path):
+        sop_path = os.path.join(sample_output_path, test_name)
+        compiled_path = os.path.join(op_path, "compiled")
+        self.assertEqual(sorted(os.listdir(compiled_path)), sorted(os.listdir(sop_path)))
+        for file_name in os.listdir(sop_path):
+            self.assertTrue(filecmp.cmp(os.path.join(compiled_path, file_name), os.path.join(sop_path, file_name), shallow=False),
+                            "{} differs from its golden file".format(file_name))
+
+    @parameterized.expand(COMPILE_TEST_VECTOR)
+    def test_compile_golden(self, test_name, config_db):
+        op_path, rule_counts = self.compile(test_name, config_db)
+        self.assert_golden(test_name, op_path)
+        self.assertGreater(rule_counts["iptables.filter.rules"], 0)
+
+    def test_compile_namespace(self):
+        config_db = CACLMGRD_SCALE_TEST_VECTOR[0][1]["config_db"]
+        op_path, _ = self.compile("namespace_asic0", config_db, "asic0", "240.127.1.2", "fd00::2")
+        self.assert_golden("namespace_asic0", op_path)
+
+    def test_compile_counters(self):
+        config_db = make_scale_config_db(num_rules=2)
+        op_path, _ = self.compile("counters", config_db)
+        with open(os.path.join(op_path, "compiled", "iptables.filter.rules")) as rules_file:
+            self.assertNotIn("-m comment", rules_file.read())
+
+        # The counter comments the daemon applies when it collects the counters
+        op_path, _ = self.compile("counters", config_db, counters_interval_secs=10)
+        with open(os.path.join(op_path, "compiled", "iptables.filter.rules")) as rules_file:
+            self.assertIn('--dport 22 -m comment --comment SSH_ONLY|DEFAULT_RULE -j DROP', rules_file.read())
+
+    def test_compiler_run_commands(self):
+        compiler = self.caclmgrd.ControlPlaneAclCompiler("caclmgrd", {})
+        failed_cmds = []
+        self.assertEqual(compiler.run_commands([["iptables", "-S"]], failed_cmds), "")
+        self.assertEqual(failed_cmds, [])
+
+    def test_compile_cli(self):
+        op_path, _ = self.compile("cli", CACLMGRD_SCALE_TEST_VECTOR[0][1]["config_db"])
+        out_path = os.path.join(op_path, "cli")
+        argv = ["caclmgrd", "--compile", os.path.join(op_path, "config_db.json"), "--out", out_path]
+        with mock.patch.object(sys, "argv", argv), mock.patch("builtins.print") as mocked_print:
+            self.caclmgrd.main()
+        self.assertEqual(sorted(os.listdir(out_path)), sorted(os.listdir(os.path.join(op_path, "compiled"))))
+        self.assertTrue(mocked_print.call_args_list[-1][0][0].startswith("Compiled "))
+
+        argv = ["caclmgrd", "--compile", os.path.join(op_path, "config_db.json"), "--namespace", "asic0"]
+        with mock.patch.object(sys, "argv", argv), self.assertRaises(SystemExit):
+            self.caclmgrd.main()
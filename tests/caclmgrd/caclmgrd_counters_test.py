@@ -0,0 +1,245 @@
+import os
+import sys
+
+from swsscommon import swsscommon
+from parameterized import parameterized
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_counters_vectors import CACLMGRD_COUNTERS_TEST_VECTOR, EXTERNAL_CLIENT_CONFIG_DB, IPTABLES_SAVE_COUNTERS
+from .test_incremental_update_vectors import make_scale_config_db
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+class FakeCountersTable(object):
+    """
+        Buffered COUNTERS_DB table which only writes its entries on flush
+    """
+    def __init__(self):
+        self.data = {}
+        self.pending = []
+        self.num_flushes = 0
+
+    def set(self, key, fvs):
+        self.pending.append((key, dict(fvs)))
+
+    def _del(self, key):
+        self.pending.append((key, None))
+
+    def flush(self):
+        for key, fvs in self.pending:
+            if fvs is None:
+                self.data.pop(key, None)
+            else:
+                self.data[key] = fvs
+        self.pending = []
+        self.num_flushes += 1
+
+
+class TestCaclmgrdCounters(TestCase):
+    """
+        Test caclmgrd ACL rule counters
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+    def make_daemon(self, ipset_available=False, num_rules=2):
+        MockConfigDb.set_config_db(make_scale_config_db(num_rules=num_rules))
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd", counters_interval_secs=10)
+        caclmgrd_daemon.ipset_available = ipset_available
+        return caclmgrd_daemon
+
+    def get_rule_comments(self, iptables_cmds):
+        return [cmd[cmd.index('--comment') + 1] for cmd in iptables_cmds if '--comment' in cmd]
+
+    @patchfs
+    def test_rule_comments(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        caclmgrd_daemon = self.make_daemon()
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        self.assertIn(['iptables', '-A', 'INPUT', '-p', 'tcp', '-s', '10.0.1.0/24', '--dport', '22',
+                       '-m', 'comment', '--comment', 'SSH_ONLY|RULE_1', '-j', 'ACCEPT'], iptables_cmds)
+        self.assertEqual(self.get_rule_comments(iptables_cmds), ['SSH_ONLY|RULE_0', 'SSH_ONLY|RULE_1', 'SSH_ONLY|DEFAULT_RULE'])
+        self.assertEqual(caclmgrd_daemon.counted_acl_rules[''], {
+            'SSH_ONLY|RULE_0': {'SSH_ONLY|RULE_0'},
+            'SSH_ONLY|RULE_1': {'SSH_ONLY|RULE_1'},
+            'SSH_ONLY|DEFAULT_RULE': {'SSH_ONLY|DEFAULT_RULE'},
+        })
+
+        # Rules merged into an ipset rule are commented with the run and counted under each rule
+        caclmgrd_daemon = self.make_daemon(ipset_available=True)
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        run_comment, default_comment = self.get_rule_comments(iptables_cmds)
+        self.assertTrue(run_comment.startswith('SSH_ONLY|RUN_'))
+        self.assertEqual(default_comment, 'SSH_ONLY|DEFAULT_RULE')
+        self.assertEqual(caclmgrd_daemon.counted_acl_rules[''], {
+            run_comment: {'SSH_ONLY|RULE_0', 'SSH_ONLY|RULE_1'},
+            'SSH_ONLY|DEFAULT_RULE': {'SSH_ONLY|DEFAULT_RULE'},
+        })
+
+        # Without counters the rules are not commented
+        caclmgrd_daemon.counters_interval_secs = 0
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        self.assertEqual(self.get_rule_comments(iptables_cmds), [])
+
+    @patchfs
+    def test_merged_rule_counters(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        caclmgrd_daemon = self.make_daemon(ipset_available=True, num_rules=3)
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        run_comment = self.get_rule_comments(iptables_cmds)[0]
+        caclmgrd_daemon.run_commands = lambda commands: {
+            'iptables-save': '[4:240] -A CTRLPLANE_ACL_G1 -p tcp -m comment --comment "{}" -j ACCEPT\n'.format(run_comment),
+            'ip6tables-save': '',
+        }[commands[0][0]]
+
+        collector = caclmgrd_daemon.counter_collector
+        table = FakeCountersTable()
+        collector.get_counters_table = mock.MagicMock(return_value=table)
+        collector.collect_and_publish()
+        self.assertEqual(table.data, {
+            'SSH_ONLY|RULE_0': {"Packets": "4", "Bytes": "240"},
+            'SSH_ONLY|RULE_1': {"Packets": "4", "Bytes": "240"},
+            'SSH_ONLY|RULE_2': {"Packets": "4", "Bytes": "240"},
+            'SSH_ONLY|DEFAULT_RULE': {"Packets": "0", "Bytes": "0"},
+        })
+
+        # Removing the first rule of the run keeps the comment of the run's rule
+        config_db = make_scale_config_db(num_rules=3)
+        del config_db["ACL_RULE"]["SSH_ONLY|RULE_0"]
+        MockConfigDb.set_config_db(config_db)
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        self.assertEqual(self.get_rule_comments(iptables_cmds)[0], run_comment)
+        collector.collect_and_publish()
+        self.assertEqual(sorted(table.data), ['SSH_ONLY|DEFAULT_RULE', 'SSH_ONLY|RULE_1', 'SSH_ONLY|RULE_2'])
+        self.assertEqual(table.data['SSH_ONLY|RULE_1'], {"Packets": "4", "Bytes": "240"})
+
+    @patchfs
+    def test_external_client_rule_comments(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        # Rules merged by their destination ports are counted under each rule
+        caclmgrd_daemon = self.make_daemon()
+        MockConfigDb.set_config_db(EXTERNAL_CLIENT_CONFIG_DB)
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        run_comment, default_comment = self.get_rule_comments(iptables_cmds)
+        self.assertTrue(run_comment.startswith('EXTERNAL_CLIENT_ACL|RUN_'))
+        self.assertEqual(caclmgrd_daemon.counted_acl_rules[''], {
+            run_comment: {'EXTERNAL_CLIENT_ACL|RULE_1', 'EXTERNAL_CLIENT_ACL|RULE_2'},
+            'EXTERNAL_CLIENT_ACL|DEFAULT_RULE': {'EXTERNAL_CLIENT_ACL|DEFAULT_RULE'},
+        })
+
+    @patchfs
+    def test_long_rule_comments(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        # Comments of rules named past the length iptables allows are truncated
+        caclmgrd_daemon = self.make_daemon()
+        config_db = make_scale_config_db(num_rules=2)
+        long_rule_names = ['SSH_ONLY|' + 'R' * 300 + '_{}'.format(idx) for idx in range(2)]
+        for idx, rule_name in enumerate(long_rule_names):
+            config_db["ACL_RULE"][rule_name] = config_db["ACL_RULE"].pop("SSH_ONLY|RULE_{}".format(idx))
+        MockConfigDb.set_config_db(config_db)
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        comments = self.get_rule_comments(iptables_cmds)
+        self.assertEqual([len(comment) for comment in comments], [255, 255, len('SSH_ONLY|DEFAULT_RULE')])
+        self.assertNotEqual(comments[0], comments[1])
+        self.assertEqual([caclmgrd_daemon.counted_acl_rules[''][comment] for comment in comments[:2]],
+                         [{rule_name} for rule_name in long_rule_names])
+
+        # Their counters are published under the full rule names
+        caclmgrd_daemon.run_commands = lambda commands: {
+            'iptables-save': '[4:240] -A CTRLPLANE_ACL_G1 -p tcp -m comment --comment "{}" -j ACCEPT\n'.format(comments[1]),
+            'ip6tables-save': '',
+        }[commands[0][0]]
+        collector = caclmgrd_daemon.counter_collector
+        table = FakeCountersTable()
+        collector.get_counters_table = mock.MagicMock(return_value=table)
+        collector.collect_and_publish()
+        self.assertEqual(table.data[long_rule_names[1]], {"Packets": "4", "Bytes": "240"})
+        self.assertEqual(table.data[long_rule_names[0]], {"Packets": "0", "Bytes": "0"})
+
+    @parameterized.expand(CACLMGRD_COUNTERS_TEST_VECTOR)
+    @patchfs
+    def test_collect_and_publish(self, test_name, test_data, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+
+        saved_tables = []
+        def run_commands(commands):
+            saved_tables.append(commands[0])
+            return test_data["iptables_save"][commands[0][0]]
+        caclmgrd_daemon.run_commands = run_commands
+
+        collector = caclmgrd_daemon.counter_collector
+        table = FakeCountersTable()
+        collector.get_counters_table = mock.MagicMock(return_value=table)
+        collector.collect_and_publish()
+
+        self.assertEqual(saved_tables, [['ip6tables-save', '-c', '-t', 'filter'], ['iptables-save', '-c', '-t', 'filter']])
+        self.assertEqual(table.num_flushes, 1)
+        self.assertEqual(table.data, {
+            rule_name: {"Packets": str(packets), "Bytes": str(num_bytes)}
+            for rule_name, (packets, num_bytes) in test_data["expected_counters"].items()
+        })
+
+    @patchfs
+    def test_publish_removes_deleted_rules(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        caclmgrd_daemon.run_commands = lambda commands: IPTABLES_SAVE_COUNTERS[commands[0][0]]
+
+        collector = caclmgrd_daemon.counter_collector
+        table = FakeCountersTable()
+        collector.get_counters_table = mock.MagicMock(return_value=table)
+        collector.collect_and_publish()
+        self.assertIn('SSH_ONLY|RULE_1', table.data)
+
+        config_db = make_scale_config_db(num_rules=1)
+        MockConfigDb.set_config_db(config_db)
+        caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        collector.collect_and_publish()
+        self.assertEqual(table.num_flushes, 2)
+        self.assertEqual(sorted(table.data), ['SSH_ONLY|DEFAULT_RULE', 'SSH_ONLY|RULE_0'])
+
+    def test_publish_failure_is_logged(self):
+        collector = self.caclmgrd.AclCounterCollector(mock.MagicMock(config_db_map={'': None}), 10)
+        collector.collect = mock.MagicMock(side_effect=OSError("iptables-save failed"))
+        collector.collect_and_publish()
+        collector.acl_manager.log_warning.assert_called_once()
+
+    def test_parse_iptables_save_counters(self):
+        self.assertEqual(self.caclmgrd.parse_iptables_save_counters(IPTABLES_SAVE_COUNTERS["iptables-save"]), {
+            'SSH_ONLY|RULE_0': (12, 720),
+            'SSH_ONLY|RULE_1': (3, 180),
+            'SSH_ONLY|DEFAULT_RULE': (75, 4500),
+            'not a caclmgrd rule': (0, 0),
+        })
+        self.assertEqual(self.caclmgrd.parse_iptables_save_counters(""), {})
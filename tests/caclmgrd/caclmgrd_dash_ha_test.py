@@ -61,7 +61,7 @@ class TestCaclmgrdDashHa(TestCase):
                 
                 caclmgrd_daemon.update_dash_ha_rules('', "dpu0", "SET", test_data["input_add"])
                 mocked_subprocess.Popen.reset_mock()
-                caclmgrd_daemon.num_changes[''] = 1
-                caclmgrd_daemon.check_and_update_control_plane_acls('', 1)
-                mocked_subprocess.Popen.assert_has_calls(test_data["expected_add_subprocess_calls"], any_order=True)
+                caclmgrd_daemon.schedule_control_plane_acl_update('')
+                caclmgrd_daemon.update_workers[''].apply_pending()
+                mocked_subprocess.Popen.assert_has_calls(test_data["expected_apply_subprocess_calls"], any_order=True)
 
@@ -40,15 +40,97 @@ class TestCaclmgrdDhcp(TestCase):
                 popen_mock.configure_mock(**popen_attrs)
                 mocked_subprocess.Popen.return_value = popen_mock
 
-                call_rc = test_data["call_rc"]
-                mocked_subprocess.call.return_value = call_rc
-
                 mark = test_data["mark"]
 
                 caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+                caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+                caclmgrd_daemon.dhcp_chain.reset_installed_rules('')
                 mux_update = test_data["mux_update"]
 
+                if test_data["rule_installed"]:
+                    for key, data in mux_update:
+                        caclmgrd_daemon.dhcp_chain.insert_rule(key, mark)
+                    caclmgrd_daemon.dhcp_chain.set_installed([''])
+
                 for key,data in mux_update:
                     caclmgrd_daemon.update_dhcp_acl(key, '', data, mark)
+                caclmgrd_daemon.apply_dhcp_chain_updates(force=True)
+
+                mocked_subprocess.call.assert_not_called()
+                if test_data["expected_commands"]:
+                    caclmgrd_daemon.run_commands_batch.assert_called_once_with(test_data["expected_commands"])
+                else:
+                    caclmgrd_daemon.run_commands_batch.assert_not_called()
+
+    @patchfs
+    def test_caclmgrd_dhcp_mark_change(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(CACLMGRD_DHCP_TEST_VECTOR[0][1]["config_db"])
+
+        with mock.patch("caclmgrd.ControlPlaneAclManager.run_commands_pipe", return_value='sonic'):
+            caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+            caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+            caclmgrd_daemon.update_dhcp_acl("Ethernet4", '', {"state": "standby"}, None)
+            caclmgrd_daemon.apply_dhcp_chain_updates(force=True)
+
+            # Only the rule of a port whose DHCP packets are dropped follows its mark
+            caclmgrd_daemon.update_dhcp_acl_for_mark_change("Ethernet4", None, "0x67004")
+            caclmgrd_daemon.update_dhcp_acl_for_mark_change("Ethernet8", None, "0x67008")
+            caclmgrd_daemon.apply_dhcp_chain_updates(force=True)
+            caclmgrd_daemon.run_commands_batch.assert_called_with([
+                ['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP'],
+                ['iptables', '--insert', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP'],
+            ])
+
+    @patchfs
+    def test_caclmgrd_dhcp_mux_flips_coalesced(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(CACLMGRD_DHCP_TEST_VECTOR[0][1]["config_db"])
+
+        with mock.patch("caclmgrd.ControlPlaneAclManager.run_commands_pipe", return_value='sonic'):
+            with mock.patch("caclmgrd.subprocess") as mocked_subprocess:
+                caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+
+        now = [0.0]
+        caclmgrd_daemon.dhcp_chain = self.caclmgrd.DhcpChain(0.05, 0.5, clock=lambda: now[0])
+        caclmgrd_daemon.config_db_map["asic0"] = MockConfigDb()
+        caclmgrd_daemon.iptables_cmd_ns_prefix["asic0"] = ["ip", "netns", "exec", "asic0"]
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+
+        # A switchover flipping 512 mux cables in 1ms steps, the main loop
+        # applying whatever is due after each notification
+        num_ports = 64
+        for flip in range(512):
+            port = "Ethernet{}".format(4 * (flip % num_ports))
+            state = "active" if (flip // num_ports) % 2 == 0 else "standby"
+            mark = "0x{:x}".format(0x67000 + flip % num_ports) if flip % num_ports < num_ports // 2 else None
+            caclmgrd_daemon.update_dhcp_acl(port, '', {"state": state}, mark)
+            now[0] += 0.001
+            caclmgrd_daemon.apply_dhcp_chain_updates()
+        now[0] += 1
+        caclmgrd_daemon.apply_dhcp_chain_updates()
+
+        # One batch at most per max latency window, plus the trailing one
+        self.assertLessEqual(caclmgrd_daemon.run_commands_batch.call_count, 3)
+        mocked_subprocess.call.assert_not_called()
 
-                mocked_subprocess.call.assert_has_calls(test_data["expected_subprocess_calls"], any_order=False)
+        # Both namespaces end up with the same rules, applied as the mux
+        # cable states were replayed
+        installed_rules = {}
+        for call_args in caclmgrd_daemon.run_commands_batch.call_args_list:
+            for cmd in call_args[0][0]:
+                namespace = cmd[3] if cmd[0] == "ip" else ''
+                split_cmd = self.caclmgrd.split_iptables_command(cmd)
+                match = tuple(split_cmd[3][2:-2])
+                if split_cmd[3][0] == '--insert':
+                    installed_rules.setdefault(namespace, set()).add(match)
+                else:
+                    installed_rules[namespace].remove(match)
+        self.assertEqual(installed_rules[''], installed_rules["asic0"])
+        self.assertEqual(installed_rules[''], caclmgrd_daemon.dhcp_chain.rules)
+        self.assertEqual(len(installed_rules['']), num_ports)
+        self.assertIsNone(caclmgrd_daemon.dhcp_chain.get_wait_time(now[0]))
@@ -0,0 +1,237 @@
+import copy
+import os
+import sys
+
+from swsscommon import swsscommon
+from parameterized import parameterized
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_incremental_update_vectors import CACLMGRD_INCREMENTAL_UPDATE_TEST_VECTOR, make_scale_config_db
+from tests.common.mock_configdb import MockConfigDb, MockDBConnector
+from tests.common.mock_iptables import MockIptables
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+class TestCaclmgrdIncrementalUpdate(TestCase):
+    """
+        Test caclmgrd incremental control plane ACL updates
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+    def translate(self, caclmgrd_daemon):
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        return self.caclmgrd.IptablesRuleset.from_commands(iptables_cmds)
+
+    def test_ruleset_from_commands(self):
+        ruleset = self.caclmgrd.IptablesRuleset.from_commands([
+            ['iptables', '-P', 'INPUT', 'ACCEPT'],
+            ['iptables', '-F', 'INPUT'],
+            ['iptables', '-A', 'INPUT', '-j', 'DROP'],
+            ['iptables', '-I', 'INPUT', '1', '-s', '127.0.0.1', '-j', 'ACCEPT'],
+            ['iptables', '-I', 'INPUT', '2', '-p', 'udp', '-j', 'ACCEPT'],
+            ['iptables', '-D', 'INPUT', '-p', 'udp', '-j', 'ACCEPT'],
+            ['ip6tables', '-t', 'raw', '-F'],
+            ['ip6tables', '-t', 'raw', '-A', 'PREROUTING', '-p', 'ipv6-icmp', '-j', 'NOTRACK'],
+            ['iptables', '-N', 'CUSTOM'],
+            ['iptables', '-X', 'CUSTOM'],
+        ])
+        self.assertTrue(ruleset.complete)
+        self.assertEqual(ruleset.chains, {
+            ('iptables', 'filter'): {'INPUT': [('-s', '127.0.0.1', '-j', 'ACCEPT'), ('-j', 'DROP')]},
+            ('ip6tables', 'raw'): {'PREROUTING': [('-p', 'ipv6-icmp', '-j', 'NOTRACK')]},
+        })
+        self.assertEqual(ruleset.policies, {('iptables', 'filter', 'INPUT'): 'ACCEPT'})
+        self.assertEqual(ruleset.num_rules(), 3)
+
+        self.assertFalse(self.caclmgrd.IptablesRuleset.from_commands([['iptables', '-Z']]).complete)
+
+    def test_ruleset_diff_chains(self):
+        installed = self.caclmgrd.IptablesRuleset.from_commands([
+            ['iptables', '-A', 'INPUT', '-j', 'OLD'],
+            ['iptables', '-N', 'OLD'],
+            ['iptables', '-A', 'OLD', '-j', 'ACCEPT'],
+            ['ip6tables', '-t', 'raw', '-A', 'OUTPUT', '-j', 'NOTRACK'],
+        ])
+        desired = self.caclmgrd.IptablesRuleset.from_commands([
+            ['iptables', '-P', 'INPUT', 'ACCEPT'],
+            ['iptables', '-N', 'NEW'],
+            ['iptables', '-A', 'NEW', '-j', 'ACCEPT'],
+            ['iptables', '-A', 'INPUT', '-j', 'NEW'],
+        ])
+        delta = desired.diff(installed, ['ip', 'netns', 'exec', 'asic0'])
+        self.assertEqual(delta, [
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-P', 'INPUT', 'ACCEPT'],
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-R', 'INPUT', '1', '-j', 'NEW'],
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-N', 'NEW'],
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-I', 'NEW', '1', '-j', 'ACCEPT'],
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-F', 'OLD'],
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-X', 'OLD'],
+            ['ip', 'netns', 'exec', 'asic0', 'ip6tables', '-t', 'raw', '-F', 'OUTPUT'],
+        ])
+
+        # Applying the delta to the installed ruleset yields the desired one
+        for cmd in delta:
+            installed.apply_command(cmd)
+        self.assertEqual(installed.chains[('iptables', 'filter')], desired.chains[('iptables', 'filter')])
+
+    @parameterized.expand(CACLMGRD_INCREMENTAL_UPDATE_TEST_VECTOR)
+    @patchfs
+    def test_single_rule_edit_delta(self, test_name, test_data, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = copy.deepcopy(test_data["config_db"])
+        MockConfigDb.set_config_db(config_db)
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        installed = self.translate(caclmgrd_daemon)
+        self.assertGreater(installed.num_rules(), 10000)
+
+        config_db["ACL_RULE"].update(copy.deepcopy(test_data["changes"]))
+        for key in test_data["removed"]:
+            config_db["ACL_RULE"].pop(key)
+        desired = self.translate(caclmgrd_daemon)
+
+        delta = desired.diff(installed, [])
+        self.assertEqual(delta, test_data["expected_delta"])
+
+        for cmd in delta:
+            installed.apply_command(cmd)
+        self.assertEqual(installed.chains, desired.chains)
+
+    @patchfs
+    def test_update_control_plane_acls_incremental(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=10)
+        MockConfigDb.set_config_db(config_db)
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.update_control_plane_nat_acls = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.get_installed_ruleset_checksum = mock.MagicMock(return_value="checksum")
+        caclmgrd_daemon.get_installed_filter_ruleset = mock.MagicMock(return_value=self.caclmgrd.IptablesRuleset())
+
+        # The first update always rebuilds everything
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        full_cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        self.assertIn(['iptables', '-I', 'INPUT', '1', '-j', 'CTRLPLANE_ACL_G1'], full_cmds)
+        self.assertNotIn(['iptables', '-F', 'INPUT'], full_cmds)
+        self.assertEqual(caclmgrd_daemon.installed_checksum[''], "checksum")
+
+        # A rule change only issues the delta, in the active generation chain
+        config_db["ACL_RULE"]["SSH_ONLY|RULE_3"]["PACKET_ACTION"] = "DROP"
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_args[0][0], [
+            ['iptables', '-R', 'CTRLPLANE_ACL_G1', '11', '-p', 'tcp', '-s', '10.0.3.0/24', '--dport', '22', '-j', 'DROP']
+        ])
+
+        # No change issues no commands
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_args[0][0], [])
+
+        # An explicit request rebuilds everything
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb(), full_rebuild=True)
+        self.assertEqual(len(caclmgrd_daemon.run_commands_batch.call_args[0][0]), len(full_cmds))
+
+        # Drift of the installed rules rebuilds everything
+        caclmgrd_daemon.get_installed_ruleset_checksum.return_value = "drifted"
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(len(caclmgrd_daemon.run_commands_batch.call_args[0][0]), len(full_cmds))
+        self.assertEqual(caclmgrd_daemon.installed_checksum[''], "drifted")
+
+        # Rules changed outside of the update path rebuild everything
+        caclmgrd_daemon.invalidate_applied_ruleset('')
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(len(caclmgrd_daemon.run_commands_batch.call_args[0][0]), len(full_cmds))
+
+    @patchfs
+    def test_update_control_plane_acls_dualtor(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=10)
+        config_db["DEVICE_METADATA"]["localhost"]["subtype"] = "DualToR"
+        config_db["LOOPBACK_INTERFACE"] = {
+            "Loopback1|10.1.0.10/32": {},
+            "Loopback1|10.1.0.12/32": {},
+            "Loopback1|FC00:1:0:10::/128": {},
+        }
+        MockConfigDb.set_config_db(config_db)
+        kernel = MockIptables(self.caclmgrd.IptablesRuleset)
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.state_db_map[''] = MockDBConnector('STATE_DB', 0)
+        caclmgrd_daemon.ipset_available = False
+        caclmgrd_daemon.run_commands = kernel.run_commands
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(side_effect=kernel.run_commands_batch)
+        caclmgrd_daemon.log_warning = mock.MagicMock()
+
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        # The Loopback1 BGP DROP rules lead the generation chain
+        self.assertEqual(kernel.get_chains('iptables', 'filter')['CTRLPLANE_ACL_G1'][:2], [
+            ('-d', '10.1.0.12', '-p', 'tcp', '--dport', '179', '-j', 'DROP'),
+            ('-d', '10.1.0.10', '-p', 'tcp', '--dport', '179', '-j', 'DROP'),
+        ])
+        self.assertEqual(kernel.get_chains('ip6tables', 'filter')['CTRLPLANE_ACL_G1'][:1], [
+            ('-d', 'fc00:1:0:10::', '-p', 'tcp', '--dport', '179', '-j', 'DROP'),
+        ])
+
+        # Later updates go on incrementally, taking the Loopback1 rules into account
+        config_db["ACL_RULE"]["SSH_ONLY|RULE_3"]["PACKET_ACTION"] = "DROP"
+        caclmgrd_daemon.run_commands_batch.reset_mock()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_args_list[0][0][0], [
+            ['iptables', '-R', 'CTRLPLANE_ACL_G1', '14', '-p', 'tcp', '-s', '10.0.3.0/24', '--dport', '22', '-j', 'DROP']
+        ])
+        caclmgrd_daemon.run_commands_batch.reset_mock()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_args_list[0][0][0], [])
+        for warning in caclmgrd_daemon.log_warning.call_args_list:
+            self.assertNotIn("drifted", warning[0][0])
+
+        # The installed chain is the ruleset a full rebuild would install
+        desired = self.translate(caclmgrd_daemon)
+        self.assertEqual(kernel.get_chains('iptables', 'filter')['CTRLPLANE_ACL_G1'],
+                         desired.chains[('iptables', 'filter')]['INPUT'])
+
+    def test_installed_ruleset_checksum(self):
+        iptables_save_output = """# Generated by iptables-save v1.8.7 on Mon Jan  1 00:00:00 2024
+*raw
+:PREROUTING ACCEPT [100:2000]
+:OUTPUT ACCEPT [100:2000]
+COMMIT
+*filter
+:INPUT ACCEPT [5:300]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [5:300]
+:DHCP - [0:0]
+[10:600] -A INPUT -s 127.0.0.1/32 -i lo -j ACCEPT
+-A INPUT -p udp -m udp --dport 67 -j DHCP
+-A DHCP -m physdev --physdev-in Ethernet4 -j DROP
+COMMIT
+"""
+        lines = self.caclmgrd.canonicalize_iptables_save(iptables_save_output, ["filter"], ["DHCP"])
+        self.assertEqual(lines, [
+            "*filter",
+            ":INPUT ACCEPT",
+            ":FORWARD ACCEPT",
+            ":OUTPUT ACCEPT",
+            "-A INPUT -s 127.0.0.1/32 -i lo -j ACCEPT",
+            "-A INPUT -p udp -m udp --dport 67 -j DHCP",
+            "COMMIT",
+        ])
@@ -0,0 +1,243 @@
+import copy
+import os
+import sys
+
+from swsscommon import swsscommon
+from parameterized import parameterized
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_default_rule_vectors import CACLMGRD_DEFAULT_RULE_TEST_VECTOR
+from .test_external_client_acl_vectors import EXTERNAL_CLIENT_ACL_TEST_VECTOR
+from .test_incremental_update_vectors import make_scale_config_db
+from .test_ip2me_vectors import CACLMGRD_IP2ME_TEST_VECTOR
+from .test_scale_vectors import CACLMGRD_SCALE_TEST_VECTOR
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+class TestCaclmgrdIpset(TestCase):
+    """
+        Test caclmgrd ipset compilation of ACL source prefixes
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+    def expand_ipsets(self, iptables_cmds, ipsets):
+        """
+        Expand every run of rules matching an ipset back into the rules for
+        each member, in the order the members were added to the set
+        """
+        expanded_cmds = []
+        idx = 0
+        while idx < len(iptables_cmds):
+            cmd = iptables_cmds[idx]
+            if '--match-set' not in cmd:
+                expanded_cmds.append(cmd)
+                idx += 1
+                continue
+            set_name = cmd[cmd.index('--match-set') + 1]
+            set_cmds = []
+            while idx < len(iptables_cmds) and '--match-set' in iptables_cmds[idx] and \
+                    iptables_cmds[idx][iptables_cmds[idx].index('--match-set') + 1] == set_name:
+                set_cmds.append(iptables_cmds[idx])
+                idx += 1
+            for member in ipsets[set_name][1]:
+                for set_cmd in set_cmds:
+                    pos = set_cmd.index('--match-set')
+                    self.assertEqual(set_cmd[pos - 2:pos], ['-m', 'set'])
+                    self.assertEqual(set_cmd[pos + 2], 'src')
+                    expanded_cmds.append(set_cmd[:pos - 2] + ['-s', member] + set_cmd[pos + 3:])
+        return expanded_cmds
+
+    @parameterized.expand(EXTERNAL_CLIENT_ACL_TEST_VECTOR + CACLMGRD_DEFAULT_RULE_TEST_VECTOR +
+                          CACLMGRD_IP2ME_TEST_VECTOR + CACLMGRD_SCALE_TEST_VECTOR)
+    @patchfs
+    def test_ipset_compilation_matches_legacy(self, test_name, test_data, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(test_data["config_db"])
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+
+        caclmgrd_daemon.ipset_available = False
+        legacy_cmds, legacy_source_map = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.desired_ipsets[''], {})
+
+        caclmgrd_daemon.ipset_available = True
+        compiled_cmds, compiled_source_map = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        ipsets = caclmgrd_daemon.desired_ipsets['']
+
+        self.assertEqual(self.expand_ipsets(compiled_cmds, ipsets), legacy_cmds)
+        self.assertEqual(compiled_source_map, legacy_source_map)
+        for set_name, (family, members) in ipsets.items():
+            self.assertLessEqual(len(set_name), 31)
+            self.assertTrue(set_name.startswith(self.caclmgrd.IPSET_NAME_PREFIX))
+            self.assertIn(family, ['inet', 'inet6'])
+            self.assertGreaterEqual(len(members), 2)
+
+    @patchfs
+    def test_ipset_groups_only_consecutive_rules(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=0)
+        config_db["ACL_RULE"] = {
+            "SSH_ONLY|RULE_1": {"PACKET_ACTION": "ACCEPT", "PRIORITY": "9", "SRC_IP": "10.0.0.0/8"},
+            "SSH_ONLY|RULE_2": {"PACKET_ACTION": "ACCEPT", "PRIORITY": "8", "SRC_IP": "20.0.0.0/8"},
+            "SSH_ONLY|RULE_3": {"PACKET_ACTION": "DROP", "PRIORITY": "7", "SRC_IP": "30.0.0.0/8"},
+            "SSH_ONLY|RULE_4": {"PACKET_ACTION": "ACCEPT", "PRIORITY": "6", "SRC_IP": "30.1.0.0/16"},
+            "SSH_ONLY|RULE_5": {"PACKET_ACTION": "ACCEPT", "PRIORITY": "5", "SRC_IP": "0.0.0.0/0"},
+        }
+        MockConfigDb.set_config_db(config_db)
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.ipset_available = True
+
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        ipsets = caclmgrd_daemon.desired_ipsets['']
+        self.assertEqual(list(ipsets.values()), [('inet', ['10.0.0.0/8', '20.0.0.0/8'])])
+        set_name = list(ipsets.keys())[0]
+
+        acl_cmds = [cmd for cmd in iptables_cmds if '--dport' in cmd and '22' in cmd]
+        self.assertEqual(acl_cmds, [
+            ['iptables', '-A', 'INPUT', '-p', 'tcp', '-m', 'set', '--match-set', set_name, 'src', '--dport', '22', '-j', 'ACCEPT'],
+            ['iptables', '-A', 'INPUT', '-p', 'tcp', '-s', '30.0.0.0/8', '--dport', '22', '-j', 'DROP'],
+            ['iptables', '-A', 'INPUT', '-p', 'tcp', '-s', '30.1.0.0/16', '--dport', '22', '-j', 'ACCEPT'],
+            ['iptables', '-A', 'INPUT', '-p', 'tcp', '-s', '0.0.0.0/0', '--dport', '22', '-j', 'ACCEPT'],
+        ])
+
+    @patchfs
+    def test_ipset_membership_change(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=100)
+        MockConfigDb.set_config_db(config_db)
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.ipset_available = True
+        caclmgrd_daemon.run_commands = mock.MagicMock(return_value="CACL4_stale\nother_set")
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.update_control_plane_nat_acls = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.get_installed_ruleset_checksum = mock.MagicMock(return_value="checksum")
+        caclmgrd_daemon.get_installed_filter_ruleset = mock.MagicMock(return_value=self.caclmgrd.IptablesRuleset())
+
+        # The first update creates the set and destroys stale ones after the rules are in place
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        set_name = list(caclmgrd_daemon.desired_ipsets[''].keys())[0]
+        self.assertEqual(cmds[0], ['ipset', 'create', set_name, 'hash:net', 'family', 'inet', '-exist'])
+        self.assertEqual(cmds[1], ['ipset', 'flush', set_name])
+        self.assertEqual(len([cmd for cmd in cmds if cmd[:2] == ['ipset', 'add']]), 100)
+        self.assertEqual(cmds[-1], ['ipset', 'destroy', 'CACL4_stale'])
+        caclmgrd_daemon.run_commands.assert_called_once_with([['ipset', 'list', '-n']])
+        self.assertEqual(len([cmd for cmd in cmds if cmd[0] == 'iptables' and '-A' in cmd and '22' in cmd]), 2)
+
+        # Adding and removing prefixes in the run only touches the set
+        config_db["ACL_RULE"]["SSH_ONLY|RULE_NEW"] = {"PACKET_ACTION": "ACCEPT", "PRIORITY": "500", "SRC_IP": "192.168.0.0/24"}
+        config_db["ACL_RULE"].pop("SSH_ONLY|RULE_7")
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_args[0][0], [
+            ['ipset', 'add', set_name, '192.168.0.0/24', '-exist'],
+            ['ipset', 'del', set_name, '10.0.7.0/24', '-exist'],
+        ])
+
+        # Dropping the whole run destroys the set after the rule is deleted
+        config_db["ACL_RULE"] = copy.deepcopy(make_scale_config_db(num_rules=1)["ACL_RULE"])
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        self.assertEqual(cmds[0][:3], ['iptables', '-R', 'CTRLPLANE_ACL_G1'])
+        self.assertEqual(cmds[-1], ['ipset', 'destroy', set_name])
+
+    @patchfs
+    def test_ipset_names_follow_run_signature(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=0)
+        config_db["ACL_RULE"] = {
+            "SSH_ONLY|RULE_1": {"PACKET_ACTION": "ACCEPT", "PRIORITY": "9", "SRC_IP": "10.0.0.0/8"},
+            "SSH_ONLY|RULE_2": {"PACKET_ACTION": "ACCEPT", "PRIORITY": "8", "SRC_IP": "20.0.0.0/8"},
+            "SSH_ONLY|RULE_3": {"PACKET_ACTION": "ACCEPT", "PRIORITY": "7", "SRC_IP": "25.0.0.0/8"},
+            "SSH_ONLY|RULE_4": {"PACKET_ACTION": "DROP", "PRIORITY": "6", "SRC_IP": "30.0.0.0/8"},
+            "SSH_ONLY|RULE_5": {"PACKET_ACTION": "DROP", "PRIORITY": "5", "SRC_IP": "40.0.0.0/8"},
+        }
+        MockConfigDb.set_config_db(config_db)
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.ipset_available = True
+        caclmgrd_daemon.run_commands = mock.MagicMock(return_value="")
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.update_control_plane_nat_acls = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.get_installed_ruleset_checksum = mock.MagicMock(return_value="checksum")
+        caclmgrd_daemon.get_installed_filter_ruleset = mock.MagicMock(return_value=self.caclmgrd.IptablesRuleset())
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        accept_set, drop_set = list(caclmgrd_daemon.desired_ipsets[''].keys())
+
+        # A run with other matches inserted ahead keeps the names of the sets behind it
+        config_db["ACL_RULE"].update({
+            "SSH_ONLY|RULE_6": {"PACKET_ACTION": "DROP", "PRIORITY": "11", "SRC_IP": "50.0.0.0/8", "DST_IP": "10.1.0.1/32"},
+            "SSH_ONLY|RULE_7": {"PACKET_ACTION": "DROP", "PRIORITY": "10", "SRC_IP": "60.0.0.0/8", "DST_IP": "10.1.0.1/32"},
+        })
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        ipsets = caclmgrd_daemon.desired_ipsets['']
+        self.assertEqual(ipsets[accept_set], ('inet', ['10.0.0.0/8', '20.0.0.0/8', '25.0.0.0/8']))
+        self.assertEqual(ipsets[drop_set], ('inet', ['30.0.0.0/8', '40.0.0.0/8']))
+        new_set = [set_name for set_name in ipsets if set_name not in (accept_set, drop_set)][0]
+
+        # The new set exists before the rule using it is inserted
+        cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        self.assertEqual(cmds[0], ['ipset', 'create', new_set, 'hash:net', 'family', 'inet', '-exist'])
+        self.assertEqual([cmd for cmd in cmds if cmd[0] == 'iptables'], [
+            ['iptables', '-I', 'CTRLPLANE_ACL_G1', '12', '-p', 'tcp', '-m', 'set', '--match-set', new_set, 'src',
+             '-d', '10.1.0.1/32', '--dport', '22', '-j', 'DROP'],
+        ])
+
+        # A prefix moving to the next run is added to its new set before the
+        # rules change and removed from its old set after, without touching the rules
+        config_db["ACL_RULE"]["SSH_ONLY|RULE_3"]["PACKET_ACTION"] = "DROP"
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_args[0][0], [
+            ['ipset', 'add', drop_set, '25.0.0.0/8', '-exist'],
+            ['ipset', 'del', accept_set, '25.0.0.0/8', '-exist'],
+        ])
+
+    @patchfs
+    def test_run_commands_batch_ipset_restore(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db({"DEVICE_METADATA": {"localhost": {}}, "FEATURE": {}})
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.run_ipset_restore = mock.MagicMock(return_value=True)
+        caclmgrd_daemon.run_iptables_restore = mock.MagicMock(return_value=True)
+        caclmgrd_daemon.iptables_restore_path = {'iptables': '/sbin/iptables-restore', 'ip6tables': '/sbin/ip6tables-restore'}
+        caclmgrd_daemon.run_commands = mock.MagicMock()
+
+        caclmgrd_daemon.run_commands_batch([
+            ['ip', 'netns', 'exec', 'asic0', 'ipset', 'create', 'CACL4_a', 'hash:net', 'family', 'inet', '-exist'],
+            ['ip', 'netns', 'exec', 'asic0', 'ipset', 'add', 'CACL4_a', '10.0.0.0/8', '-exist'],
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-A', 'INPUT', '-m', 'set', '--match-set', 'CACL4_a', 'src', '-j', 'ACCEPT'],
+            ['ip', 'netns', 'exec', 'asic0', 'ipset', 'destroy', 'CACL4_b'],
+        ])
+
+        self.assertEqual(caclmgrd_daemon.run_ipset_restore.call_args_list, [
+            mock.call(['ip', 'netns', 'exec', 'asic0'], "create CACL4_a hash:net family inet -exist\nadd CACL4_a 10.0.0.0/8 -exist\n"),
+            mock.call(['ip', 'netns', 'exec', 'asic0'], "destroy CACL4_b\n"),
+        ])
+        caclmgrd_daemon.run_iptables_restore.assert_called_once_with(
+            ['ip', 'netns', 'exec', 'asic0'], 'iptables', 'filter',
+            "*filter\n-A INPUT -m set --match-set CACL4_a src -j ACCEPT\nCOMMIT\n")
+        caclmgrd_daemon.run_commands.assert_not_called()
@@ -0,0 +1,160 @@
+import os
+import shlex
+import subprocess
+import sys
+
+from swsscommon import swsscommon
+from parameterized import parameterized
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_default_rule_vectors import CACLMGRD_DEFAULT_RULE_TEST_VECTOR
+from .test_external_client_acl_vectors import EXTERNAL_CLIENT_ACL_TEST_VECTOR
+from .test_ip2me_vectors import CACLMGRD_IP2ME_TEST_VECTOR
+from .test_scale_vectors import CACLMGRD_SCALE_TEST_VECTOR
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+def parse_restore_payload(payload):
+    """
+    Parse an iptables-restore payload back into its table name and the
+    argument list of every rule line
+    """
+    lines = payload.splitlines()
+    assert lines[0].startswith('*')
+    assert lines[-1] == 'COMMIT'
+    return lines[0][1:], [shlex.split(line) for line in lines[1:-1]]
+
+
+class TestCaclmgrdIptablesRestore(TestCase):
+    """
+        Test caclmgrd iptables-restore batch backend
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+    @parameterized.expand(EXTERNAL_CLIENT_ACL_TEST_VECTOR + CACLMGRD_DEFAULT_RULE_TEST_VECTOR +
+                          CACLMGRD_IP2ME_TEST_VECTOR + CACLMGRD_SCALE_TEST_VECTOR)
+    @patchfs
+    def test_restore_payload_matches_commands(self, test_name, test_data, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(test_data["config_db"])
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        payloads = self.caclmgrd.build_iptables_restore_payloads(iptables_cmds)
+
+        # Every command ends up in exactly one payload
+        self.assertEqual(sum(len(group_cmds) for _, _, _, _, group_cmds in payloads), len(iptables_cmds))
+
+        for ns_prefix, binary, table, payload, group_cmds in payloads:
+            payload_table, payload_rules = parse_restore_payload(payload)
+            self.assertEqual(payload_table, table)
+            self.assertEqual(ns_prefix, [])
+
+            # The rules of each table are identical to, and in the same order as, the commands they replace
+            expected_rules = [self.caclmgrd.split_iptables_command(cmd)[3] for cmd in iptables_cmds
+                              if self.caclmgrd.split_iptables_command(cmd)[1:3] == (binary, table)]
+            self.assertEqual(payload_rules, expected_rules)
+            for rule in payload_rules:
+                self.assertNotIn('-t', rule)
+
+    def test_restore_payload_namespace_and_table(self):
+        cmds = [
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-t', 'nat', '-F'],
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-A', 'INPUT', '-j', 'ACCEPT'],
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-t', 'nat', '-A', 'PREROUTING', '-p', 'tcp', '--dport', '22', '-j', 'DNAT', '--to-destination', '1.1.1.1'],
+            ['ip6tables', '-A', 'INPUT', '-m', 'comment', '--comment', 'SSH ONLY', '-j', 'ACCEPT'],
+        ]
+        payloads = self.caclmgrd.build_iptables_restore_payloads(cmds)
+        self.assertEqual([(p[0], p[1], p[2]) for p in payloads], [
+            (['ip', 'netns', 'exec', 'asic0'], 'iptables', 'nat'),
+            (['ip', 'netns', 'exec', 'asic0'], 'iptables', 'filter'),
+            ([], 'ip6tables', 'filter'),
+        ])
+        self.assertEqual(payloads[0][3], "*nat\n-F\n-A PREROUTING -p tcp --dport 22 -j DNAT --to-destination 1.1.1.1\nCOMMIT\n")
+        self.assertEqual(parse_restore_payload(payloads[2][3])[1], [['-A', 'INPUT', '-m', 'comment', '--comment', 'SSH ONLY', '-j', 'ACCEPT']])
+
+    @patchfs
+    def test_run_commands_batch_uses_restore(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db({"DEVICE_METADATA": {"localhost": {}}, "FEATURE": {}})
+        with mock.patch("caclmgrd.ControlPlaneAclManager.run_commands_pipe", return_value='sonic'):
+            with mock.patch("caclmgrd.subprocess") as mocked_subprocess:
+                popen_mock = mock.Mock()
+                popen_mock.configure_mock(**{'communicate.return_value': ('', ''), 'returncode': 0})
+                mocked_subprocess.Popen.return_value = popen_mock
+                mocked_subprocess.PIPE = -1
+
+                caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+                caclmgrd_daemon.iptables_restore_path = {'iptables': '/sbin/iptables-restore', 'ip6tables': '/sbin/ip6tables-restore'}
+                failed_cmds = caclmgrd_daemon.run_commands_batch([
+                    ['ip', 'netns', 'exec', 'asic0', 'iptables', '-F', 'INPUT'],
+                    ['ip6tables', '-A', 'INPUT', '-j', 'DROP'],
+                    ['ip', 'netns', 'exec', 'asic0', 'iptables', '-A', 'INPUT', '-j', 'DROP'],
+                ])
+                self.assertEqual(failed_cmds, [])
+
+                mocked_subprocess.Popen.assert_has_calls([
+                    mock.call(['ip', 'netns', 'exec', 'asic0', 'iptables-restore', '--noflush'], universal_newlines=True,
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE),
+                    mock.call().communicate("*filter\n-F INPUT\n-A INPUT -j DROP\nCOMMIT\n"),
+                    mock.call(['ip6tables-restore', '--noflush'], universal_newlines=True,
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE),
+                    mock.call().communicate("*filter\n-A INPUT -j DROP\nCOMMIT\n"),
+                ])
+                self.assertEqual(mocked_subprocess.Popen.call_count, 2)
+
+    @patchfs
+    def test_run_commands_batch_fallback(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db({"DEVICE_METADATA": {"localhost": {}}, "FEATURE": {}})
+        with mock.patch("caclmgrd.ControlPlaneAclManager.run_commands_pipe", return_value='sonic'):
+            with mock.patch("caclmgrd.subprocess") as mocked_subprocess:
+                popen_mock = mock.Mock()
+                popen_mock.configure_mock(**{'communicate.return_value': ('', 'error'), 'returncode': 1})
+                mocked_subprocess.Popen.return_value = popen_mock
+                mocked_subprocess.PIPE = -1
+
+                cmds = [
+                    ['iptables', '-F', 'INPUT'],
+                    ['ip6tables', '-A', 'INPUT', '-j', 'DROP'],
+                ]
+                caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+
+                # iptables-restore is not installed in the fake filesystem, the failing commands are reported
+                self.assertEqual(caclmgrd_daemon.run_commands_batch(cmds), cmds)
+                self.assertEqual(mocked_subprocess.Popen.call_args_list, [
+                    mock.call(cmd, universal_newlines=True, stdout=subprocess.PIPE) for cmd in cmds
+                ])
+
+                # iptables-restore is installed but the transaction fails
+                mocked_subprocess.Popen.reset_mock()
+                caclmgrd_daemon.iptables_restore_path = {'iptables': '/sbin/iptables-restore', 'ip6tables': None}
+                self.assertEqual(caclmgrd_daemon.run_commands_batch(cmds), cmds)
+                self.assertEqual(mocked_subprocess.Popen.call_args_list, [
+                    mock.call(['iptables-restore', '--noflush'], universal_newlines=True,
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE),
+                    mock.call(cmds[0], universal_newlines=True, stdout=subprocess.PIPE),
+                    mock.call(cmds[1], universal_newlines=True, stdout=subprocess.PIPE),
+                ])
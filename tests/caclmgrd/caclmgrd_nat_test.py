@@ -0,0 +1,184 @@
+import os
+import sys
+
+from swsscommon import swsscommon
+from parameterized import parameterized
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+NAMESPACE = 'asic0'
+NS_PREFIX = ['ip', 'netns', 'exec', NAMESPACE]
+
+
+def make_source_ip_map(num_snmp_prefixes, num_ssh_prefixes):
+    return {
+        "SNMP": {
+            "ipv4": set("10.{}.{}.0/24".format(idx // 256, idx % 256) for idx in range(num_snmp_prefixes)),
+            "ipv6": set("fc00:{:x}::/64".format(idx) for idx in range(num_snmp_prefixes)),
+        },
+        "SSH": {
+            "ipv4": set("20.{}.{}.0/24".format(idx // 256, idx % 256) for idx in range(num_ssh_prefixes)),
+            "ipv6": set(),
+        },
+    }
+
+
+class TestCaclmgrdNat(TestCase):
+    """
+        Test caclmgrd multi-ASIC namespace to host NAT rules
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+        self.docker_mgmt_ip = {NAMESPACE: ('240.127.1.2', 'fd00::2')}
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(
+            side_effect=lambda prefix, namespace: self.docker_mgmt_ip[namespace][0] if namespace else '240.127.1.1')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(
+            side_effect=lambda prefix, namespace: self.docker_mgmt_ip[namespace][1] if namespace else 'fd00::1')
+
+    def make_daemon(self, ipset_available=True):
+        MockConfigDb.set_config_db({"DEVICE_METADATA": {"localhost": {}}, "FEATURE": {}})
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.update_docker_mgmt_ip_acl(NAMESPACE)
+        caclmgrd_daemon.ipset_available = ipset_available
+        caclmgrd_daemon.run_commands = mock.MagicMock(return_value="")
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+        return caclmgrd_daemon
+
+    def get_expected_coverage(self, caclmgrd_daemon, source_ip_map):
+        """
+        The (binary, chain, protocol, source, port, target) tuples matched by
+        the rules of every combination of service, protocol, port and source
+        """
+        coverage = set()
+        for acl_service, service_props in caclmgrd_daemon.ACL_SERVICES.items():
+            if not service_props["multi_asic_ns_to_host_fwd"]:
+                continue
+            for binary, family_key, default_prefix, dnat_ip, snat_ip in (
+                    ('iptables', 'ipv4', '0.0.0.0/0', '240.127.1.1', self.docker_mgmt_ip[NAMESPACE][0]),
+                    ('ip6tables', 'ipv6', '::/0', 'fd00::1', self.docker_mgmt_ip[NAMESPACE][1])):
+                src_prefixes = source_ip_map.get(acl_service, {}).get(family_key) or {default_prefix}
+                for ip_protocol in service_props["ip_protocols"]:
+                    for dst_port in service_props["dst_ports"]:
+                        for src_prefix in src_prefixes:
+                            coverage.add((binary, 'PREROUTING', ip_protocol, src_prefix, int(dst_port), dnat_ip))
+                            coverage.add((binary, 'POSTROUTING', ip_protocol, src_prefix, int(dst_port), snat_ip))
+        return coverage
+
+    def get_rule_coverage(self, caclmgrd_daemon, nat_cmds):
+        """
+        Expand the NAT rules into the tuples they match, resolving ipsets and
+        port ranges and lists
+        """
+        ipsets = caclmgrd_daemon.desired_nat_ipsets[NAMESPACE]
+        coverage = set()
+        for cmd in nat_cmds:
+            _, binary, table, args = self.caclmgrd.split_iptables_command(cmd)
+            self.assertEqual(table, 'nat')
+            if args[0] != '-A':
+                continue
+            src_prefixes = ports = None
+            for idx, arg in enumerate(args):
+                if arg == '-s':
+                    src_prefixes = [args[idx + 1]]
+                elif arg == '--match-set':
+                    src_prefixes = ipsets[args[idx + 1]][1]
+                elif arg == '--dport':
+                    port_range = [int(port) for port in args[idx + 1].split(':')]
+                    ports = range(port_range[0], port_range[-1] + 1)
+                elif arg == '--dports':
+                    ports = [int(port) for port in args[idx + 1].split(',')]
+            for src_prefix in src_prefixes:
+                for port in ports:
+                    coverage.add((binary, args[1], args[args.index('-p') + 1], src_prefix, port, args[-1]))
+        return coverage
+
+    @parameterized.expand([
+        ("default_sources", 0, 0),
+        ("single_prefix", 1, 1),
+        ("same_size_sets", 10, 10),
+        ("large_sets", 200, 50),
+    ])
+    def test_nat_coverage(self, test_name, num_snmp_prefixes, num_ssh_prefixes):
+        caclmgrd_daemon = self.make_daemon()
+        source_ip_map = make_source_ip_map(num_snmp_prefixes, num_ssh_prefixes)
+        nat_cmds = caclmgrd_daemon.generate_fwd_traffic_from_namespace_to_host_commands(NAMESPACE, source_ip_map)
+
+        self.assertEqual(nat_cmds[:4], [
+            NS_PREFIX + ['iptables', '-t', 'nat', '-X'],
+            NS_PREFIX + ['iptables', '-t', 'nat', '-F'],
+            NS_PREFIX + ['ip6tables', '-t', 'nat', '-X'],
+            NS_PREFIX + ['ip6tables', '-t', 'nat', '-F'],
+        ])
+        self.assertEqual(self.get_rule_coverage(caclmgrd_daemon, nat_cmds),
+                         self.get_expected_coverage(caclmgrd_daemon, source_ip_map))
+
+        # SNMP tcp/udp and SSH tcp, DNAT and SNAT, per IP version: the number
+        # of rules does not depend on the number of prefixes
+        num_rules = len([cmd for cmd in nat_cmds if '-A' in cmd])
+        if num_snmp_prefixes == num_ssh_prefixes == 0:
+            # Both services share the default source prefixes and one multiport rule for tcp
+            self.assertEqual(num_rules, 2 * 2 * 2)
+        else:
+            self.assertEqual(num_rules, (2 + 1) * 2 * 2)
+
+    def test_nat_without_ipset(self):
+        caclmgrd_daemon = self.make_daemon(ipset_available=False)
+        source_ip_map = make_source_ip_map(5, 3)
+        nat_cmds = caclmgrd_daemon.generate_fwd_traffic_from_namespace_to_host_commands(NAMESPACE, source_ip_map)
+        self.assertEqual(caclmgrd_daemon.desired_nat_ipsets[NAMESPACE], {})
+        self.assertEqual(self.get_rule_coverage(caclmgrd_daemon, nat_cmds),
+                         self.get_expected_coverage(caclmgrd_daemon, source_ip_map))
+
+    @patchfs
+    def test_nat_regenerated_on_change_only(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        caclmgrd_daemon = self.make_daemon()
+        source_ip_map = make_source_ip_map(4, 0)
+        caclmgrd_daemon.update_control_plane_nat_acls(NAMESPACE, source_ip_map, MockConfigDb())
+        cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        set_names = [name for name, (family, _) in caclmgrd_daemon.desired_nat_ipsets[NAMESPACE].items()]
+        self.assertEqual(len(set_names), 2)
+        self.assertEqual(cmds[0], NS_PREFIX + ['ipset', 'create', set_names[0], 'hash:net', 'family', 'inet', '-exist'])
+        # Stale sets of a previous run are destroyed once the NAT rules are flushed
+        caclmgrd_daemon.run_commands.assert_called_once_with([NS_PREFIX + ['ipset', 'list', '-n']])
+
+        # Nothing changed
+        caclmgrd_daemon.update_control_plane_nat_acls(NAMESPACE, make_source_ip_map(4, 0), MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_count, 1)
+
+        # A new source prefix only updates the set membership besides the rebuild
+        source_ip_map["SNMP"]["ipv4"].add("192.168.0.0/16")
+        caclmgrd_daemon.update_control_plane_nat_acls(NAMESPACE, source_ip_map, MockConfigDb())
+        cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        self.assertEqual([cmd for cmd in cmds if 'ipset' in cmd],
+                         [NS_PREFIX + ['ipset', 'add', set_names[0], '192.168.0.0/16', '-exist']])
+
+        # The docker address of the namespace changed
+        self.docker_mgmt_ip[NAMESPACE] = ('240.127.1.3', 'fd00::3')
+        caclmgrd_daemon.update_control_plane_nat_acls(NAMESPACE, source_ip_map, MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_count, 3)
+        cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        self.assertIn(NS_PREFIX + ['iptables', '-t', 'nat', '-A', 'POSTROUTING', '-p', 'udp', '-m', 'set', '--match-set',
+                                   set_names[0], 'src', '--dport', '161', '-j', 'SNAT', '--to-source', '240.127.1.3'], cmds)
+
+        # Back to the default sources, the sets go after the rules using them
+        caclmgrd_daemon.update_control_plane_nat_acls(NAMESPACE, {}, MockConfigDb())
+        cmds = caclmgrd_daemon.run_commands_batch.call_args[0][0]
+        self.assertEqual(cmds[-2:], [NS_PREFIX + ['ipset', 'destroy', set_name] for set_name in set_names])
+        self.assertEqual(caclmgrd_daemon.run_commands.call_count, 1)
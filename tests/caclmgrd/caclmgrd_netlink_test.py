@@ -0,0 +1,141 @@
+import ipaddress
+import os
+import sys
+
+from swsscommon import swsscommon
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_netlink_vectors import (NETLINK_GETLINK_DUMP, NETLINK_GETADDR_DUMP, NETLINK_NEWADDR_NOTIFICATION,
+                                   NETLINK_DELADDR_NOTIFICATION, NETLINK_EXPECTED_LINKS, NETLINK_EXPECTED_ADDRESSES,
+                                   IPTABLES_SAVE_FILTER, IPTABLES_SAVE_FILTER_EXPECTED)
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+class FakeNetlinkSocket(object):
+    """
+        NETLINK_ROUTE socket replaying captured dumps and notifications
+    """
+    def __init__(self, caclmgrd, groups):
+        self.caclmgrd = caclmgrd
+        self.groups = groups
+        self.pending = []
+        self.closed = False
+
+    def send(self, request):
+        msg_type = self.caclmgrd.struct.unpack_from(self.caclmgrd.NLMSGHDR_FORMAT, request)[1]
+        self.pending.append({self.caclmgrd.RTM_GETLINK: NETLINK_GETLINK_DUMP,
+                             self.caclmgrd.RTM_GETADDR: NETLINK_GETADDR_DUMP}[msg_type])
+
+    def recv(self, size, flags=0):
+        if not self.pending:
+            raise BlockingIOError()
+        return self.pending.pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+class TestCaclmgrdNetlink(TestCase):
+    """
+        Test caclmgrd netlink address reader and iptables-save parser
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+    def make_reader(self):
+        reader = self.caclmgrd.NetlinkAddressReader()
+        self.sockets = []
+
+        def open_socket(namespace, groups=0):
+            sock = FakeNetlinkSocket(self.caclmgrd, groups)
+            self.sockets.append((namespace, sock))
+            return sock
+
+        reader.open_socket = open_socket
+        return reader
+
+    def test_parse_netlink_dumps(self):
+        links = self.caclmgrd.parse_netlink_links(NETLINK_GETLINK_DUMP)
+        self.assertEqual(links, NETLINK_EXPECTED_LINKS)
+
+        addresses = self.caclmgrd.parse_netlink_addresses(NETLINK_GETADDR_DUMP, links)
+        self.assertEqual([(name, str(address), scope) for name, address, scope in addresses], NETLINK_EXPECTED_ADDRESSES)
+
+        self.assertTrue(self.caclmgrd.has_address_change(NETLINK_NEWADDR_NOTIFICATION))
+        self.assertTrue(self.caclmgrd.has_address_change(NETLINK_DELADDR_NOTIFICATION))
+        self.assertFalse(self.caclmgrd.has_address_change(NETLINK_GETLINK_DUMP))
+
+        # A truncated buffer yields the complete messages only
+        self.assertEqual(self.caclmgrd.parse_netlink_addresses(NETLINK_GETADDR_DUMP[:100], links),
+                         addresses[:1])
+
+    def test_address_cache_invalidation(self):
+        reader = self.make_reader()
+        addresses = reader.get_addresses('asic0')
+        self.assertEqual(len(addresses), len(NETLINK_EXPECTED_ADDRESSES))
+        # The subscription is opened before the dump, which closes its socket
+        (monitor_ns, monitor), (dump_ns, dump_sock) = self.sockets
+        self.assertEqual((monitor_ns, dump_ns), ('asic0', 'asic0'))
+        self.assertEqual(monitor.groups, self.caclmgrd.RTMGRP_IPV4_IFADDR | self.caclmgrd.RTMGRP_IPV6_IFADDR)
+        self.assertTrue(dump_sock.closed)
+
+        # Cached as long as no address changes
+        self.assertIs(reader.get_addresses('asic0'), addresses)
+        self.assertEqual(len(self.sockets), 2)
+
+        # Read again after an address change notification
+        monitor.pending.append(NETLINK_NEWADDR_NOTIFICATION)
+        self.assertIsNot(reader.get_addresses('asic0'), addresses)
+        self.assertEqual(len(self.sockets), 3)
+
+        # Other notifications keep the cache
+        addresses = reader.get_addresses('asic0')
+        monitor.pending.append(NETLINK_GETLINK_DUMP)
+        self.assertIs(reader.get_addresses('asic0'), addresses)
+
+        reader.invalidate('asic0')
+        self.assertIsNot(reader.get_addresses('asic0'), addresses)
+
+    @patchfs
+    def test_namespace_mgmt_ip(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+        MockConfigDb.set_config_db({"DEVICE_METADATA": {"localhost": {}}, "FEATURE": {}})
+
+        with mock.patch("caclmgrd.NetlinkAddressReader.get_addresses", return_value=[]):
+            caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.address_reader = self.make_reader()
+
+        # eth0 of an ASIC namespace, whose link-local IPv6 address is skipped
+        self.assertEqual(caclmgrd_daemon.get_namespace_mgmt_ip(['ip', 'netns', 'exec', 'asic0'], 'asic0'), '192.0.2.2')
+        self.assertEqual(caclmgrd_daemon.get_namespace_mgmt_ipv6(['ip', 'netns', 'exec', 'asic0'], 'asic0'), 'fd00::2')
+        # The host namespace of the capture has no docker0 nor midplane interface
+        self.assertEqual(caclmgrd_daemon.get_namespace_mgmt_ip([], ''), '')
+        self.assertEqual(caclmgrd_daemon.get_chassis_midplane_interface_ip(), ('', ''))
+        # Each namespace was dumped once
+        self.assertEqual(sorted(set(namespace for namespace, _ in self.sockets)), ['', 'asic0'])
+        self.assertEqual(len(self.sockets), 4)
+
+        # Failures to read the addresses are logged
+        caclmgrd_daemon.address_reader.get_addresses = mock.MagicMock(side_effect=FileNotFoundError())
+        caclmgrd_daemon.log_error = mock.MagicMock()
+        self.assertEqual(caclmgrd_daemon.get_namespace_mgmt_ip(['ip', 'netns', 'exec', 'asic9'], 'asic9'), '')
+        caclmgrd_daemon.log_error.assert_called_once()
+
+    def test_parse_iptables_save(self):
+        tables = self.caclmgrd.parse_iptables_save(IPTABLES_SAVE_FILTER)
+        self.assertEqual(list(tables), ["filter"])
+        self.assertEqual(list(tables["filter"]), list(IPTABLES_SAVE_FILTER_EXPECTED))
+        self.assertEqual(tables["filter"], IPTABLES_SAVE_FILTER_EXPECTED)
+        self.assertEqual(self.caclmgrd.parse_iptables_save(""), {})
@@ -0,0 +1,83 @@
+import os
+import sys
+
+from swsscommon import swsscommon
+from parameterized import parameterized
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_rate_limit_vectors import CACLMGRD_RATE_LIMIT_TEST_VECTOR, make_rate_limit_config_db
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+class TestCaclmgrdRateLimit(TestCase):
+    """
+        Test caclmgrd control plane rate policies
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+    @parameterized.expand(CACLMGRD_RATE_LIMIT_TEST_VECTOR)
+    @patchfs
+    def test_caclmgrd_rate_limit(self, test_name, test_data, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(test_data["config_db"])
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.ipset_available = False
+
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        rate_limit_cmds = [cmd for cmd in iptables_cmds if 'hashlimit' in cmd]
+        self.assertEqual(rate_limit_cmds, test_data["expected_commands"])
+
+        # The rate policies of the new connections apply ahead of the ACL rules accepting them
+        if rate_limit_cmds:
+            first_accept = min(idx for idx, cmd in enumerate(iptables_cmds) if '10.0.0.0/24' in cmd)
+            self.assertLess(iptables_cmds.index(rate_limit_cmds[-1]), first_accept)
+
+    @patchfs
+    def test_rate_limit_counters(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(make_rate_limit_config_db({"SSH": {"pps": "50"}}))
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd", counters_interval_secs=10)
+        caclmgrd_daemon.ipset_available = False
+
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+        rate_limit_cmds = [cmd for cmd in iptables_cmds if 'hashlimit' in cmd]
+        self.assertEqual(len(rate_limit_cmds), 2)
+        for cmd in rate_limit_cmds:
+            self.assertEqual(cmd[-5:], ['comment', '--comment', 'CTRLPLANE_RATE_LIMIT|SSH', '-j', 'DROP'])
+        self.assertIn('CTRLPLANE_RATE_LIMIT|SSH', caclmgrd_daemon.counted_acl_rules[''])
+
+    def test_validate_config_entry(self):
+        schema = self.caclmgrd.ControlPlaneAclManager.RATE_LIMIT_SCHEMA
+        self.assertEqual(self.caclmgrd.validate_config_entry(schema, {"pps": "10", "burst": "20", "mode": "aggregate"}),
+                         {"pps": 10, "burst": 20, "mode": "aggregate"})
+        self.assertEqual(self.caclmgrd.validate_config_entry(schema, {"pps": "1000000"}), {"pps": 1000000})
+        for entry, error in [
+                ({}, "missing field 'pps'"),
+                ({"pps": "ten"}, "invalid field 'pps'"),
+                ({"pps": "1000001"}, "invalid field 'pps'"),
+                ({"pps": "10", "burst": "0"}, "invalid field 'burst'"),
+                ({"pps": "10", "mode": "srcip"}, "invalid field 'mode'"),
+                ({"pps": "10", "rate": "10"}, "unknown field 'rate'")]:
+            with self.assertRaisesRegex(ValueError, error):
+                self.caclmgrd.validate_config_entry(schema, entry)
@@ -0,0 +1,159 @@
+import os
+import sys
+
+from swsscommon import swsscommon
+from parameterized import parameterized
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_incremental_update_vectors import make_scale_config_db
+from .test_ruleset_state_vectors import CACLMGRD_RULESET_STATE_TEST_VECTOR, IPTABLES_SAVE_MATCHING, IPTABLES_SAVE_MISSING
+from tests.common.mock_configdb import MockConfigDb, MockDBConnector
+from tests.common.mock_iptables import MockIptables
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+class TestCaclmgrdRulesetState(TestCase):
+    """
+        Test caclmgrd skipping the apply of rules still installed on restart
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+        self.state_db = MockDBConnector('STATE_DB', 0)
+        self.iptables_save = IPTABLES_SAVE_MISSING
+
+    def install_rules(self, commands):
+        self.iptables_save = IPTABLES_SAVE_MATCHING
+        return []
+
+    def run_commands(self, commands):
+        cmd = commands[0]
+        if cmd[-1] == '-S':
+            # List the filter table rules of the iptables-save output
+            save_binary = self.caclmgrd.IPTABLES_SAVE_BINARIES[cmd[-2]]
+            lines = self.caclmgrd.canonicalize_iptables_save(self.iptables_save[save_binary], ["filter"], [])
+            return '\n'.join(['-N ' + line[1:].split()[0] for line in lines if line.endswith(' -')] +
+                             [line for line in lines if line.startswith('-A ')])
+        return self.iptables_save.get(cmd[-1], "")
+
+    def make_daemon(self):
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.state_db_map[''] = self.state_db
+        caclmgrd_daemon.ipset_available = False
+        caclmgrd_daemon.run_commands = self.run_commands
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(side_effect=self.install_rules)
+        caclmgrd_daemon.update_control_plane_nat_acls = mock.MagicMock(return_value=[])
+        return caclmgrd_daemon
+
+    @parameterized.expand(CACLMGRD_RULESET_STATE_TEST_VECTOR)
+    @patchfs
+    def test_restart(self, test_name, test_data, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=2)
+        MockConfigDb.set_config_db(config_db)
+
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        caclmgrd_daemon.run_commands_batch.assert_called_once()
+        ruleset_state = self.state_db.data['CACLMGRD_RULESET|host']
+        self.assertEqual(ruleset_state['generation'], '1')
+        self.assertEqual(ruleset_state['installed_checksum'], caclmgrd_daemon.installed_checksum[''])
+
+        # The daemon restarts and finds the given rules installed
+        self.iptables_save = test_data["iptables_save"]
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.called, test_data["expect_apply"])
+        caclmgrd_daemon.update_control_plane_nat_acls.assert_called_once()
+
+        if test_data["expect_apply"]:
+            generation = test_data["expected_generation"]
+            self.assertEqual(caclmgrd_daemon.input_chain[''], 'CTRLPLANE_ACL_G' + generation)
+            self.assertEqual(self.state_db.data['CACLMGRD_RULESET|host']['generation'], generation)
+            return
+
+        # The next change is applied incrementally to the recorded generation
+        self.assertEqual(caclmgrd_daemon.input_chain[''], 'CTRLPLANE_ACL_G1')
+        config_db["ACL_RULE"]["SSH_ONLY|RULE_1"]["PACKET_ACTION"] = "DROP"
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.run_commands_batch.call_args[0][0], [
+            ['iptables', '-R', 'CTRLPLANE_ACL_G1', '11', '-p', 'tcp', '-s', '10.0.1.0/24', '--dport', '22', '-j', 'DROP']
+        ])
+
+    @patchfs
+    def test_restart_with_changed_config(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=2)
+        MockConfigDb.set_config_db(config_db)
+        self.make_daemon().update_control_plane_acls('', MockConfigDb())
+
+        # The configuration changed while caclmgrd was down
+        config_db["ACL_RULE"]["SSH_ONLY|RULE_1"]["SRC_IP"] = "192.168.0.0/24"
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        caclmgrd_daemon.run_commands_batch.assert_called_once()
+
+        # An explicit full rebuild never skips the apply
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb(), full_rebuild=True)
+        caclmgrd_daemon.run_commands_batch.assert_called_once()
+
+    @patchfs
+    def test_restart_dualtor(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=2)
+        config_db["DEVICE_METADATA"]["localhost"]["subtype"] = "DualToR"
+        config_db["LOOPBACK_INTERFACE"] = {"Loopback1|10.1.0.10/32": {}, "Loopback1|FC00:1:0:10::/128": {}}
+        MockConfigDb.set_config_db(config_db)
+        kernel = MockIptables(self.caclmgrd.IptablesRuleset)
+
+        def make_dualtor_daemon():
+            caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+            caclmgrd_daemon.state_db_map[''] = self.state_db
+            caclmgrd_daemon.ipset_available = False
+            caclmgrd_daemon.run_commands = kernel.run_commands
+            caclmgrd_daemon.run_commands_batch = mock.MagicMock(side_effect=kernel.run_commands_batch)
+            return caclmgrd_daemon
+
+        caclmgrd_daemon = make_dualtor_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertIn(('-d', '10.1.0.10', '-p', 'tcp', '--dport', '179', '-j', 'DROP'),
+                      kernel.get_chains('iptables', 'filter')['CTRLPLANE_ACL_G1'])
+
+        # The recorded state covers the Loopback1 rules, so a restart skips the apply
+        caclmgrd_daemon = make_dualtor_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(caclmgrd_daemon.input_chain[''], 'CTRLPLANE_ACL_G1')
+        for batch in caclmgrd_daemon.run_commands_batch.call_args_list:
+            self.assertEqual([cmd for cmd in batch[0][0] if self.caclmgrd.split_iptables_command(cmd)[2] == 'filter'], [])
+
+    def test_ruleset_checksum(self):
+        commands = [
+            ['iptables', '-A', 'INPUT', '-j', 'ACCEPT'],
+            ['ip6tables', '-A', 'INPUT', '-j', 'DROP'],
+        ]
+        ruleset = self.caclmgrd.IptablesRuleset.from_commands(commands)
+        self.assertEqual(ruleset.checksum(), self.caclmgrd.IptablesRuleset.from_commands(commands[::-1]).checksum())
+        ruleset.apply_command(['iptables', '-P', 'INPUT', 'DROP'])
+        self.assertNotEqual(ruleset.checksum(), self.caclmgrd.IptablesRuleset.from_commands(commands).checksum())
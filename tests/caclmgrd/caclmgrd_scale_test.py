@@ -7,7 +7,7 @@ from sonic_py_common.general import load_module_from_source
 from unittest import TestCase, mock
 from pyfakefs.fake_filesystem_unittest import patchfs
 
-from .test_scale_vectors import CACLMGRD_SCALE_TEST_VECTOR
+from .test_scale_vectors import CACLMGRD_SCALE_TEST_VECTOR, CACLMGRD_PORT_RANGE_SCALE_TEST_VECTOR
 from tests.common.mock_configdb import MockConfigDb
 from unittest.mock import MagicMock, patch
 
@@ -46,6 +46,53 @@ class TestCaclmgrdScale(TestCase):
                 mocked_subprocess.call.return_value = call_rc
 
                 caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
-                caclmgrd_daemon.num_changes[''] = 150
-                caclmgrd_daemon.check_and_update_control_plane_acls('', 150)
+                caclmgrd_daemon.schedule_control_plane_acl_update('')
+                caclmgrd_daemon.update_workers[''].apply_pending()
                 mocked_subprocess.Popen.assert_has_calls(test_data["expected_subprocess_calls"], any_order=True)
+
+    @parameterized.expand(CACLMGRD_PORT_RANGE_SCALE_TEST_VECTOR)
+    @patchfs
+    def test_caclmgrd_port_range_scale(self, test_name, test_data, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(test_data["config_db"])
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.generate_block_ip2me_traffic_iptables_commands = mock.MagicMock(return_value=[])
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.ipset_available = False
+
+        iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', MockConfigDb())
+
+        # Only the EXTERNAL_CLIENT rules match tcp ports within the configured ones
+        all_ports = set().union(*test_data["expected_ports"].values())
+        matched_ports = {}
+        num_rules = 0
+        for cmd in iptables_cmds:
+            if '--ttl-lt' in cmd or '--hl-lt' in cmd:
+                continue
+            if '--dport' in cmd:
+                port_spec = cmd[cmd.index('--dport') + 1]
+            elif '--dports' in cmd:
+                port_spec = cmd[cmd.index('--dports') + 1]
+            else:
+                continue
+            ports = set()
+            for port in port_spec.split(','):
+                port_start, _, port_end = port.partition(':')
+                ports.update(range(int(port_start), int(port_end or port_start) + 1))
+            if not ports <= all_ports or cmd[cmd.index('-p') + 1] != 'tcp':
+                continue
+
+            if '--dports' in cmd:
+                self.assertLessEqual(len(ports), self.caclmgrd.MULTIPORT_MAX_PORTS)
+            src = cmd[cmd.index('-s') + 1] if '-s' in cmd else None
+            action = cmd[cmd.index('-j') + 1]
+            matched_ports.setdefault((src, action), set()).update(ports)
+            num_rules += 1
+
+        self.assertEqual(num_rules, test_data["expected_rule_count"])
+        self.assertEqual(matched_ports, test_data["expected_ports"])
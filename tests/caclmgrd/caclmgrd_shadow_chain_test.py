@@ -0,0 +1,174 @@
+import os
+import sys
+
+from swsscommon import swsscommon
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_incremental_update_vectors import make_scale_config_db
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+# Rules left in INPUT by a caclmgrd which did not use generation chains
+LEGACY_INPUT_RULES = [
+    ('-s', '127.0.0.1', '-i', 'lo', '-j', 'ACCEPT'),
+    ('-p', 'tcp', '--dport', '22', '-j', 'ACCEPT'),
+    ('-j', 'DROP'),
+]
+
+
+class FakeIptables(object):
+    """
+        Command sink modelling the filter tables of a namespace, which checks
+        after every single command that INPUT still jumps to a generation chain
+    """
+    def __init__(self, caclmgrd):
+        self.caclmgrd = caclmgrd
+        self.installed = caclmgrd.IptablesRuleset()
+        self.num_commands = 0
+        for binary in ('iptables', 'ip6tables'):
+            for rule in LEGACY_INPUT_RULES:
+                self.installed.apply_command([binary, '-A', 'INPUT'] + list(rule))
+
+    def get_chains(self, binary):
+        return self.installed.chains.setdefault((binary, 'filter'), {})
+
+    def get_input_jumps(self, binary):
+        return [rule[1] for rule in self.get_chains(binary).get('INPUT', [])
+                if rule[:1] == ('-j',) and self.caclmgrd.get_chain_generation(rule[1]) is not None]
+
+    def list_rules(self, binary):
+        lines = []
+        for chain, rules in self.get_chains(binary).items():
+            if chain in self.caclmgrd.IPTABLES_BUILTIN_CHAINS['filter']:
+                lines.append('-P {} ACCEPT'.format(chain))
+            else:
+                lines.append('-N {}'.format(chain))
+        for chain, rules in self.get_chains(binary).items():
+            lines += ['-A {} {}'.format(chain, ' '.join(rule)) for rule in rules]
+        return '\n'.join(lines)
+
+    def check_input(self):
+        for binary in ('iptables', 'ip6tables'):
+            chains = self.get_chains(binary)
+            jumps = self.get_input_jumps(binary)
+            if not jumps:
+                # Only the legacy ruleset may be installed without a jump
+                assert chains.get('INPUT') == LEGACY_INPUT_RULES, "INPUT lost its jump after {} commands".format(self.num_commands)
+                continue
+            assert chains['INPUT'][0] == ('-j', jumps[0])
+            assert chains.get(jumps[0]), "INPUT jumps to missing or empty chain {}".format(jumps[0])
+
+    def run_commands(self, commands, failed_cmds=None):
+        for cmd in commands:
+            if cmd[-1] == '-S':
+                return self.list_rules(cmd[-2])
+            if cmd[0] in ('iptables', 'ip6tables'):
+                self.installed.apply_command(cmd)
+                self.num_commands += 1
+                self.check_input()
+        return ""
+
+    def get_chain_list(self, iptable_ns_cmd_prefix, exclude_list):
+        return [chain for chain in self.get_chains('iptables') if chain not in exclude_list]
+
+    def get_checksum(self, namespace, ruleset):
+        return repr(sorted((key, sorted(chains.items())) for key, chains in self.installed.chains.items()))
+
+
+class TestCaclmgrdShadowChain(TestCase):
+    """
+        Test caclmgrd ruleset swaps through generation chains
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+        self.kernel = FakeIptables(self.caclmgrd)
+
+    def make_daemon(self):
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.iptables_restore_path = {'iptables': None, 'ip6tables': None}
+        caclmgrd_daemon.ipset_available = False
+        caclmgrd_daemon.run_commands = self.kernel.run_commands
+        caclmgrd_daemon.get_chain_list = self.kernel.get_chain_list
+        caclmgrd_daemon.get_installed_ruleset_checksum = self.kernel.get_checksum
+        caclmgrd_daemon.update_control_plane_nat_acls = mock.MagicMock(return_value=[])
+        return caclmgrd_daemon
+
+    def assert_installed(self, caclmgrd_daemon, generation):
+        chain = 'CTRLPLANE_ACL_G{}'.format(generation)
+        self.assertEqual(caclmgrd_daemon.input_chain[''], chain)
+        desired = caclmgrd_daemon.applied_ruleset['']
+        for binary in ('iptables', 'ip6tables'):
+            chains = self.kernel.get_chains(binary)
+            self.assertEqual(chains['INPUT'], [('-j', chain)])
+            self.assertEqual(chains[chain], desired.chains[(binary, 'filter')]['INPUT'])
+            # Previous generations are gone
+            self.assertEqual([name for name in chains if self.caclmgrd.get_chain_generation(name) is not None], [chain])
+
+    @patchfs
+    def test_consecutive_applies_keep_input_jump(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        config_db = make_scale_config_db(num_rules=10)
+        MockConfigDb.set_config_db(config_db)
+        caclmgrd_daemon = self.make_daemon()
+
+        # Replacing the rules of a caclmgrd without generation chains
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assert_installed(caclmgrd_daemon, 1)
+
+        # A full rebuild repoints the single jump in place
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb(), full_rebuild=True)
+        self.assert_installed(caclmgrd_daemon, 2)
+
+        # An incremental change edits the active generation
+        num_commands = self.kernel.num_commands
+        config_db["ACL_RULE"]["SSH_ONLY|RULE_3"]["PACKET_ACTION"] = "DROP"
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assert_installed(caclmgrd_daemon, 2)
+        self.assertEqual(self.kernel.num_commands - num_commands, 1)
+
+        # Rules changed outside of the update path land in the active generation
+        caclmgrd_daemon.allow_bfd_protocol('')
+        caclmgrd_daemon.bfdAllowed = True
+        self.assertEqual(self.kernel.get_chains('iptables')['CTRLPLANE_ACL_G2'][1],
+                         ('-p', 'udp', '-m', 'multiport', '--dports', '3784,4784', '-j', 'ACCEPT', '!', '-i', 'eth0'))
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assert_installed(caclmgrd_daemon, 3)
+
+        # A restarted daemon picks up the generation from the installed chains
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assert_installed(caclmgrd_daemon, 4)
+
+    def test_retarget_input_commands(self):
+        self.assertEqual(self.caclmgrd.retarget_input_commands([
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-A', 'INPUT', '-j', 'DROP'],
+            ['ip6tables', '-I', 'INPUT', '2', '-j', 'ACCEPT'],
+            ['iptables', '-t', 'nat', '-A', 'INPUT', '-j', 'ACCEPT'],
+            ['iptables', '-P', 'INPUT', 'ACCEPT'],
+            ['iptables', '-A', 'DHCP', '-j', 'RETURN'],
+        ], 'CTRLPLANE_ACL_G7'), [
+            ['ip', 'netns', 'exec', 'asic0', 'iptables', '-A', 'CTRLPLANE_ACL_G7', '-j', 'DROP'],
+            ['ip6tables', '-I', 'CTRLPLANE_ACL_G7', '2', '-j', 'ACCEPT'],
+            ['iptables', '-t', 'nat', '-A', 'INPUT', '-j', 'ACCEPT'],
+            ['iptables', '-P', 'INPUT', 'ACCEPT'],
+            ['iptables', '-A', 'DHCP', '-j', 'RETURN'],
+        ])
+        self.assertEqual(self.caclmgrd.get_chain_generation('CTRLPLANE_ACL_G12'), 12)
+        self.assertIsNone(self.caclmgrd.get_chain_generation('CTRLPLANE_ACL_GX'))
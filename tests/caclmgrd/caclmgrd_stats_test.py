@@ -0,0 +1,162 @@
+import os
+import sys
+
+from swsscommon import swsscommon
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_incremental_update_vectors import make_scale_config_db
+from tests.common.mock_configdb import MockConfigDb, MockDBConnector
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+class StepClock(object):
+    """
+        Clock advancing by a fixed step every time it is read
+    """
+    def __init__(self, step_secs):
+        self.now = 1000.0
+        self.step_secs = step_secs
+
+    def __call__(self):
+        self.now += self.step_secs
+        return self.now
+
+
+class TestCaclmgrdStats(TestCase):
+    """
+        Test caclmgrd ACL update telemetry
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+        self.state_db = MockDBConnector('STATE_DB', 0)
+
+    def make_daemon(self):
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.state_db_map[''] = self.state_db
+        caclmgrd_daemon.ipset_available = False
+        caclmgrd_daemon.run_commands = mock.MagicMock(return_value="")
+        caclmgrd_daemon.run_commands_batch = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.update_control_plane_nat_acls = mock.MagicMock(return_value=[])
+        caclmgrd_daemon.apply_stats[''] = self.caclmgrd.AclApplyStats(clock=StepClock(0.25), wall_clock=lambda: 86400)
+        return caclmgrd_daemon
+
+    @patchfs
+    def test_apply_stats(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(make_scale_config_db(num_rules=2))
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+
+        stats = self.state_db.data['CACLMGRD_STATS|host']
+        self.assertEqual(stats['translation_time_ms'], '250')
+        self.assertEqual(stats['apply_time_ms'], '250')
+        self.assertEqual(stats['commands_executed'], str(len(caclmgrd_daemon.run_commands_batch.call_args[0][0])))
+        self.assertEqual(stats['rules_iptables_filter'], str(sum(
+            len(rules) for rules in caclmgrd_daemon.applied_ruleset[''].chains[('iptables', 'filter')].values())))
+        self.assertEqual(stats['rules_ip6tables_raw'], '2')
+        self.assertEqual(stats['last_apply_timestamp'], '1970-01-02T00:00:00Z')
+        self.assertEqual(stats['generation'], '1')
+        self.assertEqual(stats['failure_reason'], '')
+        self.assertEqual(stats['apply_latency_le_500ms'], '1')
+        self.assertEqual(stats['apply_latency_gt_5000ms'], '0')
+
+        # An incremental update runs only the changed rule
+        MockConfigDb.CONFIG_DB["ACL_RULE"]["SSH_ONLY|RULE_1"]["PACKET_ACTION"] = "DROP"
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(stats['commands_executed'], '1')
+        self.assertEqual(stats['generation'], '1')
+        self.assertEqual(stats['apply_latency_le_500ms'], '2')
+
+    @patchfs
+    def test_apply_failure(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(make_scale_config_db(num_rules=2))
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+
+        caclmgrd_daemon.run_commands_batch.side_effect = OSError("iptables-restore not found")
+        with self.assertRaises(OSError):
+            caclmgrd_daemon.update_control_plane_acls('', MockConfigDb(), full_rebuild=True)
+        stats = self.state_db.data['CACLMGRD_STATS|host']
+        self.assertEqual(stats['failure_reason'], "OSError('iptables-restore not found')")
+        # The last successful apply is still reported
+        self.assertEqual(stats['generation'], '1')
+
+        caclmgrd_daemon.run_commands_batch.side_effect = None
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb(), full_rebuild=True)
+        self.assertEqual(stats['failure_reason'], '')
+        self.assertEqual(stats['generation'], '2')
+
+    @patchfs
+    def test_apply_failed_commands(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(make_scale_config_db(num_rules=2))
+        caclmgrd_daemon = self.make_daemon()
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+
+        # Commands failing without an exception are reported, and the next update rebuilds the rules
+        failed_cmds = [['iptables', '-A', 'CTRLPLANE_ACL_G2', '-j', 'DROP'], ['ip6tables', '-A', 'CTRLPLANE_ACL_G2', '-j', 'DROP']]
+        caclmgrd_daemon.run_commands_batch.return_value = failed_cmds
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb(), full_rebuild=True)
+        stats = self.state_db.data['CACLMGRD_STATS|host']
+        self.assertEqual(stats['failure_reason'],
+                         "Failed commands: iptables -A CTRLPLANE_ACL_G2 -j DROP; ip6tables -A CTRLPLANE_ACL_G2 -j DROP")
+        self.assertNotIn('', caclmgrd_daemon.applied_ruleset)
+
+        caclmgrd_daemon.run_commands_batch.return_value = []
+        caclmgrd_daemon.update_control_plane_acls('', MockConfigDb())
+        self.assertEqual(stats['failure_reason'], '')
+        self.assertEqual(stats['generation'], '3')
+
+    def test_failed_commands_reason(self):
+        apply_stats = self.caclmgrd.AclApplyStats()
+        failed_cmds = [['iptables', '-A', 'INPUT', '-s', '10.0.{}.0/24'.format(idx), '-j', 'ACCEPT'] for idx in range(7)]
+        apply_stats.record_failed_commands(failed_cmds)
+        self.assertEqual(apply_stats.stats['failure_reason'], "Failed commands: " + "; ".join(
+            "iptables -A INPUT -s 10.0.{}.0/24 -j ACCEPT".format(idx) for idx in range(5)) + "; and 2 more")
+
+    def test_latency_histogram(self):
+        apply_stats = self.caclmgrd.AclApplyStats()
+        ruleset = self.caclmgrd.IptablesRuleset()
+        self.assertEqual(set(apply_stats.get_latency_histogram().values()), {0})
+
+        for latency_ms in (5, 10, 11, 700, 5000, 5001):
+            apply_stats.record_apply(latency_ms / 1000.0, 0, ruleset, 1)
+        self.assertEqual(list(apply_stats.get_latency_histogram().items()), [
+            ('apply_latency_le_10ms', 2),
+            ('apply_latency_le_50ms', 1),
+            ('apply_latency_le_100ms', 0),
+            ('apply_latency_le_500ms', 0),
+            ('apply_latency_le_1000ms', 1),
+            ('apply_latency_le_5000ms', 1),
+            ('apply_latency_gt_5000ms', 1),
+        ])
+
+        # Only the latest applies are kept
+        for _ in range(self.caclmgrd.AclApplyStats.LATENCY_WINDOW):
+            apply_stats.record_apply(0.2, 0, ruleset, 1)
+        histogram = apply_stats.get_latency_histogram()
+        self.assertEqual(histogram['apply_latency_le_500ms'], self.caclmgrd.AclApplyStats.LATENCY_WINDOW)
+        self.assertEqual(sum(histogram.values()), self.caclmgrd.AclApplyStats.LATENCY_WINDOW)
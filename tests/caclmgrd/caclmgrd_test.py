@@ -36,17 +36,14 @@ class TestCaclmgrd(TestCase):
         assert output == ""
 
     def test_get_chain_list(self):
-        expected_calls = [
-            call(
-                ["iptables", "-L", "-v", "-n"], ["grep", "Chain"], ["awk", "{print $2}"]
-            )
-        ]
+        iptables_save_output = "*filter\n:INPUT ACCEPT [0:0]\n:FORWARD ACCEPT [0:0]\n:OUTPUT ACCEPT [0:0]\n:DHCP - [0:0]\nCOMMIT\n"
         caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
         with mock.patch(
-            "caclmgrd.ControlPlaneAclManager.run_commands_pipe"
-        ) as mock_run_commands_pipe:
-            caclmgrd_daemon.get_chain_list([], [""])
-            mock_run_commands_pipe.assert_has_calls(expected_calls)
+            "caclmgrd.ControlPlaneAclManager.run_commands", return_value=iptables_save_output
+        ) as mock_run_commands:
+            chain_list = caclmgrd_daemon.get_chain_list([], ["DHCP"])
+            mock_run_commands.assert_called_once_with([["iptables-save", "-t", "filter"]])
+            assert chain_list == ["INPUT", "FORWARD", "OUTPUT"]
 
     @patch("caclmgrd.ControlPlaneAclManager.update_control_plane_acls")
     def test_update_control_plane_acls_exception(self, mock_update):
@@ -54,12 +51,9 @@ class TestCaclmgrd(TestCase):
         mock_update.side_effect = Exception("Test exception")
         # Mock the necessary attributes and methods
         manager = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
-        manager.UPDATE_DELAY_SECS = 1
-        manager.lock = {"": threading.Lock()}
-        manager.num_changes = {"": 0}
-        manager.update_thread = {"": None}
-        manager.num_changes[""] = 1
-        manager.check_and_update_control_plane_acls("", 0)
+        manager.schedule_control_plane_acl_update("")
+        # The worker loop returns once the update raised
+        manager.update_workers[""].run()
         # Assert that thread_exceptions exists and contains the exception
         self.assertTrue(manager.thread_exceptions)
         self.assertIn("", manager.thread_exceptions)
@@ -0,0 +1,91 @@
+import hashlib
+import os
+import sys
+
+from swsscommon import swsscommon
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+from pyfakefs.fake_filesystem_unittest import patchfs
+
+from .test_translation_benchmark_vectors import make_benchmark_config_db, BENCHMARK_EXPECTED_NUM_COMMANDS, \
+    BENCHMARK_EXPECTED_SHA256
+from tests.common.mock_configdb import MockConfigDb
+
+
+DBCONFIG_PATH = '/var/run/redis/sonic-db/database_config.json'
+
+
+class ScanCountingTable(dict):
+    """
+        Config DB table which counts how many times its rules are scanned
+    """
+    num_scans = 0
+
+    def __iter__(self):
+        ScanCountingTable.num_scans += 1
+        return super(ScanCountingTable, self).__iter__()
+
+    def items(self):
+        ScanCountingTable.num_scans += 1
+        return super(ScanCountingTable, self).items()
+
+    def keys(self):
+        ScanCountingTable.num_scans += 1
+        return super(ScanCountingTable, self).keys()
+
+    def values(self):
+        ScanCountingTable.num_scans += 1
+        return super(ScanCountingTable, self).values()
+
+
+class ScanCountingConfigDb(MockConfigDb):
+    """
+        Mock Config DB whose ACL rule table counts its scans
+    """
+    def get_table(self, table_name):
+        table = super(ScanCountingConfigDb, self).get_table(table_name)
+        if table_name == "ACL_RULE":
+            return ScanCountingTable(table)
+        return table
+
+
+class TestCaclmgrdTranslationBenchmark(TestCase):
+    """
+        Micro-benchmark of the caclmgrd ACL translation
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ip = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_namespace_mgmt_ipv6 = mock.MagicMock(return_value='')
+        self.caclmgrd.ControlPlaneAclManager.get_chain_list = mock.MagicMock(return_value=["INPUT", "FORWARD", "OUTPUT"])
+        self.caclmgrd.ControlPlaneAclManager.get_chassis_midplane_interface_ip = mock.MagicMock(return_value=('', ''))
+
+    @patchfs
+    def test_translation_benchmark(self, fs):
+        if not os.path.exists(DBCONFIG_PATH):
+            fs.create_file(DBCONFIG_PATH) # fake database_config.json
+
+        MockConfigDb.set_config_db(make_benchmark_config_db())
+        caclmgrd_daemon = self.caclmgrd.ControlPlaneAclManager("caclmgrd")
+        caclmgrd_daemon.ipset_available = False
+        caclmgrd_daemon.log_info = mock.MagicMock()
+        caclmgrd_daemon.log_warning = mock.MagicMock()
+        caclmgrd_daemon.log_error = mock.MagicMock()
+
+        ScanCountingTable.num_scans = 0
+        with mock.patch.object(caclmgrd_daemon, 'index_acl_rules', wraps=caclmgrd_daemon.index_acl_rules) as mocked_index:
+            iptables_cmds, _ = caclmgrd_daemon.get_acl_rules_and_translate_to_iptables_commands('', ScanCountingConfigDb())
+
+        output = '\n'.join(' '.join(cmd) for cmd in iptables_cmds)
+        self.assertEqual(len(iptables_cmds), BENCHMARK_EXPECTED_NUM_COMMANDS)
+        self.assertEqual(hashlib.sha256(output.encode()).hexdigest(), BENCHMARK_EXPECTED_SHA256)
+        # The rules are bucketed by table in a single scan, not rescanned per table and service
+        mocked_index.assert_called_once()
+        self.assertEqual(ScanCountingTable.num_scans, 1)
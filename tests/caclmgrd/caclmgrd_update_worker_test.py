@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+
+from swsscommon import swsscommon
+from sonic_py_common.general import load_module_from_source
+from unittest import TestCase, mock
+
+from tests.common.mock_configdb import MockConfigDb, MockDBConnector
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, secs):
+        self.now += secs
+
+
+class TestCaclmgrdUpdateWorker(TestCase):
+    """
+        Test caclmgrd per-namespace ACL update workers
+    """
+    def setUp(self):
+        swsscommon.ConfigDBConnector = MockConfigDb
+        test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules_path = os.path.dirname(test_path)
+        scripts_path = os.path.join(modules_path, "scripts")
+        sys.path.insert(0, modules_path)
+        caclmgrd_path = os.path.join(scripts_path, 'caclmgrd')
+        self.caclmgrd = load_module_from_source('caclmgrd', caclmgrd_path)
+
+        self.acl_manager = mock.MagicMock()
+        self.clock = FakeClock()
+        self.worker = self.caclmgrd.AclUpdateWorker(self.acl_manager, 'asic0', min_quiet_secs=0.5,
+                                                    max_latency_secs=2, clock=self.clock)
+        self.worker.config_db_connector = mock.MagicMock()
+        self.worker.state_db_connector = MockDBConnector('STATE_DB', 0)
+
+    def run_until_idle(self, step_secs):
+        """
+        Advance the fake clock, applying the pending requests whenever due
+        Returns:
+            The times at which updates were applied
+        """
+        apply_times = []
+        while self.worker.get_wait_time(self.clock()) is not None:
+            if self.worker.get_wait_time(self.clock()) == 0:
+                self.worker.apply_pending()
+                apply_times.append(self.clock())
+            else:
+                self.clock.advance(step_secs)
+        return apply_times
+
+    def test_burst_is_coalesced(self):
+        self.assertIsNone(self.worker.get_wait_time(self.clock()))
+
+        for _ in range(100):
+            self.worker.submit()
+            self.clock.advance(0.001)
+        self.assertAlmostEqual(self.worker.get_wait_time(self.clock()), 0.5 - 0.001)
+
+        # Nothing is due until the requests have been quiet for min_quiet_secs
+        self.clock.advance(0.4)
+        self.assertGreater(self.worker.get_wait_time(self.clock()), 0)
+        self.clock.advance(0.1)
+        self.assertEqual(self.worker.get_wait_time(self.clock()), 0)
+
+        self.assertTrue(self.worker.apply_pending())
+        self.assertFalse(self.worker.apply_pending())
+        self.acl_manager.update_control_plane_acls.assert_called_once_with(
+            'asic0', self.worker.config_db_connector, full_rebuild=False)
+
+        stats = self.worker.state_db_connector.data['CACLMGRD_STATS|asic0']
+        self.assertEqual(stats, {
+            'queue_depth': '0',
+            'coalesced_requests': '99',
+            'applied_updates': '1',
+            'last_apply_latency_ms': '600',
+        })
+
+    def test_continuous_stream_is_not_starved(self):
+        # A request every 0.3 seconds is never quiet for 0.5 seconds
+        apply_times = []
+        start = self.clock()
+        for _ in range(40):
+            self.worker.submit()
+            self.clock.advance(0.3)
+            if self.worker.get_wait_time(self.clock()) == 0:
+                self.worker.apply_pending()
+                apply_times.append(round(self.clock() - start, 3))
+
+        # Updates are applied every max_latency_secs, rounded up to the next request
+        self.assertEqual(apply_times, [2.1, 4.2, 6.3, 8.4, 10.5])
+        self.assertEqual(self.acl_manager.update_control_plane_acls.call_count, 5)
+        self.assertEqual(self.worker.coalesced_requests, 35 - 5)
+        self.assertEqual(self.worker.state_db_connector.data['CACLMGRD_STATS|asic0']['last_apply_latency_ms'], '2100')
+
+        # The remaining requests are applied once quiet
+        self.assertEqual(len(self.run_until_idle(0.1)), 1)
+        self.assertEqual(self.acl_manager.update_control_plane_acls.call_count, 6)
+
+    def test_full_rebuild_is_coalesced(self):
+        self.worker.submit()
+        self.worker.submit(full_rebuild=True)
+        self.worker.submit()
+        self.run_until_idle(0.1)
+        self.acl_manager.update_control_plane_acls.assert_called_once_with(
+            'asic0', self.worker.config_db_connector, full_rebuild=True)
+
+        self.worker.submit()
+        self.run_until_idle(0.1)
+        self.acl_manager.update_control_plane_acls.assert_called_with(
+            'asic0', self.worker.config_db_connector, full_rebuild=False)
+
+    def test_queue_depth_published(self):
+        self.worker.submit()
+        self.worker.publish_stats()
+        self.assertEqual(self.worker.state_db_connector.data['CACLMGRD_STATS|asic0']['queue_depth'], '1')
+
+        worker = self.caclmgrd.AclUpdateWorker(self.acl_manager, '', 0.5, 2, clock=self.clock)
+        worker.state_db_connector = MockDBConnector('STATE_DB', 0)
+        worker.publish_stats()
+        self.assertIn('CACLMGRD_STATS|host', worker.state_db_connector.data)
+
+    def test_queue_depth_published_on_submit(self):
+        self.worker.publish_queue_depth()
+        self.assertEqual(self.worker.state_db_connector.data['CACLMGRD_STATS|asic0'], {'queue_depth': '0'})
+
+        # The worker publishes the backlog while the requests are being coalesced
+        worker = self.caclmgrd.AclUpdateWorker(self.acl_manager, 'asic0', min_quiet_secs=60, max_latency_secs=60)
+        worker.state_db_connector = MockDBConnector('STATE_DB', 0)
+        worker.start()
+        for expected_depth in ['1', '2', '3']:
+            worker.submit()
+            deadline = time.monotonic() + 5
+            while worker.state_db_connector.data.get('CACLMGRD_STATS|asic0', {}).get('queue_depth') != expected_depth:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+        self.acl_manager.update_control_plane_acls.assert_not_called()
+
+    def test_worker_owns_config_db_connector(self):
+        self.worker.config_db_connector = None
+        with mock.patch("caclmgrd.swsscommon.ConfigDBConnector") as mocked_connector:
+            for _ in range(3):
+                self.worker.submit()
+                self.run_until_idle(0.1)
+            mocked_connector.assert_called_once_with(use_unix_socket_path=True, namespace='asic0')
+        self.assertEqual(self.acl_manager.update_control_plane_acls.call_count, 3)
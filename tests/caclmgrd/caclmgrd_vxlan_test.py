@@ -57,8 +57,8 @@ class TestCaclmgrdVxlan(TestCase):
                 mocked_subprocess.Popen.assert_has_calls(test_data["expected_del_subprocess_calls"], any_order=True)
                 caclmgrd_daemon.allow_vxlan_port('', data)
                 mocked_subprocess.Popen.reset_mock()
-                caclmgrd_daemon.num_changes[''] = 1
                 caclmgrd_daemon.thread_exceptions = {}
-                caclmgrd_daemon.check_and_update_control_plane_acls('', 1)
-                mocked_subprocess.Popen.assert_has_calls(test_data["expected_add_subprocess_calls"], any_order=True)
+                caclmgrd_daemon.schedule_control_plane_acl_update('')
+                caclmgrd_daemon.update_workers[''].apply_pending()
+                mocked_subprocess.Popen.assert_has_calls(test_data["expected_apply_subprocess_calls"], any_order=True)
 
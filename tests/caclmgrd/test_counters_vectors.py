@@ -0,0 +1,114 @@
+"""
+    caclmgrd ACL rule counters test vector
+"""
+
+# iptables-save -c/ip6tables-save -c outputs of a namespace holding the rules
+# of make_scale_config_db(num_rules=2) translated with rule comments
+IPTABLES_SAVE_COUNTERS = {
+    "iptables-save": """# Generated by iptables-save v1.8.7 on Mon Jan  1 00:00:00 2024
+*filter
+:INPUT ACCEPT [0:0]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [1100:88000]
+:CTRLPLANE_ACL_G1 - [0:0]
+[52130:4170400] -A INPUT -j CTRLPLANE_ACL_G1
+[40:2400] -A CTRLPLANE_ACL_G1 -s 127.0.0.1/32 -i lo -j ACCEPT
+[51000:4080000] -A CTRLPLANE_ACL_G1 -m conntrack --ctstate RELATED,ESTABLISHED -j ACCEPT
+[12:720] -A CTRLPLANE_ACL_G1 -s 10.0.0.0/24 -p tcp -m tcp --dport 22 -m comment --comment "SSH_ONLY|RULE_0" -j ACCEPT
+[3:180] -A CTRLPLANE_ACL_G1 -s 10.0.1.0/24 -p tcp -m tcp --dport 22 -m comment --comment "SSH_ONLY|RULE_1" -j ACCEPT
+[75:4500] -A CTRLPLANE_ACL_G1 -p tcp -m tcp --dport 22 -m comment --comment "SSH_ONLY|DEFAULT_RULE" -j DROP
+[0:0] -A CTRLPLANE_ACL_G1 -p udp -m udp --dport 161 -m comment --comment "not a caclmgrd rule" -j ACCEPT
+[1000:83000] -A CTRLPLANE_ACL_G1 -j DROP
+COMMIT
+# Completed on Mon Jan  1 00:00:00 2024
+""",
+    "ip6tables-save": """# Generated by ip6tables-save v1.8.7 on Mon Jan  1 00:00:00 2024
+*filter
+:INPUT ACCEPT [0:0]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [300:24000]
+:CTRLPLANE_ACL_G1 - [0:0]
+[320:25600] -A INPUT -j CTRLPLANE_ACL_G1
+[20:1600] -A CTRLPLANE_ACL_G1 -s ::1/128 -i lo -j ACCEPT
+[300:24000] -A CTRLPLANE_ACL_G1 -m conntrack --ctstate RELATED,ESTABLISHED -j ACCEPT
+[0:0] -A CTRLPLANE_ACL_G1 -j DROP
+COMMIT
+# Completed on Mon Jan  1 00:00:00 2024
+""",
+}
+
+# Rules of one ACL rule spread over several protocols and ports, saved by an
+# iptables which leaves the comment unquoted
+IPTABLES_SAVE_COUNTERS_SPLIT = {
+    "iptables-save": """*filter
+:INPUT ACCEPT [0:0]
+:CTRLPLANE_ACL_G3 - [0:0]
+[7:420] -A CTRLPLANE_ACL_G3 -p tcp -m set --match-set CACL4_0123456789abcdef src -m tcp --dport 22 -m comment --comment SSH_ONLY|RULE_0 -j ACCEPT
+[5:300] -A CTRLPLANE_ACL_G3 -p udp -m set --match-set CACL4_0123456789abcdef src -m udp --dport 22 -m comment --comment SSH_ONLY|RULE_0 -j ACCEPT
+[1:60] -A CTRLPLANE_ACL_G3 -p tcp -m tcp --dport 22 -m comment --comment SSH_ONLY|DEFAULT_RULE -j DROP
+COMMIT
+""",
+    "ip6tables-save": "",
+}
+
+CACLMGRD_COUNTERS_TEST_VECTOR = [
+    [
+        "One rule per ACL rule",
+        {
+            "iptables_save": IPTABLES_SAVE_COUNTERS,
+            "expected_counters": {
+                "SSH_ONLY|RULE_0": (12, 720),
+                "SSH_ONLY|RULE_1": (3, 180),
+                "SSH_ONLY|DEFAULT_RULE": (75, 4500),
+            },
+        }
+    ],
+    [
+        "Rules of an ACL rule summed",
+        {
+            "iptables_save": IPTABLES_SAVE_COUNTERS_SPLIT,
+            "expected_counters": {
+                "SSH_ONLY|RULE_0": (12, 720),
+                "SSH_ONLY|RULE_1": (0, 0),
+                "SSH_ONLY|DEFAULT_RULE": (1, 60),
+            },
+        }
+    ],
+]
+
+# EXTERNAL_CLIENT rules which differ only in their adjacent destination ports
+EXTERNAL_CLIENT_CONFIG_DB = {
+    "ACL_TABLE": {
+        "EXTERNAL_CLIENT_ACL": {
+            "stage": "INGRESS",
+            "type": "CTRLPLANE",
+            "services": [
+                "EXTERNAL_CLIENT"
+            ]
+        }
+    },
+    "ACL_RULE": {
+        "EXTERNAL_CLIENT_ACL|DEFAULT_RULE": {
+            "ETHER_TYPE": "2048",
+            "PACKET_ACTION": "DROP",
+            "PRIORITY": "1"
+        },
+        "EXTERNAL_CLIENT_ACL|RULE_1": {
+            "L4_DST_PORT": "8081",
+            "PACKET_ACTION": "ACCEPT",
+            "PRIORITY": "9998",
+            "SRC_IP": "20.0.0.55/32"
+        },
+        "EXTERNAL_CLIENT_ACL|RULE_2": {
+            "L4_DST_PORT": "8082",
+            "PACKET_ACTION": "ACCEPT",
+            "PRIORITY": "9997",
+            "SRC_IP": "20.0.0.55/32"
+        },
+    },
+    "DEVICE_METADATA": {
+        "localhost": {
+        }
+    },
+    "FEATURE": {},
+}
@@ -39,6 +39,10 @@ CACLMGRD_DASH_HA_TEST_VECTOR = [
                 call(['iptables', '-D', 'INPUT', '-p', 'tcp', '--dport', '23607', '-j', 'ACCEPT'], universal_newlines=True, stdout=subprocess.PIPE),
                 call(['ip6tables', '-D', 'INPUT', '-p', 'tcp', '--dport', '23607', '-j', 'ACCEPT'], universal_newlines=True, stdout=subprocess.PIPE),
             ],
+            "expected_apply_subprocess_calls": [
+                call(['iptables', '-I', 'CTRLPLANE_ACL_G1', '2', '-p', 'tcp', '--dport', '23606', '-j', 'ACCEPT'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-I', 'CTRLPLANE_ACL_G1', '2', '-p', 'tcp', '--dport', '23606', '-j', 'ACCEPT'], universal_newlines=True, stdout=subprocess.PIPE),
+            ],
             
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
@@ -1,5 +1,3 @@
-from unittest.mock import call
-
 """
     caclmgrd dhcp test vector
 """
@@ -21,16 +19,14 @@ CACLMGRD_DHCP_TEST_VECTOR = [
                 ("Ethernet4", {"state": "active"}),
                 ("Ethernet8", {"state": "active"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
-                call(['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
+            "expected_commands": [
+                ['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP'],
+                ['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP'],
             ],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 0,
+            "rule_installed": True,
             "mark": None,
         },
     ],
@@ -50,14 +46,13 @@ CACLMGRD_DHCP_TEST_VECTOR = [
             "mux_update": [
                 ("Ethernet4", {"state": "active"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
-                call(['iptables', '--delete', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
+            "expected_commands": [
+                ['iptables', '--delete', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP'],
             ],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 0,
+            "rule_installed": True,
             "mark": "0x67004",
         },
     ],
@@ -78,14 +73,11 @@ CACLMGRD_DHCP_TEST_VECTOR = [
                 ("Ethernet4", {"state": "active"}),
                 ("Ethernet8", {"state": "active"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
-            ],
+            "expected_commands": [],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 1,
+            "rule_installed": False,
             "mark": None,
         },
     ],
@@ -105,13 +97,11 @@ CACLMGRD_DHCP_TEST_VECTOR = [
             "mux_update": [
                 ("Ethernet4", {"state": "active"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
-            ],
+            "expected_commands": [],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 1,
+            "rule_installed": False,
             "mark": "0x67004",
         },
     ],
@@ -132,14 +122,11 @@ CACLMGRD_DHCP_TEST_VECTOR = [
                 ("Ethernet4", {"state": "standby"}),
                 ("Ethernet8", {"state": "standby"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
-            ],
+            "expected_commands": [],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 0,
+            "rule_installed": True,
             "mark": None,
         },
     ],
@@ -159,13 +146,11 @@ CACLMGRD_DHCP_TEST_VECTOR = [
             "mux_update": [
                 ("Ethernet4", {"state": "standby"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
-            ],
+            "expected_commands": [],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 0,
+            "rule_installed": True,
             "mark": "0x67004",
         },
     ],
@@ -186,16 +171,14 @@ CACLMGRD_DHCP_TEST_VECTOR = [
                 ("Ethernet4", {"state": "standby"}),
                 ("Ethernet8", {"state": "standby"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--insert', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
-                call(['iptables', '--insert', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
+            "expected_commands": [
+                ['iptables', '--insert', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP'],
+                ['iptables', '--insert', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP'],
             ],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 1,
+            "rule_installed": False,
             "mark": None,
         },
     ],
@@ -215,14 +198,13 @@ CACLMGRD_DHCP_TEST_VECTOR = [
             "mux_update": [
                 ("Ethernet4", {"state": "standby"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
-                call(['iptables', '--insert', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
+            "expected_commands": [
+                ['iptables', '--insert', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP'],
             ],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 1,
+            "rule_installed": False,
             "mark": "0x67004",
         },
     ],
@@ -243,16 +225,14 @@ CACLMGRD_DHCP_TEST_VECTOR = [
                 ("Ethernet4", {"state": "unknown"}),
                 ("Ethernet8", {"state": "unknown"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
-                call(['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
+            "expected_commands": [
+                ['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP'],
+                ['iptables', '--delete', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP'],
             ],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 0,
+            "rule_installed": True,
             "mark": None,
         },
     ],
@@ -272,14 +252,13 @@ CACLMGRD_DHCP_TEST_VECTOR = [
             "mux_update": [
                 ("Ethernet4", {"state": "unknown"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check',  'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
-                call(['iptables', '--delete', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
+            "expected_commands": [
+                ['iptables', '--delete', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP'],
             ],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 0,
+            "rule_installed": True,
             "mark": "0x67004",
         },
     ],
@@ -300,14 +279,11 @@ CACLMGRD_DHCP_TEST_VECTOR = [
                 ("Ethernet4", {"state": "unknown"}),
                 ("Ethernet8", {"state": "unknown"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet4', '-j', 'DROP']),
-                call(['iptables', '--check', 'DHCP', '-m', 'physdev', '--physdev-in', 'Ethernet8', '-j', 'DROP']),
-            ],
+            "expected_commands": [],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 1,
+            "rule_installed": False,
             "mark": None,
         },
     ],
@@ -327,13 +303,11 @@ CACLMGRD_DHCP_TEST_VECTOR = [
             "mux_update": [
                 ("Ethernet4", {"state": "unknown"}),
             ],
-            "expected_subprocess_calls": [
-                call(['iptables', '--check', 'DHCP', '-m', 'mark', '--mark', '0x67004', '-j', 'DROP']),
-            ],
+            "expected_commands": [],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
-            "call_rc": 1,
+            "rule_installed": False,
             "mark": "0x67004",
         },
     ],
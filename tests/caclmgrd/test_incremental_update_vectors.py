@@ -0,0 +1,88 @@
+"""
+    caclmgrd incremental update test vector
+"""
+
+NUM_SCALE_RULES = 10000
+
+
+def make_scale_config_db(num_rules=NUM_SCALE_RULES):
+    acl_rules = {}
+    for idx in range(num_rules):
+        acl_rules["SSH_ONLY|RULE_{}".format(idx)] = {
+            "PACKET_ACTION": "ACCEPT",
+            "PRIORITY": str(num_rules + 1 - idx),
+            "SRC_IP": "10.{}.{}.0/24".format(idx // 256, idx % 256)
+        }
+    acl_rules["SSH_ONLY|DEFAULT_RULE"] = {
+        "ETHER_TYPE": "2048",
+        "PACKET_ACTION": "DROP",
+        "PRIORITY": "1"
+    }
+
+    return {
+        "ACL_TABLE": {
+            "SSH_ONLY": {
+                "stage": "INGRESS",
+                "type": "CTRLPLANE",
+                "policy_desc": "SSH_ONLY",
+                "services": [
+                    "SSH"
+                ]
+            }
+        },
+        "ACL_RULE": acl_rules,
+        "DEVICE_METADATA": {
+            "localhost": {
+            }
+        },
+        "FEATURE": {},
+    }
+
+
+CACLMGRD_INCREMENTAL_UPDATE_TEST_VECTOR = [
+    [
+        "Modify source prefix of one rule",
+        {
+            "config_db": make_scale_config_db(),
+            "changes": {
+                "SSH_ONLY|RULE_5000": {
+                    "PACKET_ACTION": "ACCEPT",
+                    "PRIORITY": "5001",
+                    "SRC_IP": "192.168.0.0/24"
+                }
+            },
+            "removed": [],
+            "expected_delta": [
+                ['iptables', '-R', 'INPUT', '5560', '-p', 'tcp', '-s', '192.168.0.0/24', '--dport', '22', '-j', 'ACCEPT']
+            ]
+        }
+    ],
+    [
+        "Add one rule",
+        {
+            "config_db": make_scale_config_db(),
+            "changes": {
+                "SSH_ONLY|RULE_NEW": {
+                    "PACKET_ACTION": "DROP",
+                    "PRIORITY": "10002",
+                    "SRC_IP": "192.168.0.0/24"
+                }
+            },
+            "removed": [],
+            "expected_delta": [
+                ['iptables', '-I', 'INPUT', '10005', '-p', 'tcp', '-s', '192.168.0.0/24', '--dport', '22', '-j', 'DROP']
+            ]
+        }
+    ],
+    [
+        "Remove one rule",
+        {
+            "config_db": make_scale_config_db(),
+            "changes": {},
+            "removed": ["SSH_ONLY|RULE_9999"],
+            "expected_delta": [
+                ['iptables', '-D', 'INPUT', '8897']
+            ]
+        }
+    ]
+]
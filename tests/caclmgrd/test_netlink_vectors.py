@@ -0,0 +1,204 @@
+"""
+    caclmgrd netlink address reader and iptables-save parser test vector
+"""
+
+# Replies and notifications captured from the NETLINK_ROUTE socket of a
+# namespace with interfaces lo, ifb0, ifb1 and eth0
+
+# RTM_GETLINK dump: RTM_NEWLINK messages followed by NLMSG_DONE
+NETLINK_GETLINK_DUMP = bytes.fromhex(
+    "bc0500001000020001000000da34000000000403010000004900010000000000070003006c6f000008000d00e8030000"
+    "050010000000000005001100000000000500430001000000080004000000010008003200000000000800330000000000"
+    "08001b000000000008001e000000000008003d000000000008001f000100000008002800ffff00000800290000000100"
+    "08003a000000010008003f0000000100080040000000010008003b00f8ff070008003c00ffff00000800420000000000"
+    "08002000010000000500210001000000080023000000000008002f000000000008003000000000000600440000000000"
+    "060045000000000005002700000000000a00010000000000000000000a0002000000000000000000cc001700ba1e0000"
+    "00000000ba1e000000000000c8cae30300000000c8cae303000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "0000000064000700ba1e0000ba1e0000c8cae303c8cae303000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000c002b0005000200000000000c0006006e6f71756575650030031a008c0002008800010000000000"
+    "000000000000000001000000010000000100000001000000000000000100000000000000000000000000000000000000"
+    "000000000100000001000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "0000000010270000e80300000000000000000000000000000000000001000000a0020a00080001000000008014000500"
+    "ffff00000c000000d0940000e8030000f400020000000000400000000000010001000000010000000100000001000000"
+    "ffffffffa00f0000e8030000ffffffff803a090080510100030000005802000010000000000000000100000001000000"
+    "0100000060ea0000000000000000000000000000000000000000000000000000ffffffff000000000000000010270000"
+    "e80300000100000000000000000000000100000000000000000000000100000000000000000000000000000000000000"
+    "80ee360000000000000000000100000000000000000000000000000000000000000000000004000000000000ffff0000"
+    "ffffffff0100000000000000000000000000000034010300260000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000003c00060007000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000001400070000000000000000000000000000000000050008000000000024000e00000000000000000000000000"
+    "000000000000000000000000000000000000000004003e8004004180cc0500001000020001000000da34000000000100"
+    "02000000820000000000000009000300696662300000000008000d002000000005001000020000000500110000000000"
+    "050043000000000008000400dc0500000800320000000000080033000000000008001b000000000008001e0000000000"
+    "08003d000000000008001f000100000008002800ffff0000080029000000010008003a000000010008003f0000000100"
+    "080040000000010008003b00f8ff070008003c00ffff0000080042000000000008002000010000000500210001000000"
+    "080023000000000008002f00000000000800300000000000060044000000000006004500000000000500270000000000"
+    "0a0001001e8e6fac83a100000a000200ffffffffffff0000cc0017000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000640007000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000c002b0005000200"
+    "000000000c0012000800010069666200090006006e6f6f700000000030031a008c000200880001000000000000000000"
+    "000000000100000001000000010000000100000000000000010000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "10270000e80300000000000000000000000000000000000001000000a0020a00080001000000000014000500ffff0000"
+    "0a00000050a50000e8030000f40002000000000040000000dc05000001000000010000000100000001000000ffffffff"
+    "a00f0000e803000000000000803a09008051010003000000580200001000000000000000010000000100000001000000"
+    "60ea0000000000000000000000000000000000000000000000000000ffffffff000000000000000010270000e8030000"
+    "010000000000000000000000010000000000000000000000010000000000000000000000000000000000000080ee3600"
+    "00000000000000000100000000000000000000000000000000000000000000000004000000000000ffff0000ffffffff"
+    "010000000000000000000000000000003401030026000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000000000003c0006000700000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "1400070000000000000000000000000000000000050008000000000024000e0000000000000000000000000000000000"
+    "0000000000000000000000000000000004003e8004004180cc0500001000020001000000da3400000000010003000000"
+    "820000000000000009000300696662310000000008000d00200000000500100002000000050011000000000005004300"
+    "0000000008000400dc0500000800320000000000080033000000000008001b000000000008001e000000000008003d00"
+    "0000000008001f000100000008002800ffff0000080029000000010008003a000000010008003f000000010008004000"
+    "0000010008003b00f8ff070008003c00ffff000008004200000000000800200001000000050021000100000008002300"
+    "0000000008002f000000000008003000000000000600440000000000060045000000000005002700000000000a000100"
+    "3ee905c0cc6e00000a000200ffffffffffff0000cc001700000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000064000700000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000000000000c002b000500020000000000"
+    "0c0012000800010069666200090006006e6f6f700000000030031a008c00020088000100000000000000000000000000"
+    "010000000100000001000000010000000000000001000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000010270000"
+    "e80300000000000000000000000000000000000001000000a0020a00080001000000000014000500ffff00000a000000"
+    "b4400000e8030000f40002000000000040000000dc05000001000000010000000100000001000000ffffffffa00f0000"
+    "e803000000000000803a0900805101000300000058020000100000000000000001000000010000000100000060ea0000"
+    "000000000000000000000000000000000000000000000000ffffffff000000000000000010270000e803000001000000"
+    "0000000000000000010000000000000000000000010000000000000000000000000000000000000080ee360000000000"
+    "000000000100000000000000000000000000000000000000000000000004000000000000ffff0000ffffffff01000000"
+    "000000000000000000000000340103002600000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000000000000000000000000000003c000600070000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000014000700"
+    "00000000000000000000000000000000050008000000000024000e000000000000000000000000000000000000000000"
+    "00000000000000000000000004003e8004004180e80500001000020001000000da340000000001000400000043100100"
+    "0000000009000300657468300000000008000d00e8030000050010000600000005001100000000000500430000000000"
+    "0800040078050000080032004400000008003300ffff000008001b000000000008001e000000000008003d0000000000"
+    "08001f000100000008002800ffff0000080029000000010008003a000000010008003f00000001000800400000000100"
+    "08003b000000010008003c00ffff00000800420000000000080020000100000005002100010000000800230002000000"
+    "08002f00010000000800300001000000060044000c000000060045000000000005002700000000000a00010002fc0000"
+    "000100000a000200ffffffffffff0000cc001700bc010000000000008601000000000000c14f7100000000009da30000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000064000700bc01000086010000c14f71009da30000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000000000000000000000000000000c002b0005000200000000000a003600"
+    "02fc0000000100000f000600706669666f5f66617374000030031a008c00020088000100000000000000000000000000"
+    "010000000100000001000000010000000000000001000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000010270000"
+    "e80300000000000000000000000000000000000001000000a0020a00080001000000008014000500ffff00000c000000"
+    "043d0000e8030000f400020000000000400000007805000000000000010000000100000001000000ffffffffa00f0000"
+    "e803000000000000803a0900805101000300000058020000100000000000000001000000010000000100000060ea0000"
+    "00000000000000000000000000000000000000000000000001000000000000000000000010270000e803000001000000"
+    "0000000000000000010000000000000000000000010000000000000000000000000000000000000080ee360000000000"
+    "000000000100000000000000000000000000000000000000000000000004000000000000ffff0000ffffffff01000000"
+    "0000000000000000000000003401030026000000000000000300000000000000e0000000000000000000000000000000"
+    "030000000000000000000000000000000000000000000000000000000000000005000000000000000500000000000000"
+    "c80100000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"
+    "0300000000000000050000000000000000000000000000000000000000000000e000000000000000c801000000000000"
+    "00000000000000000000000000000000000000000000000000000000000000003c000600070000000000000000000000"
+    "000000000000000000000000050000000000000000000000000000000000000000000000000000000000000014000700"
+    "00000000000000000000000000000000050008000000000024000e000000000000000000000000000000000000000000"
+    "0000000000000000000000000c00380076697274696f33000b00390076697274696f000004003e800400418014000000"
+    "0300020001000000da34000000000000"
+)
+
+# RTM_GETADDR dump: RTM_NEWADDR messages followed by NLMSG_DONE
+NETLINK_GETADDR_DUMP = bytes.fromhex(
+    "4c0000001400020002000000da340000020880fe01000000080001007f000001080002007f000001070003006c6f0000"
+    "080008008000000014000600ffffffffffffffff0c0000000c000000580000001400020002000000da34000002188000"
+    "0400000008000100c000020208000200c000020208000400c00002ff0900030065746830000000000800080080000000"
+    "14000600ffffffffffffffff0c0000000c000000500000001400020002000000da3400000a8080fe0100000014000100"
+    "0000000000000000000000000000000114000600ffffffffffffffff0c0000000c000000080008008000000005000b00"
+    "01000000480000001400020002000000da3400000a4082000400000014000100fd000000000000000000000000000002"
+    "14000600ffffffffffffffff0c0000000c0000000800080082000000500000001400020002000000da3400000a4080fd"
+    "0400000014000100fe8000000000000000fc00fffe00000114000600ffffffffffffffff0c0000000c00000008000800"
+    "8000000005000b0003000000140000000300020002000000da34000000000000"
+)
+
+# RTMGRP_IPV4_IFADDR notification of 'ip addr add 127.0.0.2/8 dev lo'
+NETLINK_NEWADDR_NOTIFICATION = bytes.fromhex(
+    "4c00000014000000580dd56a0f350000020881fe01000000080001007f000002080002007f000002070003006c6f0000"
+    "080008008100000014000600ffffffffffffffffc6d00500c6d00500"
+)
+
+# RTMGRP_IPV4_IFADDR notification of 'ip addr del 127.0.0.2/8 dev lo'
+NETLINK_DELADDR_NOTIFICATION = bytes.fromhex(
+    "4c00000015000000580dd56a10350000020881fe01000000080001007f000002080002007f000002070003006c6f0000"
+    "080008008100000014000600ffffffffffffffffc6d00500c6d00500"
+)
+
+NETLINK_EXPECTED_LINKS = {1: "lo", 2: "ifb0", 3: "ifb1", 4: "eth0"}
+
+# (interface name, address, scope) tuples of NETLINK_GETADDR_DUMP
+NETLINK_EXPECTED_ADDRESSES = [
+    ("lo", "127.0.0.1/8", 254),
+    ("eth0", "192.0.2.2/24", 0),
+    ("lo", "::1/128", 254),
+    ("eth0", "fd00::2/64", 0),
+    ("eth0", "fe80::fc:ff:fe00:1/64", 253),
+]
+
+# iptables-save -c output of a dual-ToR switch's filter table
+IPTABLES_SAVE_FILTER = """# Generated by iptables-save v1.8.7 on Mon Jan  1 00:00:00 2024
+*filter
+:INPUT ACCEPT [0:0]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [4200:336000]
+:CTRLPLANE_ACL_G3 - [0:0]
+:DHCP - [0:0]
+[5100:408000] -A INPUT -j CTRLPLANE_ACL_G3
+[12:960] -A CTRLPLANE_ACL_G3 -s 127.0.0.1/32 -i lo -j ACCEPT
+[0:0] -A CTRLPLANE_ACL_G3 -p udp -m udp --dport 67 -j DHCP
+[0:0] -A CTRLPLANE_ACL_G3 -p tcp -m tcp --dport 22 -m comment --comment "SSH_ONLY RULE_1" -j ACCEPT
+[0:0] -A DHCP -m physdev --physdev-in Ethernet4 -j DROP
+[0:0] -A DHCP -j RETURN
+COMMIT
+# Completed on Mon Jan  1 00:00:00 2024
+"""
+
+IPTABLES_SAVE_FILTER_EXPECTED = {
+    "INPUT": [["-j", "CTRLPLANE_ACL_G3"]],
+    "FORWARD": [],
+    "OUTPUT": [],
+    "CTRLPLANE_ACL_G3": [
+        ["-s", "127.0.0.1/32", "-i", "lo", "-j", "ACCEPT"],
+        ["-p", "udp", "-m", "udp", "--dport", "67", "-j", "DHCP"],
+        ["-p", "tcp", "-m", "tcp", "--dport", "22", "-m", "comment", "--comment", "SSH_ONLY RULE_1", "-j", "ACCEPT"],
+    ],
+    "DHCP": [
+        ["-m", "physdev", "--physdev-in", "Ethernet4", "-j", "DROP"],
+        ["-j", "RETURN"],
+    ],
+}
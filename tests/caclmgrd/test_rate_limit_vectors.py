@@ -0,0 +1,110 @@
+"""
+    caclmgrd control plane rate policy test vector
+"""
+
+
+def make_rate_limit_config_db(rate_limit_policies, services=("SSH",)):
+    return {
+        "ACL_TABLE": {
+            "MGMT_ONLY": {
+                "stage": "INGRESS",
+                "type": "CTRLPLANE",
+                "policy_desc": "MGMT_ONLY",
+                "services": list(services)
+            }
+        },
+        "ACL_RULE": {
+            "MGMT_ONLY|RULE_1": {
+                "L4_DST_PORT": "8081",
+                "PACKET_ACTION": "ACCEPT",
+                "PRIORITY": "9999",
+                "SRC_IP": "10.0.0.0/24"
+            },
+            "MGMT_ONLY|DEFAULT_RULE": {
+                "ETHER_TYPE": "2048",
+                "PACKET_ACTION": "DROP",
+                "PRIORITY": "1"
+            }
+        },
+        "CTRLPLANE_RATE_LIMIT": rate_limit_policies,
+        "DEVICE_METADATA": {
+            "localhost": {
+            }
+        },
+        "FEATURE": {},
+    }
+
+
+CACLMGRD_RATE_LIMIT_TEST_VECTOR = [
+    [
+        "Per source and aggregate rate policies",
+        {
+            "config_db": make_rate_limit_config_db({
+                "SSH": {
+                    "pps": "50",
+                    "burst": "100",
+                    "mode": "per_source"
+                },
+                "SNMP": {
+                    "pps": "200",
+                    "mode": "aggregate"
+                }
+            }),
+            "expected_commands": [
+                ['iptables', '-A', 'INPUT', '-p', 'tcp', '--dport', '161', '-m', 'conntrack', '--ctstate', 'NEW', '-m', 'hashlimit', '--hashlimit-above', '200/sec',
+                 '--hashlimit-name', 'CACL_aa346ca4c0', '-j', 'DROP'],
+                ['iptables', '-A', 'INPUT', '-p', 'udp', '--dport', '161', '-m', 'conntrack', '--ctstate', 'NEW', '-m', 'hashlimit', '--hashlimit-above', '200/sec',
+                 '--hashlimit-name', 'CACL_aa346ca4c0', '-j', 'DROP'],
+                ['ip6tables', '-A', 'INPUT', '-p', 'tcp', '--dport', '161', '-m', 'conntrack', '--ctstate', 'NEW', '-m', 'hashlimit', '--hashlimit-above', '200/sec',
+                 '--hashlimit-name', 'CACL_aa346ca4c0', '-j', 'DROP'],
+                ['ip6tables', '-A', 'INPUT', '-p', 'udp', '--dport', '161', '-m', 'conntrack', '--ctstate', 'NEW', '-m', 'hashlimit', '--hashlimit-above', '200/sec',
+                 '--hashlimit-name', 'CACL_aa346ca4c0', '-j', 'DROP'],
+                ['iptables', '-A', 'INPUT', '-p', 'tcp', '--dport', '22', '-m', 'conntrack', '--ctstate', 'NEW', '-m', 'hashlimit', '--hashlimit-above', '50/sec',
+                 '--hashlimit-burst', '100', '--hashlimit-mode', 'srcip', '--hashlimit-name', 'CACL_261c65c9e5', '-j', 'DROP'],
+                ['ip6tables', '-A', 'INPUT', '-p', 'tcp', '--dport', '22', '-m', 'conntrack', '--ctstate', 'NEW', '-m', 'hashlimit', '--hashlimit-above', '50/sec',
+                 '--hashlimit-burst', '100', '--hashlimit-mode', 'srcip', '--hashlimit-name', 'CACL_261c65c9e5', '-j', 'DROP'],
+            ],
+        }
+    ],
+    [
+        "Rate policy of EXTERNAL_CLIENT ports",
+        {
+            "config_db": make_rate_limit_config_db({
+                "EXTERNAL_CLIENT": {
+                    "pps": "1000"
+                }
+            }, services=("EXTERNAL_CLIENT",)),
+            "expected_commands": [
+                ['iptables', '-A', 'INPUT', '-p', 'tcp', '--dport', '8081', '-m', 'conntrack', '--ctstate', 'NEW', '-m', 'hashlimit', '--hashlimit-above', '1000/sec',
+                 '--hashlimit-mode', 'srcip', '--hashlimit-name', 'CACL_79fafbac85', '-j', 'DROP'],
+                ['ip6tables', '-A', 'INPUT', '-p', 'tcp', '--dport', '8081', '-m', 'conntrack', '--ctstate', 'NEW', '-m', 'hashlimit', '--hashlimit-above', '1000/sec',
+                 '--hashlimit-mode', 'srcip', '--hashlimit-name', 'CACL_79fafbac85', '-j', 'DROP'],
+            ],
+        }
+    ],
+    [
+        "Invalid rate policies",
+        {
+            "config_db": make_rate_limit_config_db({
+                "SSH": {
+                    "pps": "0"
+                },
+                "SNMP": {
+                    "pps": "100",
+                    "mode": "per_destination"
+                },
+                "NTP": {
+                    "burst": "10"
+                },
+                "ANY": {
+                    "pps": "100",
+                    "rate": "100"
+                },
+                "TELNET": {
+                    "pps": "100"
+                }
+            }),
+            "expected_commands": [],
+        }
+    ],
+]
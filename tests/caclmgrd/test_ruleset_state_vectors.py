@@ -0,0 +1,102 @@
+"""
+    caclmgrd installed ruleset state test vector
+"""
+
+# iptables-save/ip6tables-save outputs of a namespace where the ruleset applied
+# by the previous run of caclmgrd is still installed
+IPTABLES_SAVE_MATCHING = {
+    "iptables-save": """# Generated by iptables-save v1.8.7 on Mon Jan  1 00:00:00 2024
+*filter
+:INPUT ACCEPT [1200:96000]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [1100:88000]
+:CTRLPLANE_ACL_G1 - [0:0]
+-A INPUT -j CTRLPLANE_ACL_G1
+-A CTRLPLANE_ACL_G1 -s 127.0.0.1/32 -i lo -j ACCEPT
+-A CTRLPLANE_ACL_G1 -m conntrack --ctstate RELATED,ESTABLISHED -j ACCEPT
+-A CTRLPLANE_ACL_G1 -s 10.0.0.0/24 -p tcp -m tcp --dport 22 -j ACCEPT
+-A CTRLPLANE_ACL_G1 -s 10.0.1.0/24 -p tcp -m tcp --dport 22 -j ACCEPT
+-A CTRLPLANE_ACL_G1 -p tcp -m tcp --dport 22 -j DROP
+-A CTRLPLANE_ACL_G1 -j DROP
+COMMIT
+# Completed on Mon Jan  1 00:00:00 2024
+""",
+    "ip6tables-save": """# Generated by ip6tables-save v1.8.7 on Mon Jan  1 00:00:00 2024
+*raw
+:PREROUTING ACCEPT [300:24000]
+:OUTPUT ACCEPT [300:24000]
+-A PREROUTING -p ipv6-icmp -j NOTRACK
+-A OUTPUT -p ipv6-icmp -j NOTRACK
+COMMIT
+*filter
+:INPUT ACCEPT [300:24000]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [300:24000]
+:CTRLPLANE_ACL_G1 - [0:0]
+-A INPUT -j CTRLPLANE_ACL_G1
+-A CTRLPLANE_ACL_G1 -s ::1/128 -i lo -j ACCEPT
+-A CTRLPLANE_ACL_G1 -m conntrack --ctstate RELATED,ESTABLISHED -j ACCEPT
+-A CTRLPLANE_ACL_G1 -j DROP
+COMMIT
+# Completed on Mon Jan  1 00:00:00 2024
+""",
+}
+
+# Same ruleset, saved later: only the packet counters moved
+IPTABLES_SAVE_COUNTERS_MOVED = {
+    "iptables-save": IPTABLES_SAVE_MATCHING["iptables-save"].replace("[1200:96000]", "[5400:432000]"),
+    "ip6tables-save": IPTABLES_SAVE_MATCHING["ip6tables-save"].replace("[300:24000]", "[900:72000]"),
+}
+
+# A rule of the active generation was deleted by hand
+IPTABLES_SAVE_DRIFTED = {
+    "iptables-save": IPTABLES_SAVE_MATCHING["iptables-save"].replace(
+        "-A CTRLPLANE_ACL_G1 -s 10.0.1.0/24 -p tcp -m tcp --dport 22 -j ACCEPT\n", ""),
+    "ip6tables-save": IPTABLES_SAVE_MATCHING["ip6tables-save"],
+}
+
+# The rules are gone, e.g. after a reboot
+IPTABLES_SAVE_MISSING = {
+    "iptables-save": """# Generated by iptables-save v1.8.7 on Mon Jan  1 00:00:00 2024
+*filter
+:INPUT ACCEPT [0:0]
+:FORWARD ACCEPT [0:0]
+:OUTPUT ACCEPT [0:0]
+COMMIT
+# Completed on Mon Jan  1 00:00:00 2024
+""",
+    "ip6tables-save": "",
+}
+
+CACLMGRD_RULESET_STATE_TEST_VECTOR = [
+    [
+        "Installed rules match",
+        {
+            "iptables_save": IPTABLES_SAVE_MATCHING,
+            "expect_apply": False,
+        }
+    ],
+    [
+        "Installed rules match with different counters",
+        {
+            "iptables_save": IPTABLES_SAVE_COUNTERS_MOVED,
+            "expect_apply": False,
+        }
+    ],
+    [
+        "Installed rules drifted",
+        {
+            "iptables_save": IPTABLES_SAVE_DRIFTED,
+            "expect_apply": True,
+            "expected_generation": "2",
+        }
+    ],
+    [
+        "Installed rules missing",
+        {
+            "iptables_save": IPTABLES_SAVE_MISSING,
+            "expect_apply": True,
+            "expected_generation": "1",
+        }
+    ],
+]
@@ -799,206 +799,206 @@ CACLMGRD_SCALE_TEST_VECTOR = [
     },
             },
             "expected_subprocess_calls": [
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::2/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::3/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::4/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::5/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::6/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::7/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::8/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::9/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::10/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::11/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::12/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::13/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::14/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::15/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::16/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::17/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::18/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::19/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::20/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::21/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::22/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::23/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::24/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::25/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::26/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::27/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::28/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::29/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::30/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::31/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::32/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::33/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::34/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::35/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::36/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::37/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::38/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::39/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::40/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::41/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::42/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::43/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::44/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::45/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::46/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::47/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::48/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::49/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::50/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::51/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::2/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::2/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::3/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::3/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::4/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::4/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::5/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::5/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::6/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::6/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::7/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::7/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::8/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::8/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::9/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::9/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::10/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::10/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::11/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::11/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::12/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::12/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::13/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::13/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::14/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::14/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::15/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::15/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::16/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::16/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::17/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::17/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::18/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::18/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::19/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::19/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::20/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::20/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::21/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::21/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::22/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::22/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::23/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::23/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::24/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::24/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::25/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::25/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::26/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::26/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::27/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::27/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::28/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::28/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::29/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::29/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::30/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::30/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::31/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::31/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::32/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::32/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::33/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::33/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::34/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::34/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::35/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::35/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::36/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::36/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::37/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::37/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::38/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::38/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::39/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::39/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::40/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::40/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::41/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::41/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::42/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::42/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::43/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::43/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::44/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::44/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::45/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::45/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::46/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::46/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::47/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::47/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::48/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::48/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::49/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::49/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::50/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::50/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::51/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'udp', '-s', '2001::51/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::2/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::3/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::4/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::5/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::6/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::7/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::8/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::9/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::10/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::11/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::12/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::13/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::14/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::15/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::16/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::17/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::18/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::19/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::20/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::21/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::22/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::23/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::24/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::25/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::26/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::27/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::28/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::29/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::30/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::31/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::32/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::33/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::34/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::35/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::36/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::37/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::38/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::39/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::40/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::41/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::42/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::43/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::44/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::45/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::46/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::47/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::48/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::49/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::50/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
-                call(['ip6tables', '-A', 'INPUT', '-p', 'tcp', '-s', '2001::51/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE)
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::2/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::3/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::4/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::5/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::6/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::7/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::8/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::9/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::10/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::11/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::12/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::13/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::14/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::15/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::16/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::17/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::18/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::19/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::20/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::21/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::22/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::23/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::24/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::25/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::26/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::27/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::28/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::29/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::30/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::31/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::32/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::33/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::34/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::35/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::36/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::37/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::38/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::39/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::40/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::41/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::42/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::43/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::44/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::45/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::46/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::47/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::48/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::49/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::50/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::51/128', '--dport', '123', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::2/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::2/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::3/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::3/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::4/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::4/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::5/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::5/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::6/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::6/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::7/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::7/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::8/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::8/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::9/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::9/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::10/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::10/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::11/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::11/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::12/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::12/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::13/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::13/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::14/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::14/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::15/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::15/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::16/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::16/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::17/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::17/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::18/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::18/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::19/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::19/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::20/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::20/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::21/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::21/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::22/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::22/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::23/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::23/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::24/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::24/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::25/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::25/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::26/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::26/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::27/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::27/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::28/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::28/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::29/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::29/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::30/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::30/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::31/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::31/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::32/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::32/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::33/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::33/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::34/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::34/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::35/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::35/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::36/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::36/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::37/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::37/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::38/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::38/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::39/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::39/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::40/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::40/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::41/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::41/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::42/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::42/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::43/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::43/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::44/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::44/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::45/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::45/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::46/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::46/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::47/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::47/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::48/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::48/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::49/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::49/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::50/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::50/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::51/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'udp', '-s', '2001::51/128', '--dport', '161', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::2/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::3/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::4/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::5/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::6/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::7/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::8/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::9/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::10/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::11/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::12/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::13/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::14/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::15/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::16/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::17/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::18/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::19/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::20/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::21/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::22/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::23/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::24/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::25/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::26/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::27/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::28/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::29/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::30/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::31/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::32/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::33/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::34/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::35/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::36/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::37/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::38/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::39/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::40/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::41/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::42/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::43/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::44/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::45/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::46/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::47/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::48/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::49/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::50/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE),
+                call(['ip6tables', '-A', 'CTRLPLANE_ACL_G1', '-p', 'tcp', '-s', '2001::51/128', '--dport', '22', '-j', 'DROP'], universal_newlines=True, stdout=subprocess.PIPE)
             ],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
@@ -1007,3 +1007,112 @@ CACLMGRD_SCALE_TEST_VECTOR = [
         }
     ]
 ]
+
+
+def make_external_client_config_db(acl_rules):
+    return {
+        "ACL_TABLE": {
+            "EXTERNAL_CLIENT_ACL": {
+                "stage": "INGRESS",
+                "type": "CTRLPLANE",
+                "services": [
+                    "EXTERNAL_CLIENT"
+                ]
+            }
+        },
+        "ACL_RULE": acl_rules,
+        "DEVICE_METADATA": {
+            "localhost": {
+            }
+        },
+        "FEATURE": {},
+    }
+
+
+EXTERNAL_CLIENT_DEFAULT_RULE = {
+    "EXTERNAL_CLIENT_ACL|DEFAULT_RULE": {
+        "ETHER_TYPE": "2048",
+        "PACKET_ACTION": "DROP",
+        "PRIORITY": "1"
+    }
+}
+
+"""
+    caclmgrd EXTERNAL_CLIENT port range scale test vector
+    "expected_ports" maps (source, action) to the set of destination ports matched
+"""
+CACLMGRD_PORT_RANGE_SCALE_TEST_VECTOR = [
+    [
+        "WIDE_PORT_RANGE_TEST",
+        {
+            "config_db": make_external_client_config_db(dict(EXTERNAL_CLIENT_DEFAULT_RULE, **{
+                "EXTERNAL_CLIENT_ACL|RULE_1": {
+                    "L4_DST_PORT_RANGE": "1024-65535",
+                    "PACKET_ACTION": "ACCEPT",
+                    "PRIORITY": "9999",
+                    "SRC_IP": "20.0.0.55/32"
+                }
+            })),
+            "expected_rule_count": 2,
+            "expected_ports": {
+                ("20.0.0.55/32", "ACCEPT"): set(range(1024, 65536)),
+                (None, "DROP"): set(range(1024, 65536)),
+            },
+        }
+    ],
+    [
+        "SPARSE_PORTS_TEST",
+        {
+            "config_db": make_external_client_config_db(dict(EXTERNAL_CLIENT_DEFAULT_RULE, **{
+                "EXTERNAL_CLIENT_ACL|RULE_{}".format(idx): {
+                    "L4_DST_PORT": str(10000 + 3 * idx),
+                    "PACKET_ACTION": "ACCEPT",
+                    "PRIORITY": str(9999 - idx),
+                    "SRC_IP": "20.0.0.55/32"
+                } for idx in range(40)
+            })),
+            "expected_rule_count": 6,
+            "expected_ports": {
+                ("20.0.0.55/32", "ACCEPT"): set(range(10000, 10120, 3)),
+                (None, "DROP"): set(range(10000, 10120, 3)),
+            },
+        }
+    ],
+    [
+        "ADJACENT_AND_OVERLAPPING_RANGES_TEST",
+        {
+            "config_db": make_external_client_config_db(dict(EXTERNAL_CLIENT_DEFAULT_RULE, **{
+                "EXTERNAL_CLIENT_ACL|RULE_{}".format(idx): {
+                    "L4_DST_PORT_RANGE": "{}-{}".format(8000 + 10 * idx, 8000 + 10 * idx + (14 if idx % 2 else 9)),
+                    "PACKET_ACTION": "ACCEPT",
+                    "PRIORITY": str(9999 - idx),
+                    "SRC_IP": "20.0.0.55/32"
+                } for idx in range(100)
+            })),
+            "expected_rule_count": 2,
+            "expected_ports": {
+                ("20.0.0.55/32", "ACCEPT"): set(range(8000, 9005)),
+                (None, "DROP"): set(range(8000, 9005)),
+            },
+        }
+    ],
+    [
+        "INTERLEAVED_SOURCES_TEST",
+        {
+            "config_db": make_external_client_config_db(dict(EXTERNAL_CLIENT_DEFAULT_RULE, **{
+                "EXTERNAL_CLIENT_ACL|RULE_{}".format(idx): {
+                    "L4_DST_PORT_RANGE": "{}-{}".format(8000 + 100 * idx, 8099 + 100 * idx),
+                    "PACKET_ACTION": "ACCEPT",
+                    "PRIORITY": str(9999 - idx),
+                    "SRC_IP": "20.0.0.{}/32".format(idx % 2)
+                } for idx in range(20)
+            })),
+            "expected_rule_count": 21,
+            "expected_ports": {
+                ("20.0.0.0/32", "ACCEPT"): set(port for idx in range(0, 20, 2) for port in range(8000 + 100 * idx, 8100 + 100 * idx)),
+                ("20.0.0.1/32", "ACCEPT"): set(port for idx in range(1, 20, 2) for port in range(8000 + 100 * idx, 8100 + 100 * idx)),
+                (None, "DROP"): set(range(8000, 10000)),
+            },
+        }
+    ],
+]
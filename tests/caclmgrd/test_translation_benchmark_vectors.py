@@ -0,0 +1,90 @@
+"""
+    caclmgrd translation benchmark test vector
+"""
+
+NUM_BENCHMARK_TABLES = 200
+NUM_BENCHMARK_RULES_PER_TABLE = 50
+
+BENCHMARK_SERVICES = [
+    ["SSH"],
+    ["SNMP"],
+    ["NTP"],
+    ["SSH", "SNMP"],
+    ["EXTERNAL_CLIENT"],
+    ["ANY"],
+]
+
+
+def make_benchmark_config_db(num_tables=NUM_BENCHMARK_TABLES, num_rules=NUM_BENCHMARK_RULES_PER_TABLE):
+    acl_tables = {}
+    acl_rules = {}
+    for table_idx in range(num_tables):
+        table_name = "CACL_{}".format(table_idx)
+        services = BENCHMARK_SERVICES[table_idx % len(BENCHMARK_SERVICES)]
+        ipv6 = table_idx % 3 == 2
+        acl_tables[table_name] = {
+            "stage": "INGRESS",
+            "type": "CTRLPLANE",
+            "policy_desc": table_name,
+            "services": services
+        }
+        for rule_idx in range(num_rules):
+            rule_props = {
+                "PACKET_ACTION": "DROP" if rule_idx % 7 == 3 else "ACCEPT",
+                "PRIORITY": str(9999 - rule_idx),
+            }
+            if ipv6:
+                rule_props["SRC_IPV6"] = "2001:{:x}::{:x}/128".format(table_idx, rule_idx)
+            else:
+                rule_props["SRC_IP"] = "10.{}.{}.0/24".format(table_idx, rule_idx)
+            if rule_idx % 5 == 1:
+                rule_props["TCP_FLAGS"] = "0x02/0x12"
+            if rule_idx % 9 == 4:
+                rule_props["IN_PORTS"] = "eth0"
+            if "EXTERNAL_CLIENT" in services:
+                rule_props["L4_DST_PORT_RANGE" if rule_idx % 2 else "L4_DST_PORT"] = \
+                    "{}-{}".format(8000 + rule_idx * 10, 8004 + rule_idx * 10) if rule_idx % 2 else str(9000 + rule_idx)
+            acl_rules["{}|RULE_{}".format(table_name, rule_idx)] = rule_props
+
+        # Rules for the wrong IP version or without a priority are ignored
+        acl_rules["{}|RULE_OTHER_VERSION".format(table_name)] = {
+            "PACKET_ACTION": "ACCEPT",
+            "PRIORITY": "5",
+            "SRC_IP" if ipv6 else "SRC_IPV6": "30.0.0.1/32" if ipv6 else "2001::1/128"
+        }
+        acl_rules["{}|RULE_NO_PRIORITY".format(table_name)] = {
+            "PACKET_ACTION": "ACCEPT"
+        }
+        acl_rules["{}|DEFAULT_RULE".format(table_name)] = {
+            "ETHER_TYPE": "34525" if ipv6 else "2048",
+            "PACKET_ACTION": "DROP",
+            "PRIORITY": "1"
+        }
+
+    acl_tables["DATA_ACL"] = {
+        "stage": "INGRESS",
+        "type": "L3",
+        "policy_desc": "DATA_ACL",
+    }
+    acl_rules["DATA_ACL|RULE_1"] = {
+        "PACKET_ACTION": "DROP",
+        "PRIORITY": "10",
+        "SRC_IP": "40.0.0.0/8"
+    }
+
+    return {
+        "ACL_TABLE": acl_tables,
+        "ACL_RULE": acl_rules,
+        "DEVICE_METADATA": {
+            "localhost": {
+            }
+        },
+        "FEATURE": {},
+    }
+
+
+# Fingerprint of the translation of make_benchmark_config_db() by the
+# translator which rescanned every rule for each table and service: the number
+# of commands and the sha256 of the commands joined by newlines
+BENCHMARK_EXPECTED_NUM_COMMANDS = 16202
+BENCHMARK_EXPECTED_SHA256 = "430370e521619875507d671f122a47dd32fde32577c2399b7d20ae813fcb4e44"
@@ -28,6 +28,8 @@ CACLMGRD_VXLAN_TEST_VECTOR = [
             "expected_del_subprocess_calls": [
                 call(['iptables', '-D', 'INPUT', '-p', 'udp', '-d', '10.1.1.1', '--dport', '4789', '-j', 'ACCEPT', '!', '-i', 'eth0'], universal_newlines=True, stdout=subprocess.PIPE)
             ],
+            "expected_apply_subprocess_calls": [
+                call(['iptables', '-I', 'CTRLPLANE_ACL_G1', '2', '-p', 'udp', '-d', '10.1.1.1', '--dport', '4789', '-j', 'ACCEPT', '!', '-i', 'eth0'], universal_newlines=True, stdout=subprocess.PIPE)],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
@@ -57,6 +59,8 @@ CACLMGRD_VXLAN_TEST_VECTOR = [
             "expected_del_subprocess_calls": [
                 call(['ip6tables', '-D', 'INPUT', '-p', 'udp', '-d', '2001::1', '--dport', '4789', '-j', 'ACCEPT', '!', '-i', 'eth0'], universal_newlines=True, stdout=subprocess.PIPE)
             ],
+            "expected_apply_subprocess_calls": [
+                call(['ip6tables', '-I', 'CTRLPLANE_ACL_G1', '2', '-p', 'udp', '-d', '2001::1', '--dport', '4789', '-j', 'ACCEPT', '!', '-i', 'eth0'], universal_newlines=True, stdout=subprocess.PIPE)],
             "popen_attributes": {
                 'communicate.return_value': ('output', 'error'),
             },
@@ -0,0 +1,55 @@
+class MockIptables(object):
+    """
+        Mock iptables/ip6tables of the default namespace which keeps the rules
+        the issued commands leave behind and lists them back
+    """
+    BUILTIN_CHAINS = {
+        'filter': ['INPUT', 'FORWARD', 'OUTPUT'],
+        'nat': ['PREROUTING', 'INPUT', 'OUTPUT', 'POSTROUTING'],
+        'raw': ['PREROUTING', 'OUTPUT'],
+    }
+
+    def __init__(self, ruleset_class):
+        self.ruleset = ruleset_class()
+
+    def run_commands_batch(self, commands):
+        for cmd in commands:
+            if 'iptables' in cmd or 'ip6tables' in cmd:
+                self.ruleset.apply_command(cmd)
+        return []
+
+    def get_chains(self, binary, table):
+        chains = dict((chain, []) for chain in self.BUILTIN_CHAINS[table])
+        chains.update(self.ruleset.chains.get((binary, table), {}))
+        return chains
+
+    def list_rules(self, binary):
+        lines = []
+        for chain, rules in self.get_chains(binary, 'filter').items():
+            if chain in self.BUILTIN_CHAINS['filter']:
+                lines.append('-P {} {}'.format(chain, self.ruleset.policies.get((binary, 'filter', chain), 'ACCEPT')))
+            else:
+                lines.append('-N {}'.format(chain))
+        for chain, rules in self.get_chains(binary, 'filter').items():
+            lines += ['-A {} {}'.format(chain, ' '.join(rule)) for rule in rules]
+        return '\n'.join(lines)
+
+    def save(self, binary):
+        lines = []
+        for table in sorted(self.BUILTIN_CHAINS):
+            lines.append('*' + table)
+            chains = self.get_chains(binary, table)
+            for chain in chains:
+                lines.append(':{} {} [0:0]'.format(chain, self.ruleset.policies.get((binary, table, chain), '-')))
+            for chain, rules in chains.items():
+                lines += ['-A {} {}'.format(chain, ' '.join(rule)) for rule in rules]
+            lines.append('COMMIT')
+        return '\n'.join(lines)
+
+    def run_commands(self, commands):
+        cmd = commands[0]
+        if cmd[-1] == '-S':
+            return self.list_rules(cmd[-2])
+        if cmd[-1] in ('iptables-save', 'ip6tables-save'):
+            return self.save(cmd[-1][:-len('-save')])
+        return ""
@@ -0,0 +1,36 @@
+class MockSystemdBus(object):
+    """
+        Mock systemd Manager D-Bus connection which records the issued jobs
+    """
+    JOB_METHODS = ['StartUnit', 'StopUnit', 'RestartUnit', 'ReloadUnit', 'ReloadOrRestartUnit']
+
+    def __init__(self, unit_file_states=None, active_states=None, running_units=None):
+        self.unit_file_states = unit_file_states or {}
+        self.active_states = active_states or {}
+        self.running_units = running_units or []
+        self.calls = []
+        self.jobs = []
+
+    def call(self, method, *args):
+        self.calls.append((method,) + args)
+        if method in self.JOB_METHODS:
+            self.jobs.append((method, args[0]))
+            return '/org/freedesktop/systemd1/job/{}'.format(len(self.jobs))
+        if method == 'LoadUnit':
+            return '/org/freedesktop/systemd1/unit/' + args[0]
+        if method == 'GetUnitFileState':
+            return self.unit_file_states.get(args[0], 'enabled')
+        if method == 'MaskUnitFiles':
+            self.unit_file_states.update({unit: 'masked' for unit in args[0]})
+        elif method == 'UnmaskUnitFiles':
+            self.unit_file_states.update({unit: 'enabled' for unit in args[0]})
+        elif method == 'ListUnitsFiltered':
+            return [(unit, '', 'loaded', 'active', 'running', '', '/org/freedesktop/systemd1/unit/' + unit, 0, '', '/')
+                    for unit in self.running_units]
+        return None
+
+    def get_property(self, object_path, interface, name):
+        return self.active_states.get(object_path.rsplit('/', 1)[-1], 'active')
+
+    def is_job_pending(self, job_path):
+        return False
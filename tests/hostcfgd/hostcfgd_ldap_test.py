@@ -114,3 +114,31 @@ class TestHostcfgdLDAP(TestCase):
                     op_path + "/" + name).decode('utf-8')
 
         self.assertTrue(len(diff_output) == 0, diff_output)
+
+    def test_hostcfgd_template_registry(self):
+        """
+            Test the templates rendered by hostcfgd are compiled once, and
+            recompiled when their file is modified
+        """
+        t_path = templates_path
+        op_path = output_path + "/template_registry"
+        shutil.rmtree(op_path, ignore_errors=True)
+        os.mkdir(op_path)
+        shutil.copyfile(t_path + "/nslcd.conf.j2", op_path + "/nslcd.conf.j2")
+        nslcd_kwargs = {'servers': [], 'ldap_cfg': hostcfgd.ldap.LdapCfg}
+        auth = {'login': 'local', 'failthrough': True, 'fallback': True}
+
+        registry = hostcfgd.TemplateRegistry()
+        with mock.patch.object(hostcfgd, 'template_registry', registry), \
+                mock.patch.object(registry.env, 'compile', wraps=registry.env.compile) as mocked_compile:
+            for _ in range(1000):
+                registry.get_template(t_path + "/common-auth-sonic.j2").render(auth=auth, src_ip=None, servers=[])
+                hostcfgd.generate_file_from_template(op_path + "/nslcd.conf.j2", op_path + "/nslcd.conf", 0o640, nslcd_kwargs)
+            self.assertEqual(mocked_compile.call_count, 2)
+            self.assertTrue(os.path.isfile(op_path + "/nslcd.conf"))
+
+            # A modified template is recompiled
+            mtime = os.path.getmtime(op_path + "/nslcd.conf.j2") + 10
+            os.utime(op_path + "/nslcd.conf.j2", (mtime, mtime))
+            hostcfgd.generate_file_from_template(op_path + "/nslcd.conf.j2", op_path + "/nslcd.conf", 0o640, nslcd_kwargs)
+            self.assertEqual(mocked_compile.call_count, 3)
@@ -0,0 +1,129 @@
+import importlib.machinery
+import importlib.util
+import filecmp
+import shutil
+import os
+import sys
+
+from parameterized import parameterized
+from unittest import TestCase, mock
+from tests.hostcfgd.test_ntp_vectors import HOSTCFGD_TEST_NTP_VECTOR
+from tests.common.mock_configdb import MockConfigDb, MockDBConnector
+from tests.common.mock_systemd import MockSystemdBus
+
+test_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+modules_path = os.path.dirname(test_path)
+scripts_path = os.path.join(modules_path, "scripts")
+templates_path = os.path.join(modules_path, "data/templates")
+output_path = os.path.join(test_path, "hostcfgd/output")
+sample_output_path = os.path.join(test_path, "hostcfgd/sample_output")
+sys.path.insert(0, modules_path)
+
+# Load the file under test
+hostcfgd_path = os.path.join(scripts_path, 'hostcfgd')
+loader = importlib.machinery.SourceFileLoader('hostcfgd', hostcfgd_path)
+spec = importlib.util.spec_from_loader(loader.name, loader)
+hostcfgd = importlib.util.module_from_spec(spec)
+loader.exec_module(hostcfgd)
+sys.modules['hostcfgd'] = hostcfgd
+
+# Mock swsscommon classes
+hostcfgd.ConfigDBConnector = MockConfigDb
+hostcfgd.DBConnector = MockDBConnector
+hostcfgd.Table = mock.Mock()
+
+
+class TestHostcfgdNTP(TestCase):
+    """
+        Test hostcfd daemon - NTP servers applied by chronyc
+    """
+    def set_paths(self, op_path, sourcedir=True):
+        """
+            Point the chrony paths to the test output directory, and install a
+            chrony.conf reading its sources from it if sourcedir is set
+        """
+        patcher = mock.patch.multiple(hostcfgd,
+                                      CHRONY_SOURCES_TEMPLATE=templates_path + "/chrony-sonic.sources.j2",
+                                      CHRONY_SOURCES=op_path + "/sonic.sources",
+                                      CHRONY_CONF=op_path + "/chrony.conf")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        shutil.rmtree(op_path, ignore_errors=True)
+        os.mkdir(op_path)
+        with open(hostcfgd.CHRONY_CONF, "w") as f:
+            f.write("keyfile /etc/chrony/chrony.keys\n")
+            if sourcedir:
+                f.write("sourcedir {}/\n".format(op_path))
+
+    @parameterized.expand(HOSTCFGD_TEST_NTP_VECTOR)
+    def test_hostcfgd_ntp(self, test_name, test_data):
+        """
+            Test rendering of the chrony sources and the chrony action of
+            each CONFIG_DB update
+            Args:
+                test_name(str): test name
+                test_data(dict): test data which contains initial Config Db tables, and updates
+            Returns:
+                None
+        """
+        op_path = output_path + "/" + test_name
+        sop_path = sample_output_path + "/" + test_name
+
+        self.set_paths(op_path)
+
+        config_db = test_data["config_db"]
+        MockConfigDb.set_config_db(config_db)
+        bus = MockSystemdBus()
+        scheduler = hostcfgd.ServiceActionScheduler(systemd=hostcfgd.SystemdClient(bus=bus))
+        with mock.patch.object(hostcfgd, 'service_scheduler', scheduler), \
+                mock.patch.object(hostcfgd, 'run_cmd') as mocked_run_cmd:
+            host_config_daemon = hostcfgd.HostConfigDaemon()
+            host_config_daemon.ntpcfg.load(config_db.get("NTP"), config_db.get("NTP_SERVER", {}),
+                                           config_db.get("NTP_KEY", {}))
+            # The sources of the running chrony are brought up to date
+            self.assertTrue(os.path.isfile(hostcfgd.CHRONY_SOURCES))
+            self.assertEqual([c[0][0] for c in mocked_run_cmd.call_args_list], [["chronyc", "reload", "sources"]])
+
+            handlers = {
+                "NTP": host_config_daemon.ntp_global_handler,
+                "NTP_SERVER": host_config_daemon.ntp_server_handler,
+                "NTP_KEY": host_config_daemon.ntp_key_handler,
+            }
+            for (table, key, data), chronyc_cmds, systemd_jobs in test_data["updates"]:
+                mocked_run_cmd.reset_mock()
+                bus.jobs = []
+                handlers[table](key, "SET" if data else "DEL", data or {})
+                self.assertEqual([c[0][0] for c in mocked_run_cmd.call_args_list], chronyc_cmds)
+                self.assertEqual(bus.jobs, systemd_jobs)
+
+        files_to_compare = ['sonic.sources']
+        match, mismatch, errors = filecmp.cmpfiles(sop_path, op_path, files_to_compare, shallow=False)
+        self.assertEqual(match, files_to_compare)
+
+    def test_hostcfgd_ntp_chronyc_failure(self):
+        self.set_paths(output_path + "/NTP_chronyc_failure")
+
+        bus = MockSystemdBus()
+        scheduler = hostcfgd.ServiceActionScheduler(systemd=hostcfgd.SystemdClient(bus=bus))
+        with mock.patch.object(hostcfgd, 'service_scheduler', scheduler), \
+                mock.patch.object(hostcfgd, 'run_cmd', side_effect=Exception('chronyd not running')):
+            ntpcfg = hostcfgd.NtpCfg()
+            ntpcfg.ntp_server_update('10.1.1.1', {'iburst': 'on'})
+        # chrony is restarted instead
+        self.assertEqual(bus.jobs, [('RestartUnit', 'chrony.service')])
+
+    def test_hostcfgd_ntp_without_sourcedir(self):
+        self.set_paths(output_path + "/NTP_without_sourcedir", sourcedir=False)
+
+        bus = MockSystemdBus()
+        scheduler = hostcfgd.ServiceActionScheduler(systemd=hostcfgd.SystemdClient(bus=bus))
+        with mock.patch.object(hostcfgd, 'service_scheduler', scheduler), \
+                mock.patch.object(hostcfgd, 'run_cmd') as mocked_run_cmd:
+            ntpcfg = hostcfgd.NtpCfg()
+            ntpcfg.load({}, {}, {})
+            ntpcfg.ntp_server_update('10.1.1.1', {'iburst': 'on'})
+            mocked_run_cmd.assert_not_called()
+        # chrony.conf holds the servers, so chrony is restarted to render it anew
+        self.assertEqual(bus.jobs, [('RestartUnit', 'chrony.service')])
+        self.assertFalse(os.path.exists(hostcfgd.CHRONY_SOURCES))
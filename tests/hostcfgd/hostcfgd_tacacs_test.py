@@ -236,3 +236,61 @@ class TestHostcfgdTACACS(TestCase):
             ]
             for expected_call in expected:
                 assert expected_call in mocked_syslog.mock_calls, f"Expected call {expected_call} not found"
+
+    @parameterized.expand(HOSTCFGD_TEST_TACACS_VECTOR)
+    def test_hostcfgd_tacacs_server_update_regenerates_tacacs_artifacts(self, test_name, test_data):
+        """
+            Test a TACPLUS_SERVER change only regenerates the artifacts depending on it
+
+            Args:
+                test_name(str): test name
+                test_data(dict): test data which contains initial Config Db tables, and expected results
+
+            Returns:
+                None
+        """
+        config_name = "config_db_tacacs"
+        op_path = output_path + "/" + test_name + "_artifact_dependencies"
+        sop_path = sample_output_path + "/" +  test_name + "_" + config_name
+        host_config_daemon = self.mock_hostcfgd(test_data, config_name, op_path, sop_path)
+        self.render_config_file(host_config_daemon)
+
+        for file_name in os.listdir(op_path):
+            os.remove(os.path.join(op_path, file_name))
+
+        with mock.patch.object(hostcfgd, 'generate_file_from_template') as mocked_generate, \
+                mock.patch.object(hostcfgd.subprocess, 'check_call') as mocked_check_call:
+            # An unchanged server does not regenerate anything
+            host_config_daemon.aaacfg.tacacs_server_update('192.168.1.1', dict(test_data[config_name]['TACPLUS_SERVER']['192.168.1.1']))
+            self.assertEqual(os.listdir(op_path), [])
+
+            host_config_daemon.aaacfg.tacacs_server_update('192.168.1.9', {'priority': '1', 'tcp_port': '49'})
+            self.assertEqual(sorted(os.listdir(op_path)), ['common-auth-sonic', 'tacplus_nss.conf'])
+            with open(op_path + "/tacplus_nss.conf") as f:
+                self.assertIn('192.168.1.9', f.read())
+            mocked_generate.assert_not_called()
+            mocked_check_call.assert_not_called()
+
+        # The edited PAM and NSS files are reported as changed
+        shutil.copyfile(sop_path + "/sshd.old", op_path + "/sshd")
+        shutil.copyfile(sop_path + "/login.old", op_path + "/login")
+        with open(op_path + "/nsswitch.conf", "w") as f:
+            f.write("passwd:         files systemd\ngroup:          files systemd\n")
+        for file_name in ["common-session", "common-session-noninteractive"]:
+            with open(op_path + "/" + file_name, "w") as f:
+                f.write("session required pam_unix.so\n" + hostcfgd.MKHOME_DIR_RULE + "\n")
+        aaacfg = host_config_daemon.aaacfg
+        with mock.patch.multiple(hostcfgd, PAM_SESSION_CONF=op_path + "/common-session",
+                                 PAM_SESSION_NONINT_CONF=op_path + "/common-session-noninteractive"), \
+                mock.patch.object(hostcfgd.subprocess, 'check_call'), \
+                mock.patch.object(hostcfgd, 'generate_file_from_template', return_value=False):
+            aaacfg.aaa_update('authentication', {'login': 'tacacs+,local'}, modify_conf=False)
+            # radius_nss.conf was removed above and is rendered anew
+            self.assertEqual(aaacfg.modify_conf_file(),
+                             {'common-auth-sonic', 'common-session', 'pam.d/sshd+login', 'nsswitch.conf',
+                              'radius_nss.conf'})
+            with open(op_path + "/nsswitch.conf") as f:
+                self.assertIn('passwd:         tacplus files systemd', f.read())
+
+            # Edits leaving the files as they are report no change
+            self.assertEqual(aaacfg.modify_conf_file(changed_inputs={'AAA|authentication'}), set())
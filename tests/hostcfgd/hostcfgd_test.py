@@ -1,8 +1,11 @@
 import os
+import re
 import sys
 import time
 import signal
 import psutil
+import pytest
+import threading
 import swsscommon as swsscommon_package
 from subprocess import CalledProcessError
 from sonic_py_common import device_info
@@ -13,6 +16,8 @@ from unittest import TestCase, mock
 
 from .test_vectors import HOSTCFG_DAEMON_INIT_CFG_DB, HOSTCFG_DAEMON_CFG_DB
 from tests.common.mock_configdb import MockConfigDb, MockDBConnector
+from tests.common.mock_systemd import MockSystemdBus
+from tests.common.mock_bootloader import MockBootloader
 from pyfakefs.fake_filesystem_unittest import patchfs
 from deepdiff import DeepDiff
 from unittest.mock import call
@@ -120,6 +125,176 @@ class TesNtpCfgd(TestCase):
             ])
 
 
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestServiceActionScheduler:
+    """
+        Test hostcfd daemon - coalescing of the unit restarts/reloads
+    """
+    def make_scheduler(self, window_secs=2):
+        self.clock = FakeClock()
+        self.bus = MockSystemdBus()
+        systemd = hostcfgd.SystemdClient(bus=self.bus)
+        return hostcfgd.ServiceActionScheduler(window_secs=window_secs, systemd=systemd, clock=self.clock)
+
+    @pytest.mark.parametrize('sourcedir', [True, False])
+    def test_ntp_server_burst(self, tmpdir, sourcedir):
+        scheduler = self.make_scheduler()
+        templates_path = os.path.join(modules_path, 'data/templates')
+        ntp_paths = {
+            'CHRONY_SOURCES_TEMPLATE': templates_path + '/chrony-sonic.sources.j2',
+            'CHRONY_SOURCES': str(tmpdir.join('sonic.sources')),
+            'CHRONY_CONF': str(tmpdir.join('chrony.conf')),
+        }
+        tmpdir.join('chrony.conf').write('sourcedir {}\n'.format(tmpdir) if sourcedir else 'server 10.0.0.0 iburst\n')
+        ntpcfgd = hostcfgd.NtpCfg()
+        ntp_servers = {}
+        with mock.patch.object(hostcfgd, 'service_scheduler', scheduler), \
+                mock.patch.multiple(hostcfgd, **ntp_paths), \
+                mock.patch.object(hostcfgd, 'run_cmd') as mocked_run_cmd:
+            # A config load of 100 NTP servers, one CONFIG_DB notification each
+            for i in range(100):
+                ntp_servers = dict(ntp_servers)
+                ntp_servers['10.0.0.{}'.format(i)] = {'iburst': 'on'}
+                ntpcfgd.ntp_srv_key_update(ntp_servers, {})
+                self.clock.now += 0.1
+                scheduler.run_due()
+            mocked_run_cmd.assert_not_called()
+            assert ntpcfgd.cache['servers'] == ntp_servers
+
+            assert self.bus.jobs == []
+
+            self.clock.now += 2
+            if not sourcedir:
+                # chrony.conf holds the servers, chrony is restarted once to render it anew
+                assert scheduler.run_due() == [('chrony', 'restart')]
+                assert self.bus.jobs == [('RestartUnit', 'chrony.service')]
+                mocked_run_cmd.assert_not_called()
+                return
+
+            assert scheduler.run_due() == [('chrony', 'reload')]
+            mocked_run_cmd.assert_called_once_with(['chronyc', 'reload', 'sources'], True, True)
+        # The sources are reloaded without restarting chrony
+        assert self.bus.jobs == []
+        assert tmpdir.join('sonic.sources').read().count('iburst') == 100
+
+    def test_reload_upgraded_to_restart(self):
+        scheduler = self.make_scheduler()
+        scheduler.request('rsyslog-config', 'reload')
+        scheduler.request('resolv-config', 'restart')
+        scheduler.request('rsyslog-config', 'restart')
+        scheduler.request('resolv-config', 'reload')
+        reload_handler = mock.Mock()
+        scheduler.request('chrony', 'reload', handler=reload_handler)
+        scheduler.request('chrony', 'restart')
+        assert scheduler.get_next_deadline() == 2
+
+        self.clock.now = 2
+        scheduler.run_due()
+        assert self.bus.jobs == [('RestartUnit', 'rsyslog-config.service'), ('RestartUnit', 'resolv-config.service'),
+                                 ('RestartUnit', 'chrony.service')]
+        reload_handler.assert_not_called()
+
+        scheduler.request('chrony', 'reload', handler=reload_handler)
+        self.clock.now = 4
+        scheduler.run_due()
+        reload_handler.assert_called_once_with()
+
+        with pytest.raises(ValueError):
+            scheduler.request('chrony', 'stop')
+
+    def test_run_sequence(self):
+        scheduler = self.make_scheduler()
+        scheduler.request('chrony')
+        scheduler.request('rsyslog-config')
+        ntp_worker = threading.Thread(target=scheduler.run_due, kwargs={'flush': True})
+
+        def call(method, *args):
+            if method == 'StopUnit':
+                # A chrony restart of the ntp worker, run while chrony is stopped
+                scheduler.request('chrony')
+                ntp_worker.start()
+                ntp_worker.join(0.1)
+                assert ntp_worker.is_alive()
+            return MockSystemdBus.call(self.bus, method, *args)
+
+        with mock.patch.object(self.bus, 'call', side_effect=call):
+            scheduler.run_sequence([('chrony', 'stop'), ('interfaces-config', 'restart'), ('chrony', 'start')])
+            ntp_worker.join()
+        # The pending chrony restart is superseded, the later one waits for the sequence
+        assert self.bus.jobs == [('StopUnit', 'chrony.service'), ('RestartUnit', 'interfaces-config.service'),
+                                 ('StartUnit', 'chrony.service'), ('RestartUnit', 'rsyslog-config.service'),
+                                 ('RestartUnit', 'chrony.service')]
+
+    def test_stop_flushes_pending(self):
+        scheduler = self.make_scheduler(window_secs=0)
+        scheduler.request('chrony')
+        assert self.bus.jobs == [('RestartUnit', 'chrony.service')]
+
+        scheduler.start(window_secs=3600)
+        scheduler.request('logrotate-config')
+        scheduler.stop()
+        assert self.bus.jobs == [('RestartUnit', 'chrony.service'), ('RestartUnit', 'logrotate-config.service')]
+        assert scheduler.window_secs == 0
+
+
+class TestSystemdClient:
+    """
+        Test hostcfd daemon - systemd D-Bus client
+    """
+    def test_unit_jobs(self):
+        bus = MockSystemdBus(active_states={'ssh.service': 'failed'})
+        client = hostcfgd.SystemdClient(bus=bus)
+        client.run_unit_action('chrony', 'stop')
+        client.run_unit_action('interfaces-config', 'restart')
+        client.run_unit_action('rsyslog.socket', 'reload')
+        assert bus.jobs == [('StopUnit', 'chrony.service'), ('RestartUnit', 'interfaces-config.service'),
+                            ('ReloadUnit', 'rsyslog.socket')]
+        assert ('RestartUnit', 'interfaces-config.service', 'replace') in bus.calls
+
+        with pytest.raises(hostcfgd.SystemdError):
+            client.run_unit_action('ssh', 'restart', raise_exception=True)
+
+        client.reset_failed(['rsyslog-config', 'rsyslog'])
+        assert bus.calls[-2:] == [('ResetFailedUnit', 'rsyslog-config.service'), ('ResetFailedUnit', 'rsyslog.service')]
+
+    def test_nslcd_service(self):
+        bus = MockSystemdBus(unit_file_states={'nslcd.service': 'masked'})
+        with mock.patch.object(hostcfgd, 'systemd_client', hostcfgd.SystemdClient(bus=bus)):
+            hostcfgd.handle_nslcd_service(True)
+            assert bus.unit_file_states['nslcd.service'] == 'enabled'
+            assert bus.jobs == [('StartUnit', 'nslcd.service')]
+
+            hostcfgd.handle_nslcd_service(True)
+            hostcfgd.handle_nslcd_service(False)
+            assert bus.jobs[1:] == [('RestartUnit', 'nslcd.service'), ('StopUnit', 'nslcd.service')]
+            assert bus.unit_file_states['nslcd.service'] == 'masked'
+            assert bus.calls[-1] == ('Reload',)
+
+    def test_running_services(self):
+        bus = MockSystemdBus(running_units=['ssh.service', 'restapi.service', 'dbus.socket'])
+        client = hostcfgd.SystemdClient(bus=bus)
+        assert client.get_running_services() == ['ssh.service', 'restapi.service']
+
+    def test_systemctl_fallback(self):
+        client = hostcfgd.SystemdClient()
+        with mock.patch.object(hostcfgd, 'dbus', None), \
+                mock.patch.object(hostcfgd, 'run_cmd') as mocked_run_cmd:
+            client.run_unit_action('chrony', 'restart', True, True)
+            client.reset_failed(['rsyslog-config', 'rsyslog'])
+        assert client.bus is None
+        mocked_run_cmd.assert_has_calls([
+            call(['systemctl', 'restart', 'chrony'], True, True),
+            call(['systemctl', 'reset-failed', 'rsyslog-config', 'rsyslog'], True, False)
+        ])
+
+
 class TestSerialConsoleCfgd(TestCase):
     """
         Test hostcfd daemon - SerialConsoleCfg
@@ -382,7 +557,7 @@ class TestHostcfgdDaemon(TestCase):
                     pass
 
                 expected = [
-                    call(['sudo', 'systemctl', 'restart', 'interfaces-config']),
+                    call(['systemctl', 'restart', 'interfaces-config']),
                     call(['systemctl', 'stop', 'chrony']),
                     call(['systemctl', 'restart', 'interfaces-config']),
                     call(['systemctl', 'start', 'chrony']),
@@ -441,6 +616,249 @@ class TestHostcfgdDaemon(TestCase):
                 pass
             mocked_run_cmd.assert_has_calls([call(['systemctl', 'restart', 'resolv-config'], True, False)])
 
+class TestConfigDomainWorkers:
+    """
+        Test hostcfd daemon - config domain workers
+    """
+    def make_daemon(self):
+        MockConfigDb.set_config_db(HOSTCFG_DAEMON_CFG_DB)
+        daemon = hostcfgd.HostConfigDaemon()
+        daemon.register_callbacks()
+        return daemon
+
+    def test_slow_kdump_does_not_delay_tacplus(self):
+        daemon = self.make_daemon()
+        kdump_started = threading.Event()
+        kdump_release = threading.Event()
+        tacacs_updated = threading.Event()
+        kdump_config_db = []
+
+        def slow_kdump_update(key, data):
+            kdump_config_db.append(daemon.config_db.get_connector())
+            kdump_started.set()
+            kdump_release.wait(10)
+
+        daemon.kdumpCfg.kdump_update = slow_kdump_update
+        daemon.aaacfg.tacacs_global_update = lambda key, data: tacacs_updated.set()
+        daemon.start_workers()
+        try:
+            callbacks = daemon.config_db.handlers
+            callbacks['KDUMP']('KDUMP', 'config', {'enabled': 'true'})
+            assert kdump_started.wait(5)
+            callbacks['TACPLUS']('TACPLUS', 'global', {'timeout': '10'})
+            assert tacacs_updated.wait(5)
+            assert not kdump_release.is_set()
+        finally:
+            kdump_release.set()
+            daemon.stop_workers()
+
+        # Each worker uses its own CONFIG_DB connection
+        assert kdump_config_db[0] is not daemon.config_db.get_connector()
+
+    def test_domain_order(self):
+        daemon = self.make_daemon()
+        updates = []
+
+        def tacacs_server_update(key, data):
+            if not updates:
+                time.sleep(0.1)
+            updates.append(('TACPLUS_SERVER', key, data))
+
+        daemon.aaacfg.tacacs_server_update = tacacs_server_update
+        daemon.aaacfg.tacacs_global_update = lambda key, data: updates.append(('TACPLUS', key, data))
+        daemon.start_workers()
+        callbacks = daemon.config_db.handlers
+        expected = []
+        for i in range(20):
+            server = '10.0.0.{}'.format(i)
+            callbacks['TACPLUS_SERVER']('TACPLUS_SERVER', server, {'priority': str(i)})
+            expected.append(('TACPLUS_SERVER', server, {'priority': str(i)}))
+        callbacks['TACPLUS']('TACPLUS', 'global', None)
+        expected.append(('TACPLUS', 'global', {}))
+        daemon.stop_workers()
+        assert updates == expected
+
+    def test_handler_exception(self):
+        worker = hostcfgd.ConfigDomainWorker('test')
+        handled = []
+
+        def failing_handler(key):
+            raise ValueError(key)
+
+        worker.start()
+        with mock.patch.object(hostcfgd.syslog, 'syslog') as mocked_syslog:
+            worker.put(failing_handler, 'first')
+            worker.put(handled.append, 'second')
+            worker.stop()
+        assert handled == ['second']
+        assert any("failing_handler ('first',) failed" in c[0][1] for c in mocked_syslog.call_args_list)
+
+
+class CountingConfigDb(MockConfigDb):
+    """
+        Mock Config DB which counts the table reads
+    """
+    reads = 0
+
+    def get_table(self, table_name):
+        CountingConfigDb.reads += 1
+        return super(CountingConfigDb, self).get_table(table_name)
+
+    def get_keys(self, pattern):
+        CountingConfigDb.reads += 1
+        return super(CountingConfigDb, self).get_keys(pattern)
+
+    def get_entry(self, key, field):
+        CountingConfigDb.reads += 1
+        return super(CountingConfigDb, self).get_entry(key, field)
+
+
+class TestConfigDbMirror:
+    """
+        Test hostcfd daemon - CONFIG_DB mirror
+    """
+    def test_mirror(self):
+        config_db = CountingConfigDb()
+        MockConfigDb.set_config_db({'FIPS': {'global': {'enable': 'true'}}})
+        mirror = hostcfgd.ConfigDbMirror(config_db)
+        mirror.subscribe('LOOPBACK_INTERFACE')
+        mirror.load({'LOOPBACK_INTERFACE': {('Loopback0', '10.1.0.1/32'): {}}})
+        CountingConfigDb.reads = 0
+
+        mirror.update('LOOPBACK_INTERFACE', 'Loopback1|10.1.0.2/32', {'scope': 'global'})
+        mirror.update('LOOPBACK_INTERFACE', 'Loopback0|10.1.0.1/32', None)
+        assert mirror.get_keys('LOOPBACK_INTERFACE') == [('Loopback1', '10.1.0.2/32')]
+        assert mirror.get_entry('LOOPBACK_INTERFACE', 'Loopback1|10.1.0.2/32') == {'scope': 'global'}
+        assert mirror.get_entry('LOOPBACK_INTERFACE', 'Loopback0|10.1.0.1/32') == {}
+
+        # The handlers get copies
+        mirror.get_table('LOOPBACK_INTERFACE')[('Loopback1', '10.1.0.2/32')]['scope'] = 'host'
+        assert mirror.get_table('LOOPBACK_INTERFACE') == {('Loopback1', '10.1.0.2/32'): {'scope': 'global'}}
+        assert CountingConfigDb.reads == 0
+
+        # A table not subscribed is read from CONFIG_DB
+        mirror.update('FIPS', 'global', {'enable': 'false'})
+        assert mirror.get_table('FIPS') == {'global': {'enable': 'true'}}
+        assert CountingConfigDb.reads == 1
+
+    def test_replay_without_table_reads(self, tmpdir):
+        init_data = dict(HOSTCFG_DAEMON_INIT_CFG_DB,
+                         AAA={'authentication': {'login': 'radius,local'}},
+                         RADIUS={'global': {'src_intf': 'Loopback0'}},
+                         SSH_SERVER={'POLICIES': {'max_sessions': '0'}},
+                         NTP={'global': {'authentication': 'enabled'}},
+                         NTP_KEY={},
+                         LOOPBACK_INTERFACE={('Loopback0', '10.1.0.1/32'): {}},
+                         FIPS={})
+        MockConfigDb.set_config_db(HOSTCFG_DAEMON_CFG_DB)
+        templates_path = os.path.join(modules_path, 'data/templates')
+        tmpdir.join('chrony.conf').write('sourcedir {}\n'.format(tmpdir))
+        tmpdir.join('cmdline').write('swiotlb=65536 sonic_fips=0')
+        for pamd in ['sshd', 'login']:
+            tmpdir.join(pamd).write('@include common-auth\n')
+        clock = FakeClock()
+        bus = MockSystemdBus(running_units=['ssh.service'])
+        systemd = hostcfgd.SystemdClient(bus=bus)
+        scheduler = hostcfgd.ServiceActionScheduler(window_secs=2, systemd=systemd, clock=clock)
+        paths = {
+            'PAM_LIMITS_CONF_TEMPLATE': templates_path + '/pam_limits.j2',
+            'LIMITS_CONF_TEMPLATE': templates_path + '/limits.conf.j2',
+            'PAM_LIMITS_CONF': str(tmpdir.join('pam-limits-conf')),
+            'LIMITS_CONF': str(tmpdir.join('limits.conf')),
+            'PAM_AUTH_CONF_TEMPLATE': templates_path + '/common-auth-sonic.j2',
+            'NSS_TACPLUS_CONF_TEMPLATE': templates_path + '/tacplus_nss.conf.j2',
+            'NSS_RADIUS_CONF_TEMPLATE': templates_path + '/radius_nss.conf.j2',
+            'PAM_RADIUS_AUTH_CONF_TEMPLATE': templates_path + '/pam_radius_auth.conf.j2',
+            'NSLCD_CONF_TEMPLATE': templates_path + '/nslcd.conf.j2',
+            'LDAP_CONF_TEMPLATE': templates_path + '/ldap.conf.j2',
+            'PAM_AUTH_CONF': str(tmpdir.join('common-auth-sonic')),
+            'NSS_TACPLUS_CONF': str(tmpdir.join('tacplus_nss.conf')),
+            'NSS_RADIUS_CONF': str(tmpdir.join('radius_nss.conf')),
+            'NSS_CONF': str(tmpdir.join('nsswitch.conf')),
+            'NSLCD_CONF': str(tmpdir.join('nslcd.conf')),
+            'LDAP_CONF': str(tmpdir.join('ldap.conf')),
+            'PAM_SESSION_CONF': str(tmpdir.join('common-session')),
+            'PAM_SESSION_NONINT_CONF': str(tmpdir.join('common-session-noninteractive')),
+            'ETC_PAMD_SSHD': str(tmpdir.join('sshd')),
+            'ETC_PAMD_LOGIN': str(tmpdir.join('login')),
+            'RADIUS_PAM_AUTH_CONF_DIR': str(tmpdir) + '/',
+            'CHRONY_SOURCES_TEMPLATE': templates_path + '/chrony-sonic.sources.j2',
+            'CHRONY_SOURCES': str(tmpdir.join('sonic.sources')),
+            'CHRONY_CONF': str(tmpdir.join('chrony.conf')),
+            'FIPS_CONFIG_FILE': str(tmpdir.join('fips.json')),
+            'OPENSSL_FIPS_CONFIG_FILE': str(tmpdir.join('fips_enable')),
+        }
+        with mock.patch.object(hostcfgd, 'ConfigDBConnector', CountingConfigDb), \
+                mock.patch.object(hostcfgd.swsscommon, 'CFG_DEVICE_METADATA_TABLE_NAME', 'DEVICE_METADATA'), \
+                mock.patch.object(hostcfgd.swsscommon, 'CFG_SYSLOG_CONFIG_TABLE_NAME', 'SYSLOG_CONFIG'), \
+                mock.patch.object(hostcfgd.swsscommon, 'CFG_SYSLOG_SERVER_TABLE_NAME', 'SYSLOG_SERVER'), \
+                mock.patch.object(hostcfgd.swsscommon, 'CFG_NTP_GLOBAL_TABLE_NAME', 'NTP'), \
+                mock.patch.object(hostcfgd.swsscommon, 'CFG_NTP_SERVER_TABLE_NAME', 'NTP_SERVER'), \
+                mock.patch.object(hostcfgd.swsscommon, 'CFG_NTP_KEY_TABLE_NAME', 'NTP_KEY'), \
+                mock.patch.multiple(hostcfgd, service_scheduler=scheduler, systemd_client=systemd, **paths), \
+                mock.patch.object(hostcfgd, 'PROC_CMDLINE', str(tmpdir.join('cmdline')), create=True), \
+                mock.patch.object(hostcfgd.bootloader, 'get_bootloader', return_value=MockBootloader()), \
+                mock.patch.object(hostcfgd, 'get_pid', return_value=''), \
+                mock.patch.object(hostcfgd.subprocess, 'check_call'), \
+                mock.patch.object(hostcfgd, 'run_cmd') as mocked_run_cmd:
+            daemon = hostcfgd.HostConfigDaemon()
+            daemon.register_callbacks()
+            for name in ['iptables', 'kdumpCfg', 'passwcfg', 'sshscfg', 'memorystatisticscfg', 'devmetacfg',
+                         'mgmtifacecfg', 'dnscfg', 'serialconscfg', 'bannermsgcfg', 'loggingcfg']:
+                setattr(daemon, name, mock.MagicMock())
+            daemon.devmetacfg.hostname = 'sonic'
+            daemon.wait_till_system_init_done = mock.MagicMock()
+            daemon.load(init_data)
+            CountingConfigDb.reads = 0
+
+            # 1,300 events against the real syslog, FIPS, PAM limits, NTP and
+            # AAA handlers
+            callbacks = daemon.config_db.handlers
+            for i in range(100):
+                server = '10.0.{}.1'.format(i % 4)
+                callbacks['SYSLOG_SERVER']('SYSLOG_SERVER', server, {'port': str(514 + i)})
+                callbacks['SYSLOG_CONFIG']('SYSLOG_CONFIG', 'GLOBAL', {'severity': 'info'} if i % 2 else None)
+                callbacks['FIPS']('FIPS', 'global', {'enable': 'true' if i % 2 else 'false'})
+                callbacks['SSH_SERVER']('SSH_SERVER', 'POLICIES', {'max_sessions': str(i)})
+                callbacks['NTP_KEY']('NTP_KEY', str(i % 3 + 1), {'type': 'md5', 'value': 'key{}'.format(i)})
+                callbacks['NTP_SERVER']('NTP_SERVER', '10.3.0.{}'.format(i % 5),
+                                        {'iburst': 'on', 'key': str(i % 3 + 1)} if i % 7 else None)
+                callbacks['AAA']('AAA', 'authorization', {'login': 'tacacs+,local' if i % 2 else 'local'})
+                callbacks['TACPLUS']('TACPLUS', 'global', {'timeout': str(5 + i % 3)})
+                callbacks['TACPLUS_SERVER']('TACPLUS_SERVER', '10.4.0.{}'.format(i % 3),
+                                            {'priority': str(i % 3 + 1), 'tcp_port': '49'})
+                callbacks['RADIUS_SERVER']('RADIUS_SERVER', '10.5.0.1',
+                                           {'priority': '1', 'passkey': 'radius{}'.format(i)})
+                callbacks['RADIUS']('RADIUS', 'global', {'src_intf': 'Loopback0', 'timeout': str(5 + i % 2)})
+                # Move the Loopback0 address
+                callbacks['LOOPBACK_INTERFACE']('LOOPBACK_INTERFACE', 'Loopback0|10.2.{}.1/32'.format(i), {})
+                previous = '10.2.{}.1/32'.format(i - 1) if i else '10.1.0.1/32'
+                callbacks['LOOPBACK_INTERFACE']('LOOPBACK_INTERFACE', 'Loopback0|' + previous, None)
+            assert CountingConfigDb.reads == 0
+
+            clock.now += 2
+            assert sorted(scheduler.run_due()) == [('chrony', 'restart'), ('rsyslog-config', 'restart')]
+        mocked_run_cmd.assert_not_called()
+        assert bus.jobs[-2:] == [('RestartUnit', 'chrony.service'), ('RestartUnit', 'rsyslog-config.service')]
+
+        assert daemon.rsyslogcfg.cache == {
+            'config': {'GLOBAL': {'severity': 'info'}},
+            'servers': {'10.0.{}.1'.format(i): {'port': str(610 + i)} for i in range(4)}
+        }
+        assert tmpdir.join('fips_enable').read() == '1'
+        assert 'maxsyslogins 99' in tmpdir.join('limits.conf').read()
+        assert sorted(daemon.ntpcfg.cache['keys']) == ['1', '2', '3']
+        sources = tmpdir.join('sonic.sources').read()
+        assert 'server 10.3.0.4 key 1 iburst' in sources
+        assert '10.3.0.3' not in sources
+        tacplus_nss_conf = tmpdir.join('tacplus_nss.conf').read()
+        assert '\ntacacs_authorization\n' in tacplus_nss_conf
+        assert [line for line in tacplus_nss_conf.splitlines() if line.startswith('server=')] == [
+            'server=10.4.0.{}:49,secret=,timeout=5'.format(i) for i in [2, 1, 0]]
+        # The RADIUS source address follows the moved Loopback0 address
+        assert tmpdir.join('10.5.0.1_1812.conf').read().split()[-4:] == ['[10.5.0.1]:1812', 'radius99', '6', '10.2.99.1']
+
+
 class TestDnsHandler:
 
     @mock.patch('hostcfgd.run_cmd')
@@ -977,3 +1395,214 @@ class TestDeviceMetaCfgLoad(TestCase):
         mock_syslog.assert_has_calls(expected_syslog_calls, any_order=False)
         mock_realpath.assert_not_called()
         mock_run_cmd.assert_not_called()
+
+
+def get_aaa_paths(tmpdir):
+    """
+        Returns the AaaCfg templates from the source tree, and its output files in tmpdir
+    """
+    templates_path = os.path.join(modules_path, 'data/templates')
+    return {
+        'PAM_AUTH_CONF_TEMPLATE': templates_path + '/common-auth-sonic.j2',
+        'NSS_TACPLUS_CONF_TEMPLATE': templates_path + '/tacplus_nss.conf.j2',
+        'NSS_RADIUS_CONF_TEMPLATE': templates_path + '/radius_nss.conf.j2',
+        'NSLCD_CONF_TEMPLATE': templates_path + '/nslcd.conf.j2',
+        'LDAP_CONF_TEMPLATE': templates_path + '/ldap.conf.j2',
+        'PAM_AUTH_CONF': str(tmpdir.join('common-auth-sonic')),
+        'NSS_TACPLUS_CONF': str(tmpdir.join('tacplus_nss.conf')),
+        'NSS_RADIUS_CONF': str(tmpdir.join('radius_nss.conf')),
+        'NSLCD_CONF': str(tmpdir.join('nslcd.conf')),
+        'LDAP_CONF': str(tmpdir.join('ldap.conf')),
+        'PAM_SESSION_CONF': str(tmpdir.join('common-session')),
+        'PAM_SESSION_NONINT_CONF': str(tmpdir.join('common-session-noninteractive')),
+        'NSS_CONF': str(tmpdir.join('nsswitch.conf')),
+        'ETC_PAMD_SSHD': str(tmpdir.join('sshd')),
+        'ETC_PAMD_LOGIN': str(tmpdir.join('login')),
+    }
+
+
+class TestWriteFileIfChanged:
+    def test_write_new_file(self, tmpdir):
+        filename = str(tmpdir.join('new.conf'))
+        assert hostcfgd.write_file_if_changed(filename, 'line 1\n')
+        assert open(filename).read() == 'line 1\n'
+        assert os.stat(filename).st_mode & 0o7777 == hostcfgd.DEFAULT_FILE_PERMISSION
+        assert tmpdir.listdir() == [tmpdir.join('new.conf')]
+
+    def test_unchanged_file_not_written(self, tmpdir):
+        conf_file = tmpdir.join('same.conf')
+        conf_file.write('line 1\n')
+        inode = conf_file.stat().ino
+
+        assert not hostcfgd.write_file_if_changed(str(conf_file), 'line 1\n')
+        assert not hostcfgd.write_file_if_changed(str(conf_file), b'line 1\n')
+        assert conf_file.stat().ino == inode
+
+    def test_changed_file_preserves_mode(self, tmpdir):
+        conf_file = tmpdir.join('secret.conf')
+        conf_file.write('old\n')
+        conf_file.chmod(0o600)
+
+        assert hostcfgd.write_file_if_changed(str(conf_file), 'new\n')
+        assert conf_file.read() == 'new\n'
+        assert conf_file.stat().mode & 0o7777 == 0o600
+
+        # An explicit permission is applied, even without a content change
+        assert hostcfgd.write_file_if_changed(str(conf_file), 'newer\n', 0o640)
+        assert conf_file.stat().mode & 0o7777 == 0o640
+        assert not hostcfgd.write_file_if_changed(str(conf_file), 'newer\n', 0o644)
+        assert conf_file.stat().mode & 0o7777 == 0o644
+
+    def test_failed_write_keeps_file(self, tmpdir):
+        conf_file = tmpdir.join('keep.conf')
+        conf_file.write('old\n')
+
+        with mock.patch.object(hostcfgd.os, 'rename', side_effect=OSError('rename failed')):
+            try:
+                hostcfgd.write_file_if_changed(str(conf_file), 'new\n')
+                assert False, 'write_file_if_changed did not raise'
+            except OSError:
+                pass
+        assert conf_file.read() == 'old\n'
+        assert tmpdir.listdir() == [conf_file]
+
+    def test_generate_file_from_template(self, tmpdir):
+        template_file = tmpdir.join('test.conf.j2')
+        template_file.write('server {{ server }}\n')
+        conf_file = str(tmpdir.join('test.conf'))
+
+        assert hostcfgd.generate_file_from_template(str(template_file), conf_file, 0o644, {'server': '10.0.0.1'})
+        assert not hostcfgd.generate_file_from_template(str(template_file), conf_file, 0o644, {'server': '10.0.0.1'})
+        assert hostcfgd.generate_file_from_template(str(template_file), conf_file, 0o644, {'server': '10.0.0.2'})
+        assert open(conf_file).read() == 'server 10.0.0.2'
+
+    def test_aaa_unchanged_artifacts_skip_reload(self, tmpdir):
+        paths = get_aaa_paths(tmpdir)
+        tmpdir.join('sshd').write('@include common-auth\n')
+        tmpdir.join('login').write('@include common-auth\n')
+        with mock.patch.multiple(hostcfgd, **paths), \
+                mock.patch.object(hostcfgd, 'handle_nslcd_service') as mocked_nslcd, \
+                mock.patch.object(hostcfgd.subprocess, 'check_call'), \
+                mock.patch.object(hostcfgd.AaaCfg, 'notify_audisp_tacplus_reload_config') as mocked_notify:
+            aaacfg = hostcfgd.AaaCfg(MockConfigDb())
+            aaacfg.ldap_global_update('global', {'bind_dn': 'cn=admin', 'base_dn': 'dc=sonic', 'bind_password': 'pw'},
+                                      modify_conf=False)
+            aaacfg.ldap_server_update('10.0.0.1', {'priority': '1'}, modify_conf=False)
+            aaacfg.aaa_update('authentication', {'login': 'ldap'})
+            assert mocked_notify.call_count == 1
+            assert mocked_nslcd.call_args_list[-1][0][0]
+
+            # Rendering the same content neither notifies nor restarts
+            mocked_notify.reset_mock()
+            mocked_nslcd.reset_mock()
+            assert aaacfg.modify_conf_file(changed_inputs={'AAA|authentication', 'LDAP'}) == set()
+            aaacfg.ldap_server_update('10.0.0.1', {'priority': '1'})
+            mocked_notify.assert_not_called()
+            mocked_nslcd.assert_not_called()
+
+            aaacfg.ldap_server_update('10.0.0.2', {'priority': '2'})
+            mocked_nslcd.assert_called_once()
+            mocked_notify.assert_not_called()
+
+
+NSS_CONF_LOCAL = """passwd:         files systemd
+group:          files systemd
+shadow:         files
+hosts:          files dns
+"""
+
+PAM_SESSION_CONF_LOCAL = """session [default=1]                     pam_permit.so
+session requisite                       pam_deny.so
+session required                        pam_unix.so
+# end of pam-auth-update config
+"""
+
+
+class TestLineEditor:
+    def test_edits(self, tmpdir):
+        conf_file = tmpdir.join('sshd_config')
+        conf_file.write('#Port 22\nListenAddress 0.0.0.0\n#MaxAuthTries 6\nMaxAuthTries 3\n')
+
+        with hostcfgd.LineEditor(str(conf_file)) as editor:
+            editor.set_key_value('MaxAuthTries', '5', commented=True)
+            editor.set_key_value('LoginGraceTime', '60', commented=True)
+            editor.set_key_value('MaxSessions', '10', append=False)
+            editor.remove_lines('^(#)?Port [0-9]+$')
+            editor.insert_lines(1, ['Port 22'])
+            editor.insert_lines(1, ['Port 23'])
+            editor.substitute('0.0.0.0', '::', address='^ListenAddress')
+            editor.ensure_line('UsePAM yes', before='^LoginGraceTime')
+            editor.ensure_line('UsePAM yes')
+        assert editor.changed
+        assert conf_file.read() == ('Port 23\nPort 22\nListenAddress ::\nMaxAuthTries 5\nMaxAuthTries 5\n'
+                                    'UsePAM yes\nLoginGraceTime 60\n')
+
+        # Edits leaving the content as it was do not rewrite the file
+        with hostcfgd.LineEditor(str(conf_file)) as editor:
+            editor.substitute('Port 23', 'Port 24')
+            editor.substitute('Port 24', 'Port 23')
+        assert not editor.changed
+
+    def test_no_newline_at_eof(self, tmpdir):
+        conf_file = tmpdir.join('login.defs')
+        conf_file.write('PASS_MAX_DAYS 99999\nPASS_WARN_AGE 7')
+
+        with hostcfgd.LineEditor(str(conf_file)) as editor:
+            editor.set_key_value('PASS_WARN_AGE', 14, append=False)
+        assert conf_file.read() == 'PASS_MAX_DAYS 99999\nPASS_WARN_AGE 14'
+
+    def test_failed_edit_keeps_file(self, tmpdir):
+        conf_file = tmpdir.join('keep.conf')
+        conf_file.write('key value\n')
+
+        def edit(editor):
+            editor.set_key_value('key', 'other')
+            raise re.error('bad pattern')
+
+        try:
+            hostcfgd.modify_single_file_inplace(str(conf_file), edit)
+            assert False, 'modify_single_file_inplace did not raise'
+        except re.error:
+            pass
+        assert conf_file.read() == 'key value\n'
+        assert not hostcfgd.modify_single_file_inplace(str(tmpdir.join('missing.conf')), edit)
+
+    @pytest.mark.parametrize('login_name, authentication, expected_nss_conf', [
+        ['tacacs', {'login': 'tacacs+'}, 'passwd:         tacplus files systemd\ngroup:          files systemd\n'],
+        ['radius', {'login': 'radius'}, 'passwd:         files radius systemd\ngroup:          files systemd\n'],
+        ['ldap', {'login': 'ldap'}, 'passwd:         files ldap systemd\ngroup:          files ldap systemd\n'
+                                    'shadow:         files ldap\n'],
+        ['local', {'login': 'local'}, 'passwd:         files systemd\ngroup:          files systemd\n'],
+    ])
+    def test_aaa_nss_pam_edits(self, tmpdir, login_name, authentication, expected_nss_conf):
+        tmpdir.join('nsswitch.conf').write(NSS_CONF_LOCAL)
+        tmpdir.join('common-session').write(PAM_SESSION_CONF_LOCAL)
+        tmpdir.join('common-session-noninteractive').write(PAM_SESSION_CONF_LOCAL)
+        tmpdir.join('sshd').write('@include common-auth\n@include common-account\n')
+        tmpdir.join('login').write('@include common-auth\n')
+
+        with mock.patch.multiple(hostcfgd, **get_aaa_paths(tmpdir)), \
+                mock.patch.object(hostcfgd, 'handle_nslcd_service'), \
+                mock.patch.object(hostcfgd.subprocess, 'check_call'), \
+                mock.patch.object(hostcfgd.subprocess, 'call') as mocked_call, \
+                mock.patch.object(hostcfgd.subprocess, 'run') as mocked_run, \
+                mock.patch.object(hostcfgd.AaaCfg, 'notify_audisp_tacplus_reload_config'):
+            aaacfg = hostcfgd.AaaCfg(MockConfigDb())
+            aaacfg.tacacs_server_update('10.0.0.1', {'priority': '1', 'tcp_port': '49'}, modify_conf=False)
+            aaacfg.aaa_update('authentication', authentication)
+            # The same edits leave the files unchanged
+            assert aaacfg.modify_conf_file(changed_inputs={'AAA|authentication'}) == set()
+            mocked_call.assert_not_called()
+            mocked_run.assert_not_called()
+
+        nss_conf = tmpdir.join('nsswitch.conf').read()
+        assert nss_conf.startswith(expected_nss_conf), nss_conf
+        assert nss_conf.endswith('hosts:          files dns\n')
+        assert tmpdir.join('sshd').read() == '@include common-auth-sonic\n@include common-account\n'
+        assert tmpdir.join('login').read() == '@include common-auth-sonic\n'
+        for pam_session in ['common-session', 'common-session-noninteractive']:
+            pam_session_conf = tmpdir.join(pam_session).read()
+            if login_name == 'ldap':
+                assert pam_session_conf.endswith(hostcfgd.MKHOME_DIR_RULE + '\n# end of pam-auth-update config\n')
+            else:
+                assert pam_session_conf == PAM_SESSION_CONF_LOCAL
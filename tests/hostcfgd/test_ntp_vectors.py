@@ -0,0 +1,110 @@
+"""
+    hostcfgd test ntp vector
+
+    Each update is a CONFIG_DB notification [table, key, data] with the
+    chronyc commands and the systemd jobs expected to apply it, with a
+    chrony.conf reading the sourcedir
+"""
+HOSTCFGD_TEST_NTP_VECTOR = [
+    [
+        "NTP_authentication",
+        {
+            "config_db": {
+                "NTP": {
+                    "global": {
+                        "authentication": "enabled",
+                        "vrf": "default",
+                        "src_intf": "eth0"
+                    }
+                },
+                "NTP_SERVER": {
+                    "10.1.1.1": {
+                        "association_type": "server",
+                        "iburst": "on",
+                        "key": "42",
+                        "version": "4"
+                    },
+                    "10.2.2.2": {
+                        "admin_state": "disabled",
+                        "iburst": "on"
+                    },
+                    "pool.ntp.org": {
+                        "association_type": "pool",
+                        "iburst": "on"
+                    }
+                },
+                "NTP_KEY": {
+                    "1": {
+                        "type": "md5",
+                        "value": "blahblah"
+                    },
+                    "42": {
+                        "type": "sha1",
+                        "value": "theanswer",
+                        "trusted": "yes"
+                    }
+                }
+            },
+            "updates": [
+                [
+                    ["NTP_SERVER", "ntp1.example.com", {"resolve_as": "10.3.3.3", "iburst": "off", "trusted": "yes"}],
+                    [["chronyc", "reload", "sources"]],
+                    []
+                ],
+                [
+                    ["NTP_KEY", "7", {"type": "sha256", "value": "seven"}],
+                    [],
+                    [("RestartUnit", "chrony.service")]
+                ],
+                [
+                    ["NTP_SERVER", "10.2.2.2", {"admin_state": "disabled", "iburst": "off"}],
+                    [],
+                    []
+                ],
+                [
+                    ["NTP_SERVER", "pool.ntp.org", None],
+                    [["chronyc", "reload", "sources"]],
+                    []
+                ],
+                [
+                    ["NTP", "global", {"authentication": "disabled", "vrf": "default", "src_intf": "eth0"}],
+                    [],
+                    [("RestartUnit", "chrony.service")]
+                ]
+            ]
+        }
+    ],
+    [
+        "NTP_servers",
+        {
+            "config_db": {
+                "NTP": {
+                    "global": {
+                        "vrf": "mgmt",
+                        "src_intf": "eth0"
+                    }
+                },
+                "NTP_SERVER": {
+                    "0.debian.pool.ntp.org": {}
+                }
+            },
+            "updates": [
+                [
+                    ["NTP_SERVER", "0.debian.pool.ntp.org", {"iburst": "on"}],
+                    [["chronyc", "reload", "sources"]],
+                    []
+                ],
+                [
+                    ["NTP_KEY", "10", {"type": "md5", "value": "ten"}],
+                    [],
+                    [("RestartUnit", "chrony.service")]
+                ],
+                [
+                    ["NTP_SERVER", "1.debian.pool.ntp.org", {"iburst": "on", "key": "10"}],
+                    [["chronyc", "reload", "sources"]],
+                    []
+                ]
+            ]
+        }
+    ]
+]